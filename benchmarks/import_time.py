@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Import-Zeit-Benchmark für Paket und CLI
+
+Misst die Startzeit in frischen Interpretern und listet die teuersten Module
+(über ``python -X importtime``).
+
+    python benchmarks/import_time.py [--runs 5] [--top 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = {
+    "import swiss_cv_generator": "import swiss_cv_generator",
+    "swiss-cv-gen info": "from swiss_cv_generator.cli import cli; cli(['info'], standalone_mode=False)",
+    "swiss-cv-gen single": "from swiss_cv_generator import SwissCVGenerator; SwissCVGenerator(1).generate_cv()",
+}
+
+
+def measure(code: str, runs: int) -> float:
+    """Median der Laufzeit von ``python -c code`` in Sekunden"""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def slowest_imports(code: str, top: int):
+    """Module mit der höchsten kumulierten Import-Zeit"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            check=True, capture_output=True, text=True)
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        entries.append((int(cumulative), module.strip()))
+    return sorted(entries, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = measure("pass", args.runs)
+    print(f"Interpreter-Start: {baseline * 1000:.0f} ms")
+
+    for label, code in TARGETS.items():
+        duration = measure(code, args.runs)
+        print(f"\n{label}: {duration * 1000:.0f} ms (+{(duration - baseline) * 1000:.0f} ms)")
+        for cumulative, module in slowest_imports(code, args.top):
+            print(f"   {cumulative / 1000:7.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
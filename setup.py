@@ -31,6 +31,12 @@ setup(
         "click>=8.0.0",
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=10.0.0",
+        ],
+        "zstd": [
+            "zstandard>=0.18.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -2,10 +2,7 @@
 Swiss CV Generator - Synthetische Lebenslauf-Generierung für den Schweizer Arbeitsmarkt
 """
 
-from .core.cv_generator import SwissCVGenerator
-from .core.persona_generator import SwissPersonaGenerator
-from .utils.exporters import BatchGenerator
-from .data_models import CV, Persona, Education, Career
+from importlib import import_module
 
 __version__ = "1.0.0"
 __all__ = [
@@ -16,4 +13,33 @@ __all__ = [
     "Persona",
     "Education",
     "Career",
+    "CVBatch",
+    "load_cvs",
 ]
+
+# Öffentliche Namen -> Modul; die Module werden erst beim ersten Zugriff geladen,
+# damit "import swiss_cv_generator" (und damit die CLI) schnell startet
+_LAZY_ATTRIBUTES = {
+    "SwissCVGenerator": ".core.cv_generator",
+    "SwissPersonaGenerator": ".core.persona_generator",
+    "BatchGenerator": ".utils.exporters",
+    "CV": ".data_models",
+    "Persona": ".data_models",
+    "Education": ".data_models",
+    "Career": ".data_models",
+    "CVBatch": ".cv_batch",
+    "load_cvs": ".io",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
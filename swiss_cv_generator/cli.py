@@ -8,9 +8,18 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from swiss_cv_generator import SwissCVGenerator
-from swiss_cv_generator.utils.exporters import BatchGenerator, CVFormatter
-from swiss_cv_generator.utils.validators import StatisticsValidator
+from swiss_cv_generator.config.settings import CLI_VALIDATION_POLICY, VALIDATION_POLICIES
+
+# Generator, Exporter und Validatoren werden erst in den Kommandos importiert,
+# damit z.B. "swiss-cv-gen info" ohne pydantic/pandas/NumPy startet
+
+
+def _mark_partial(filename: str) -> None:
+    """Kennzeichnet eine abgebrochene Ausgabe samt Sidecar als unvollständig"""
+    from swiss_cv_generator.utils.sinks import mark_partial
+
+    for path in mark_partial(filename):
+        click.echo(f"   Unvollständige Ausgabe: {path}")
 
 
 @click.group()
@@ -27,6 +36,8 @@ def cli():
 @click.option("--seed", type=int, help="Random Seed für reproduzierbare Ergebnisse")
 def single(output, format, seed):
     """Generiert einen einzelnen synthetischen CV"""
+    from swiss_cv_generator import SwissCVGenerator
+    from swiss_cv_generator.utils.exporters import CVFormatter
 
     click.echo("🇨🇭 Swiss CV Generator - Einzelner CV")
     click.echo("=" * 40)
@@ -60,12 +71,46 @@ def single(output, format, seed):
 @cli.command()
 @click.option("--count", "-c", default=100, help="Anzahl CVs zu generieren")
 @click.option("--output", "-o", default="batch_cvs", help="Output-Datei Präfix")
-@click.option("--format", "-f", type=click.Choice(["csv", "json", "excel"]), 
+@click.option("--format", "-f", type=click.Choice(["csv", "json", "ndjson", "parquet", "excel", "sqlite", "cvb"]),
               default="csv", help="Output-Format")
+@click.option("--partition-by", type=click.Choice(["language_region", "sector"]), multiple=True,
+              help="Parquet: Tabellen nach Spalte partitionieren (mehrfach möglich)")
 @click.option("--seed", type=int, help="Random Seed")
-@click.option("--validate/--no-validate", default=True, help="Statistiken validieren")
-def batch(count, output, format, seed, validate):
+@click.option("--workers", "-w", default=1, type=click.IntRange(min=1),
+              help="Anzahl paralleler Worker-Prozesse")
+@click.option("--validate/--no-validate", default=True,
+              help="Statistiken laufend während der Generierung validieren")
+@click.option("--fail-fast/--no-fail-fast", default=False,
+              help="Abbrechen, sobald die Validierung statistisch sicher fehlschlägt "
+                   "(nicht mit --no-validate)")
+@click.option("--model-validation", type=click.Choice(VALIDATION_POLICIES),
+              default=CLI_VALIDATION_POLICY, show_default=True,
+              help="Pydantic-Validierung der generierten CVs")
+@click.option("--pipeline/--no-pipeline", default=False,
+              help="Serialisieren und Schreiben in Hintergrund-Threads (mit Durchsatz-Statistik)")
+@click.option("--queue-size", default=4, type=click.IntRange(min=1),
+              help="Maximale Anzahl Chunks pro Pipeline-Queue")
+@click.option("--compress", type=click.Choice(["none", "gzip", "xz", "zstd"]), default=None,
+              help="Ausgabe komprimieren: csv/json/ndjson gzip|xz|zstd, parquet gzip|zstd "
+                   "(interner Codec), excel/sqlite/cvb keine; ohne Angabe gilt der Standard "
+                   "des Formats (parquet: zstd, sonst unkomprimiert)")
+@click.option("--compress-threads", default=1, type=click.IntRange(min=1),
+              help="Threads für die blockweise parallele Kompression")
+def batch(count, output, format, partition_by, seed, workers, validate, fail_fast, model_validation,
+          pipeline, queue_size, compress, compress_threads):
     """Generiert eine Batch von synthetischen CVs"""
+    from swiss_cv_generator import SwissCVGenerator
+    from swiss_cv_generator.utils.exporters import BatchGenerator
+    from swiss_cv_generator.utils.compression import SUFFIX_BY_COMPRESSION
+    from swiss_cv_generator.utils.sinks import supported_compressions
+    from swiss_cv_generator.utils.validators import OnlineValidator, ValidationFailed
+
+    if fail_fast and not validate:
+        raise click.UsageError("--fail-fast benötigt die laufende Validierung (ohne --no-validate)")
+    if compress is not None and compress not in supported_compressions(format):
+        supported = ", ".join(c for c in supported_compressions(format) if c != "none") or "keine"
+        raise click.BadParameter(f"{compress} wird für {format} nicht unterstützt "
+                                 f"(möglich: {supported})", param_hint="--compress")
 
     click.echo(f"🇨🇭 Swiss CV Generator - Batch ({count} CVs)")
     click.echo("=" * 50)
@@ -74,27 +119,59 @@ def batch(count, output, format, seed, validate):
         if not click.confirm(f"⚠️  {count} CVs können lange dauern. Fortfahren?"):
             return
 
-    # Generierung
-    with click.progressbar(length=count, label="CVs generieren") as bar:
-        generator = SwissCVGenerator(random_seed=seed)
-        batch_generator = BatchGenerator(generator)
-
-        # In Chunks für Progress-Anzeige
-        chunk_size = max(1, count // 20)  # 20 Updates
-        all_cvs = []
-
-        for i in range(0, count, chunk_size):
-            chunk_count = min(chunk_size, count - i)
-            chunk_cvs = batch_generator.generate_batch(chunk_count)
-            all_cvs.extend(chunk_cvs)
-            bar.update(len(chunk_cvs))
-
-    click.echo(f"✓ {len(all_cvs)} CVs generiert")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    extension = BatchGenerator.FORMATS[format][1]
+    filename = f"{output}_{timestamp}.{extension}"
+    if compress not in (None, "none") and format in ("csv", "json", "ndjson"):
+        filename += SUFFIX_BY_COMPRESSION[compress]
+
+    generator = SwissCVGenerator(random_seed=seed, validation=model_validation)
+    batch_generator = BatchGenerator(generator)
+    export_options = {"compression": compress, "compress_threads": compress_threads}
+    if format == "parquet":
+        export_options["partition_by"] = partition_by
+
+    # Alle Formate werden gestreamt: CVs werden direkt beim Generieren geschrieben
+    # und chunkweise validiert, die laufenden Abweichungen stehen neben dem Balken
+    validator = OnlineValidator(fail_fast=fail_fast) if validate else None
+
+    with click.progressbar(length=count, label="CVs generieren",
+                           item_show_func=lambda status: status) as bar:
+        def chunks():
+            # Chunks werden (bei --workers > 1 parallel) in stabiler Reihenfolge geliefert
+            for chunk_cvs in batch_generator.iter_batches(count, workers=workers, seed=seed):
+                status = None
+                if validator is not None:
+                    validator.update(chunk_cvs)
+                    status = validator.status_line()
+                bar.update(len(chunk_cvs), current_item=status)
+                yield chunk_cvs
+
+        try:
+            if pipeline:
+                stats = batch_generator.export_pipelined(chunks(), filename, format,
+                                                         queue_size=queue_size, **export_options)
+            else:
+                batch_generator.export(chunks(), filename, format, **export_options)
+        except ValidationFailed as e:
+            click.echo(f"\n❌ Abbruch nach {e.count} CVs (--fail-fast): "
+                       f"Validierung sicher fehlgeschlagen ({', '.join(e.failing)})")
+            _mark_partial(filename)
+            raise SystemExit(1)
+        except Exception as e:
+            click.echo(f"\n❌ Export-Fehler: {e}")
+            _mark_partial(filename)
+            raise SystemExit(1)
+
+    click.echo(f"✓ {count} CVs generiert")
+    click.echo(f"💾 Exportiert nach: {filename}")
+    if pipeline:
+        click.echo(stats.summary())
 
     # Validierung
     if validate:
         click.echo("\n📊 Validiere Statistiken...")
-        validation = StatisticsValidator.validate_cvs(all_cvs)
+        validation = validator.report()
 
         summary = validation["summary"]
         click.echo(f"   Validierungen: {summary['passed']}/{summary['total_validations']} bestanden")
@@ -103,75 +180,131 @@ def batch(count, output, format, seed, validate):
         if summary["overall_status"] == "FAIL":
             click.echo("⚠️  Warnung: Einige Validierungen fehlgeschlagen")
 
-    # Export
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    try:
-        if format == "csv":
-            filename = f"{output}_{timestamp}.csv"
-            batch_generator.export_csv(all_cvs, filename)
-        elif format == "json":
-            filename = f"{output}_{timestamp}.json"
-            batch_generator.export_json(all_cvs, filename)
-        elif format == "excel":
-            filename = f"{output}_{timestamp}.xlsx"
-            batch_generator.export_excel(all_cvs, filename)
-
-        click.echo(f"💾 Exportiert nach: {filename}")
+@cli.command()
+@click.option("--count", "-c", default=100, help="Anzahl CVs zu rendern")
+@click.option("--output", "-o", default="rendered_cvs",
+              help="Zielverzeichnis oder Archiv (.zip, .tar, .tar.gz, .tgz, .tar.xz)")
+@click.option("--format", "-f", type=click.Choice(["html", "markdown", "text"]),
+              default="html", help="Dokument-Format")
+@click.option("--seed", type=int, help="Random Seed")
+@click.option("--workers", "-w", default=1, type=click.IntRange(min=1),
+              help="Anzahl paralleler Worker-Prozesse (generieren und rendern)")
+@click.option("--model-validation", type=click.Choice(VALIDATION_POLICIES),
+              default=CLI_VALIDATION_POLICY, show_default=True,
+              help="Pydantic-Validierung der generierten CVs")
+def render(count, output, format, seed, workers, model_validation):
+    """Generiert CVs und rendert sie als einzelne Dokumente"""
+    from swiss_cv_generator import SwissCVGenerator
+    from swiss_cv_generator.utils.exporters import BatchGenerator
+
+    click.echo(f"🇨🇭 Swiss CV Generator - Render ({count} CVs, {format})")
+    click.echo("=" * 50)
 
+    generator = SwissCVGenerator(random_seed=seed, validation=model_validation)
+    batch_generator = BatchGenerator(generator)
+
+    started = datetime.now()
+    try:
+        written = batch_generator.render(count, output, format, workers=workers, seed=seed)
     except Exception as e:
-        click.echo(f"❌ Export-Fehler: {e}")
+        click.echo(f"❌ Render-Fehler: {e}")
+        return
+
+    seconds = (datetime.now() - started).total_seconds()
+    click.echo(f"✓ {written} Dokumente gerendert ({written / max(seconds, 1e-9):,.0f} CVs/s)")
+    click.echo(f"💾 Gespeichert in: {output}")
 
 
 @cli.command()
 @click.argument("input_file", type=click.Path(exists=True))
-def validate(input_file):
-    """Validiert eine bestehende CV-Datei gegen Schweizer Statistiken"""
+@click.option("--workers", "-w", default=1, type=click.IntRange(min=1),
+              help="Anzahl paralleler Worker-Prozesse zum Parsen")
+@click.option("--block-size", default=8, type=click.IntRange(min=1),
+              help="Blockgrösse pro Chunk in MB (CSV/NDJSON)")
+@click.option("--sample", type=click.IntRange(min=1),
+              help="Näherungsweise aus einer Stichprobe dieser Grösse validieren")
+@click.option("--confidence", default=0.99, type=click.FloatRange(0, 1, min_open=True, max_open=True),
+              help="Konfidenzniveau der Intervalle bei --sample")
+@click.option("--seed", type=int, help="Random Seed für die Stichprobe")
+def validate(input_file, workers, block_size, sample, confidence, seed):
+    """Validiert eine bestehende CV-Datei gegen Schweizer Statistiken
+
+    Unterstützt CSV, JSON, NDJSON und .cvb (auch .gz/.xz/.zst); die Datei wird
+    chunkweise gelesen und muss nicht in den Arbeitsspeicher passen. Mit
+    --sample wird nur eine Stichprobe ausgewertet, mit Konfidenzintervallen
+    und der Angabe, ob jedes Urteil bereits feststeht.
+    """
+    from swiss_cv_generator.io import accumulate_file, sample_file
+    from swiss_cv_generator.utils.validators import StatisticsValidator
 
     click.echo("📊 Validiere CV-Daten...")
 
     try:
-        # Lade CVs (unterstützt JSON und CSV)
-        if input_file.endswith('.json'):
-            with open(input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Hier müsste eine Konvertierung zurück zu CV-Objekten stattfinden
-                # Vereinfacht für dieses Beispiel
-                click.echo("JSON-Validierung noch nicht implementiert")
-                return
-
-        elif input_file.endswith('.csv'):
-            import pandas as pd
-            df = pd.read_csv(input_file)
-
-            # Einfache Statistiken
-            total = len(df)
-            click.echo(f"📈 Analysiere {total} CVs...")
-
-            if 'gender' in df.columns:
-                gender_counts = df['gender'].value_counts()
-                click.echo("\n👥 Geschlechterverteilung:")
-                for gender, count in gender_counts.items():
-                    percentage = (count / total) * 100
-                    click.echo(f"   {gender}: {count} ({percentage:.1f}%)")
-
-            if 'language_region' in df.columns:
-                region_counts = df['language_region'].value_counts()
-                click.echo("\n🗺️  Sprachregionen:")
-                for region, count in region_counts.items():
-                    percentage = (count / total) * 100
-                    click.echo(f"   {region}: {count} ({percentage:.1f}%)")
-
-            if 'age' in df.columns:
-                click.echo(f"\n📅 Altersstatistik:")
-                click.echo(f"   Durchschnitt: {df['age'].mean():.1f} Jahre")
-                click.echo(f"   Bereich: {df['age'].min()}-{df['age'].max()} Jahre")
-
+        if sample:
+            accumulator, population, method = sample_file(input_file, sample, seed=seed)
+            validation = StatisticsValidator.validate_sample(accumulator, confidence, population, method)
         else:
-            click.echo("❌ Unterstützte Formate: .json, .csv")
-
+            accumulator = accumulate_file(input_file, workers=workers,
+                                          block_size=block_size * 1024 * 1024)
+            validation = accumulator.report()
     except Exception as e:
         click.echo(f"❌ Validierungs-Fehler: {e}")
+        return
+
+    if "error" in validation:
+        click.echo(f"❌ {validation['error']}")
+        return
+
+    total = validation["total_cvs"]
+    validations = validation["validations"]
+    if sample:
+        sample_info = validation["sample"]
+        if population is None:
+            population = ""
+        elif sample_info["caveat"]:
+            population = f"von ca. {population} "
+        else:
+            population = f"von {population} "
+        click.echo(f"📈 Stichprobe: {total} CVs {population}({method}, "
+                   f"Konfidenz {confidence:.0%})")
+        if sample_info["caveat"]:
+            click.echo(f"   ⚠️  {sample_info['caveat']}")
+    else:
+        click.echo(f"📈 {total} CVs analysiert")
+
+    click.echo("\n👥 Geschlechterverteilung:")
+    for gender, data in validations["gender"]["actual"].items():
+        click.echo(f"   {gender}: {data['count']} ({data['percentage']:.1f}%)")
+
+    click.echo("\n🗺️  Sprachregionen:")
+    for region, data in validations["regions"]["actual"].items():
+        click.echo(f"   {region}: {data['count']} ({data['percentage']:.1f}%)")
+
+    age = validations["age"]["actual"]
+    click.echo("\n📅 Altersstatistik:")
+    click.echo(f"   Durchschnitt: {age['mean']:.1f} Jahre (Median {age['median']})")
+    click.echo(f"   Bereich: {age['min']}-{age['max']} Jahre")
+
+    click.echo("\n✅ Validierungen:")
+    for data in validations.values():
+        if not sample:
+            click.echo(f"   {data['metric']}: {data['status']}")
+            continue
+        interval = data["confidence_interval"]
+        if isinstance(interval, dict):
+            interval = ", ".join(f"{key} {low:.1f}-{high:.1f}" for key, (low, high) in interval.items())
+        else:
+            interval = f"{interval[0]:.1f}-{interval[1]:.1f}"
+        settled = "gesichert" if data["settled"] else "offen"
+        click.echo(f"   {data['metric']}: {data['status']} ({settled}; Intervall {interval})")
+
+    summary = validation["summary"]
+    click.echo(f"\n   Validierungen: {summary['passed']}/{summary['total_validations']} bestanden")
+    status = summary["overall_status"]
+    if sample:
+        status += " (gesichert)" if summary["settled"] else " (offen - grössere Stichprobe nötig)"
+    click.echo(f"   Status: {status}")
 
 
 @cli.command()
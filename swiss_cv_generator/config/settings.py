@@ -0,0 +1,14 @@
+"""
+Konfiguration des Swiss CV Generators
+"""
+
+# Validierungsrichtlinie für die von den Generatoren erzeugten Modelle:
+#   "always" - jedes Modell wird von pydantic validiert
+#   "sample" - Modelle werden ohne Validierung gebaut, jeder k-te CV wird
+#              vollständig nachvalidiert (k = VALIDATION_SAMPLE_INTERVAL)
+#   "never"  - keine Validierung (Daten sind per Konstruktion korrekt)
+VALIDATION_POLICIES = ("always", "sample", "never")
+DEFAULT_VALIDATION_POLICY = "always"
+# Die CLI erzeugt grosse Batches und nutzt bewusst die Stichproben-Validierung
+CLI_VALIDATION_POLICY = "sample"
+VALIDATION_SAMPLE_INTERVAL = 100
@@ -4,25 +4,43 @@ Swiss CV Generator - Generiert vollständige Lebensläufe basierend auf Personas
 
 import random
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 from uuid import uuid4
 
-from ..data.education import EDUCATION_INSTITUTIONS, QUALIFICATIONS
-from ..data.companies import SWISS_COMPANIES, SECTOR_COMPANIES
+from ..data.catalog import ReferenceCatalog, get_catalog
 from ..data_models import (
     CV, Education, Career, Skills, EducationLevel, 
-    Persona, LanguageRegion
+    Persona, LanguageRegion, build_model, validate_model
 )
+from ..config.settings import VALIDATION_POLICIES, DEFAULT_VALIDATION_POLICY, VALIDATION_SAMPLE_INTERVAL
 from .persona_generator import SwissPersonaGenerator
 
 
 class SwissCVGenerator:
     """Generiert vollständige synthetische Lebensläufe für den Schweizer Arbeitsmarkt"""
 
-    def __init__(self, random_seed: Optional[int] = None):
-        if random_seed:
-            random.seed(random_seed)
-        self.persona_generator = SwissPersonaGenerator(random_seed)
+    def __init__(self, random_seed: Optional[int] = None, catalog: Optional[ReferenceCatalog] = None,
+                 validation: str = DEFAULT_VALIDATION_POLICY,
+                 validation_interval: int = VALIDATION_SAMPLE_INTERVAL):
+        if validation not in VALIDATION_POLICIES:
+            raise ValueError(f"Unbekannte Validierungsrichtlinie: {validation}")
+        if validation_interval < 1:
+            raise ValueError("Validierungsintervall muss mindestens 1 sein")
+        # Prozessweit geteilte, vorberechnete Referenzdaten
+        self.catalog = catalog if catalog is not None else get_catalog()
+        # Validierungsrichtlinie (siehe config/settings.py); bei "sample" wird
+        # der ganze CV inkl. Persona nachvalidiert, daher validiert der
+        # Persona-Generator dann nicht selbst
+        self.validation = validation
+        self.validation_interval = validation_interval
+        self._validate_each = validation == "always"
+        self._generated = 0
+        # Eigene RNG-Instanz, die mit dem Persona-Generator geteilt wird
+        self.rng = random.Random(random_seed)
+        self.persona_generator = SwissPersonaGenerator(
+            random_seed, rng=self.rng, catalog=self.catalog,
+            validation=validation if self._validate_each else "never"
+        )
         self.current_year = datetime.now().year
 
     def generate_cv(self, persona: Optional[Persona] = None) -> CV:
@@ -35,8 +53,9 @@ class SwissCVGenerator:
         skills = self._generate_skills_and_languages(persona)
         hobbies = self._generate_hobbies()
 
-        return CV(
-            cv_id=f"CH-CV-{random.randint(100000, 999999)}",
+        cv = build_model(
+            CV, self._validate_each,
+            cv_id=f"CH-CV-{self.rng.randint(100000, 999999)}",
             persona=persona,
             education=education,
             career=career,
@@ -44,92 +63,103 @@ class SwissCVGenerator:
             hobbies=hobbies,
             generated_date=datetime.now()
         )
+        self._generated += 1
+        if self.validation == "sample" and (self._generated - 1) % self.validation_interval == 0:
+            validate_model(cv)
+        return cv
+
+    def generator_options(self) -> Dict[str, Any]:
+        """Konstruktor-Optionen (ohne Seed), um gleich konfigurierte Generatoren
+        z.B. in Worker-Prozessen zu erzeugen"""
+        return {"validation": self.validation, "validation_interval": self.validation_interval}
 
     def _generate_education_path(self, persona: Persona) -> List[Education]:
         """Generiert realistischen Bildungsweg basierend auf regionalen Präferenzen"""
         education_path = []
+        catalog = self.catalog
         region = persona.personal.language_region
         birth_year = persona.personal.birth_year
 
         # Obligatorische Schulzeit (6-15 Jahre)
-        primary_school = Education(
+        primary_school = build_model(
+            Education, self._validate_each,
             level=EducationLevel.OBLIGATORISCH,
             institution=f"Primarschule und Sekundarschule {persona.personal.city}",
             start_year=birth_year + 6,
             end_year=birth_year + 15,
-            qualification=random.choice(QUALIFICATIONS["obligatorisch"])
+            qualification=self.rng.choice(catalog.qualifications["obligatorisch"])
         )
         education_path.append(primary_school)
 
         # Bildungsweg bestimmen (regional unterschiedlich)
-        preferences = self.persona_generator.get_regional_education_preferences(region)
-        education_route = random.choices(
-            ["vocational", "academic"],
-            weights=[preferences["vocational"], preferences["academic"]],
-            k=1
-        )[0]
+        education_route = catalog.education_route_samplers[region].sample(self.rng)
 
         if education_route == "vocational":
             # Berufslehre (16-19 Jahre)
-            institution = random.choice(EDUCATION_INSTITUTIONS["vocational"][region.value])
-            qualification = random.choice(QUALIFICATIONS["berufslehre"])
+            institution = self.rng.choice(catalog.institutions[("vocational", region)])
+            qualification = self.rng.choice(catalog.qualifications["berufslehre"])
 
-            vocational_education = Education(
+            vocational_education = build_model(
+                Education, self._validate_each,
                 level=EducationLevel.BERUFSLEHRE,
                 institution=institution,
                 start_year=birth_year + 16,
                 end_year=birth_year + 19,
                 qualification=qualification,
-                field_of_study=random.choice(persona.sector_data["roles"])
+                field_of_study=self.rng.choice(persona.sector_data["roles"])
             )
             education_path.append(vocational_education)
 
             # Höhere Berufsbildung (optional, 30% Chance bei Alter > 25)
-            if random.random() < 0.3 and persona.personal.age > 25:
-                higher_education = Education(
+            if self.rng.random() < 0.3 and persona.personal.age > 25:
+                higher_education = build_model(
+                    Education, self._validate_each,
                     level=EducationLevel.HOEHERE_BERUFSBILDUNG,
                     institution=f"Höhere Fachschule {persona.personal.canton}",
                     start_year=birth_year + 22,
                     end_year=birth_year + 24,
-                    qualification=random.choice(QUALIFICATIONS["weiterbildung"])
+                    qualification=self.rng.choice(catalog.qualifications["weiterbildung"])
                 )
                 education_path.append(higher_education)
 
         else:
             # Akademischer Weg
             # Gymnasium (16-19 Jahre)
-            gymnasium = random.choice(EDUCATION_INSTITUTIONS["gymnasium"][region.value])
-            gym_education = Education(
+            gymnasium = self.rng.choice(catalog.institutions[("gymnasium", region)])
+            gym_education = build_model(
+                Education, self._validate_each,
                 level=EducationLevel.GYMNASIUM,
                 institution=gymnasium,
                 start_year=birth_year + 16,
                 end_year=birth_year + 19,
-                qualification=random.choice(QUALIFICATIONS["gymnasium"])
+                qualification=self.rng.choice(catalog.qualifications["gymnasium"])
             )
             education_path.append(gym_education)
 
             # Hochschulstudium (80% Chance)
-            if random.random() < 0.8:
-                university = random.choice(EDUCATION_INSTITUTIONS["universities"][region.value])
+            if self.rng.random() < 0.8:
+                university = self.rng.choice(catalog.institutions[("universities", region)])
 
                 # Bachelor (20-23 Jahre)
-                bachelor = Education(
+                bachelor = build_model(
+                    Education, self._validate_each,
                     level=EducationLevel.UNIVERSITAET,
                     institution=university,
                     start_year=birth_year + 20,
                     end_year=birth_year + 23,
-                    qualification=random.choice([q for q in QUALIFICATIONS["universitaet"] if "Bachelor" in q])
+                    qualification=self.rng.choice(catalog.bachelor_qualifications)
                 )
                 education_path.append(bachelor)
 
                 # Master (70% Chance)
-                if random.random() < 0.7:
-                    master = Education(
+                if self.rng.random() < 0.7:
+                    master = build_model(
+                        Education, self._validate_each,
                         level=EducationLevel.UNIVERSITAET,
                         institution=university,
                         start_year=birth_year + 23,
                         end_year=birth_year + 25,
-                        qualification=random.choice([q for q in QUALIFICATIONS["universitaet"] if "Master" in q])
+                        qualification=self.rng.choice(catalog.master_qualifications)
                     )
                     education_path.append(master)
 
@@ -157,41 +187,29 @@ class SwissCVGenerator:
         while current_year < self.current_year and position_index < len(progression):
             # Dauer pro Position variiert
             if position_index == 0:  # Einstiegslevel
-                duration = random.randint(2, 4)
+                duration = self.rng.randint(2, 4)
             elif position_index == 1:  # Zweite Stufe
-                duration = random.randint(3, 5)
+                duration = self.rng.randint(3, 5)
             else:  # Führungspositionen
-                duration = random.randint(4, 8)
+                duration = self.rng.randint(4, 8)
 
             end_year = min(current_year + duration, self.current_year)
 
             # Unternehmensgröße basierend auf Karrierelevel
-            if position_index <= 1:
-                company_weights = [50, 30, 20]  # Klein, Mittel, Groß
-            else:
-                company_weights = [20, 40, 40]  # Mehr große Unternehmen für Senior-Positionen
-
-            company_size = random.choices(
-                ["small", "medium", "large"],
-                weights=company_weights,
-                k=1
-            )[0]
+            level = "junior" if position_index <= 1 else "senior"
+            company_size = self.catalog.company_size_samplers[level].sample(self.rng)
 
             # Wähle Unternehmen (sektor-spezifisch wenn verfügbar)
-            if persona.sector in SECTOR_COMPANIES and company_size in SECTOR_COMPANIES[persona.sector]:
-                companies = SECTOR_COMPANIES[persona.sector][company_size]
-            else:
-                companies = SWISS_COMPANIES[company_size]
-
-            company = random.choice(companies)
+            company = self.rng.choice(self.catalog.companies_for(persona.sector, company_size))
 
             # Arbeitspensum (Frauen arbeiten häufiger Teilzeit)
-            if persona.personal.gender.value == "female" and random.random() < 0.3:
-                workload = random.choice(["80%", "90%"])
+            if persona.personal.gender.value == "female" and self.rng.random() < 0.3:
+                workload = self.rng.choice(["80%", "90%"])
             else:
                 workload = "100%"
 
-            position = Career(
+            position = build_model(
+                Career, self._validate_each,
                 position=progression[position_index],
                 company=company,
                 location=persona.personal.city,
@@ -214,80 +232,33 @@ class SwissCVGenerator:
 
     def _generate_skills_and_languages(self, persona: Persona) -> Skills:
         """Generiert Sprach- und Fachkompetenzen"""
-        region = persona.personal.language_region
+        catalog = self.catalog
         primary_lang = persona.personal.primary_language
 
         # Sprachkenntnisse
         languages = {primary_lang: "Muttersprache"}
 
-        # Andere Schweizer Landessprachen
-        other_swiss_langs = [lang for lang in ["deutsch", "français", "italiano"] if lang != primary_lang]
-
-        for lang in other_swiss_langs[:2]:  # 1-2 andere Schweizer Sprachen
-            level = random.choices(
-                ["Grundkenntnisse", "Gute Kenntnisse", "Sehr gute Kenntnisse", "Verhandlungssicher"],
-                weights=[20, 35, 30, 15],
-                k=1
-            )[0]
-            languages[lang] = level
+        # Andere Schweizer Landessprachen (1-2)
+        other_swiss_langs = catalog.other_swiss_languages.get(primary_lang, catalog.swiss_languages)
+        swiss_level_sampler = catalog.language_level_samplers["swiss"]
+        for lang in other_swiss_langs[:2]:
+            languages[lang] = swiss_level_sampler.sample(self.rng)
 
         # Englisch (sehr verbreitet in der Schweiz)
-        english_level = random.choices(
-            ["Grundkenntnisse", "Gute Kenntnisse", "Sehr gute Kenntnisse", "Verhandlungssicher"],
-            weights=[15, 35, 35, 15],
-            k=1
-        )[0]
-        languages["english"] = english_level
+        languages["english"] = catalog.language_level_samplers["english"].sample(self.rng)
 
         # Berufsspezifische Fähigkeiten
-        sector_skills_map = {
-            "commercial_administrative": [
-                "MS Office", "SAP", "Projektmanagement", "Buchhaltung", 
-                "Personalwesen", "Marketing", "Kundenbetreuung"
-            ],
-            "healthcare_social": [
-                "Patientenbetreuung", "Medizinische Dokumentation", 
-                "Qualitätsmanagement", "Erste Hilfe", "Pflegeplanung"
-            ],
-            "technical_engineering": [
-                "CAD", "Projektmanagement", "Qualitätssicherung", 
-                "Programmierung", "Technische Dokumentation"
-            ],
-            "finance_banking": [
-                "Financial Analysis", "Risk Management", "Compliance", 
-                "Bloomberg Terminal", "Kundenberatung"
-            ],
-            "construction": [
-                "Bauleitung", "Arbeitssicherheit", "Kostenkalkulation", 
-                "Baurecht", "Projektmanagement"
-            ],
-            "hospitality_tourism": [
-                "Kundenservice", "Eventorganisation", "Fremdsprachen", 
-                "Reservationssysteme", "Gastronomie"
-            ],
-            "education": [
-                "Didaktik", "Curriculum Development", "Klassenführung", 
-                "Pädagogische Diagnostik", "E-Learning"
-            ],
-            "retail_sales": [
-                "Verkaufstechniken", "Warenwirtschaft", "Visual Merchandising", 
-                "Kundenberatung", "Kassensysteme"
-            ]
-        }
-
-        sector_skills = sector_skills_map.get(persona.sector, ["Teamwork", "Kommunikation"])
-        professional_skills = random.sample(
+        sector_skills = catalog.sector_skills.get(persona.sector, catalog.default_skills)
+        professional_skills = self.rng.sample(
             sector_skills,
             k=min(4, len(sector_skills))
         )
 
         # IT-Kenntnisse
-        it_skills = random.sample([
-            "MS Office", "E-Mail", "Internet", "Datenbanken", 
-            "Social Media", "ERP-Systeme", "CRM-Systeme"
-        ], k=random.randint(2, 4))
+        it_skills = self.rng.sample(catalog.it_skills, k=self.rng.randint(2, 4))
 
-        return Skills(
+        return build_model(
+            Skills, self._validate_each,
             languages=languages,
             professional_skills=professional_skills,
             it_skills=it_skills
@@ -295,15 +266,39 @@ class SwissCVGenerator:
 
     def _generate_hobbies(self) -> List[str]:
         """Generiert typische Schweizer Hobbies"""
-        swiss_hobbies = [
-            "Wandern", "Skifahren", "Snowboarden", "Lesen", "Reisen", 
-            "Kochen", "Sport", "Musik", "Fotografie", "Gärtnern", 
-            "Radfahren", "Schwimmen", "Vereinstätigkeit", "Tennis", 
-            "Joggen", "Kultur", "Theater", "Kino", "Bergsport"
-        ]
+        return self.rng.sample(self.catalog.hobbies, k=self.rng.randint(2, 4))
+
+    def generate_batch(self, count: int, columnar: bool = False) -> Union[List[CV], "CVBatch"]:
+        """Generiert mehrere CVs auf einmal
 
-        return random.sample(swiss_hobbies, k=random.randint(2, 4))
+        Mit ``columnar=True`` wird ein spaltenorientierter ``CVBatch`` statt
+        einer Liste zurückgegeben; die CV-Objekte werden dabei nicht gehalten.
+        """
+        if columnar:
+            from ..cv_batch import CVBatchBuilder
 
-    def generate_batch(self, count: int) -> List[CV]:
-        """Generiert mehrere CVs auf einmal"""
+            builder = CVBatchBuilder()
+            for _ in range(count):
+                builder.append(self.generate_cv())
+            return builder.build()
         return [self.generate_cv() for _ in range(count)]
+
+    def iter_cvs(self, count: Optional[int] = None, chunk_size: Optional[int] = None,
+                 columnar: bool = False) -> Iterator[Union[CV, List[CV], "CVBatch"]]:
+        """Erzeugt CVs lazy statt als vollständige Liste
+
+        Ohne ``chunk_size`` wird jeder CV einzeln geliefert, sonst Listen (bzw.
+        mit ``columnar=True`` ``CVBatch``-Objekte) von höchstens ``chunk_size``
+        CVs. ``count=None`` erzeugt einen endlosen Strom.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Chunk-Grösse muss mindestens 1 sein")
+        produced = 0
+        while count is None or produced < count:
+            if chunk_size is None:
+                yield self.generate_cv()
+                produced += 1
+            else:
+                size = chunk_size if count is None else min(chunk_size, count - produced)
+                yield self.generate_batch(size, columnar=columnar)
+                produced += size
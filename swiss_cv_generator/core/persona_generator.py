@@ -4,68 +4,68 @@ Swiss Persona Generator - Generiert demografische Profile basierend auf Schweize
 
 import random
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 
-from ..data.statistics import SWISS_LABOR_STATISTICS, OCCUPATIONAL_SECTORS, SWISS_CANTONS
-from ..data.names import SWISS_NAMES
-from ..data_models import PersonalInfo, Persona, Gender, LanguageRegion
+from ..data.statistics import OCCUPATIONAL_SECTORS
+from ..data.catalog import ReferenceCatalog, get_catalog
+from ..data_models import PersonalInfo, Persona, Gender, LanguageRegion, build_model, validate_model
+from ..config.settings import VALIDATION_POLICIES, DEFAULT_VALIDATION_POLICY, VALIDATION_SAMPLE_INTERVAL
 
 
 class SwissPersonaGenerator:
     """Generiert realistische demografische Profile für Schweizer Arbeitnehmer"""
 
-    def __init__(self, random_seed: Optional[int] = None):
-        if random_seed:
-            random.seed(random_seed)
+    def __init__(self, random_seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                 catalog: Optional[ReferenceCatalog] = None,
+                 validation: str = DEFAULT_VALIDATION_POLICY,
+                 validation_interval: int = VALIDATION_SAMPLE_INTERVAL):
+        if validation not in VALIDATION_POLICIES:
+            raise ValueError(f"Unbekannte Validierungsrichtlinie: {validation}")
+        if validation_interval < 1:
+            raise ValueError("Validierungsintervall muss mindestens 1 sein")
+        # Eigene RNG-Instanz statt globalem Modul-RNG: Generatoren beeinflussen
+        # sich nicht gegenseitig und sind threadsicher reproduzierbar
+        self.rng = rng if rng is not None else random.Random(random_seed)
+        self.random_seed = random_seed
+        # Prozessweit geteilte, vorberechnete Referenzdaten
+        self.catalog = catalog if catalog is not None else get_catalog()
+        # Validierungsrichtlinie (siehe config/settings.py)
+        self.validation = validation
+        self.validation_interval = validation_interval
+        self._validate_each = validation == "always"
+        self._generated = 0
         self.current_year = datetime.now().year
+        self._np_rng = None
 
     def generate_persona(self) -> Persona:
         """Generiert eine vollständige Persona basierend auf Schweizer Statistiken"""
 
+        catalog = self.catalog
+
         # Sprachregion bestimmen (beeinflusst alle anderen Eigenschaften)
-        region_weights = [
-            SWISS_LABOR_STATISTICS["language_regions"]["german_speaking"],
-            SWISS_LABOR_STATISTICS["language_regions"]["french_speaking"], 
-            SWISS_LABOR_STATISTICS["language_regions"]["italian_speaking"]
-        ]
-
-        region = random.choices(
-            [LanguageRegion.DEUTSCHSCHWEIZ, LanguageRegion.ROMANDIE, LanguageRegion.TICINO],
-            weights=region_weights,
-            k=1
-        )[0]
+        region = catalog.region_sampler.sample(self.rng)
 
         # Kanton und Stadt aus der gewählten Region
-        region_data = SWISS_CANTONS[region.value]
-        canton = random.choice(region_data["cantons"])
-        city = random.choice(region_data["major_cities"])
-        language = region_data["language"]
+        canton = self.rng.choice(catalog.cantons[region])
+        city = self.rng.choice(catalog.cities[region])
+        language = catalog.languages[region]
 
         # Geschlecht (leicht mehr Männer in der Erwerbsbevölkerung)
-        gender = random.choices(
-            [Gender.MALE, Gender.FEMALE], 
-            weights=[52, 48], 
-            k=1
-        )[0]
+        gender = catalog.gender_sampler.sample(self.rng)
 
         # Alter basierend auf Erwerbsbevölkerung (22-65 Jahre)
         age = self._generate_realistic_age()
         birth_year = self.current_year - age
 
         # Namen generieren
-        name_data = SWISS_NAMES[language]
-        first_name = random.choice(name_data[gender.value])
-        last_name = random.choice(name_data["surnames"])
+        first_name = self.rng.choice(catalog.first_names[(language, gender)])
+        last_name = self.rng.choice(catalog.surnames[language])
 
         # Berufssektor bestimmen
-        sector_weights = [sector_data["percentage"] for sector_data in OCCUPATIONAL_SECTORS.values()]
-        sector = random.choices(
-            list(OCCUPATIONAL_SECTORS.keys()),
-            weights=sector_weights,
-            k=1
-        )[0]
-
-        personal_info = PersonalInfo(
+        sector = catalog.sector_sampler.sample(self.rng)
+
+        personal_info = build_model(
+            PersonalInfo, self._validate_each,
             first_name=first_name,
             last_name=last_name,
             age=age,
@@ -77,45 +77,55 @@ class SwissPersonaGenerator:
             city=city
         )
 
-        return Persona(
+        persona = build_model(
+            Persona, self._validate_each,
             personal=personal_info,
-            sector=sector,
-            sector_data=OCCUPATIONAL_SECTORS[sector]
+            sector=sector
         )
+        self._generated += 1
+        if self.validation == "sample" and (self._generated - 1) % self.validation_interval == 0:
+            validate_model(persona)
+        return persona
 
     def _generate_realistic_age(self) -> int:
         """Generiert ein realistisches Alter basierend auf Schweizer Erwerbsstatistiken"""
-        # Gewichtung basierend auf Erwerbsquoten nach Altersgruppen
-        age_ranges = [
-            (22, 30, 0.8),   # Junge Erwerbstätige
-            (31, 45, 1.5),   # Kern-Erwerbsjahre
-            (46, 55, 1.3),   # Erfahrene Arbeitskräfte  
-            (56, 65, 0.7)    # Ältere Erwerbstätige
-        ]
-
-        # Wähle Altersbereich
-        ranges, weights = zip(*[(r, w) for r, _, w in age_ranges])
-        chosen_range = random.choices(age_ranges, weights=weights, k=1)[0]
+        # Wähle Altersbereich (gewichtet nach Erwerbsquoten)
+        chosen_range = self.catalog.age_range_sampler.sample(self.rng)
 
         # Wähle spezifisches Alter im Bereich
-        return random.randint(chosen_range[0], chosen_range[1])
-
-    def get_regional_education_preferences(self, region: LanguageRegion) -> Dict[str, float]:
-        """Gibt regionale Bildungspräferenzen zurück"""
-        if region == LanguageRegion.DEUTSCHSCHWEIZ:
-            return {
-                "vocational": 0.70,     # Höhere Lehrlingsquote
-                "academic": 0.30
-            }
-        else:  # Romandie & Ticino
-            return {
-                "vocational": 0.55,     # Niedrigere Lehrlingsquote
-                "academic": 0.45        # Höhere Gymnasialquote
-            }
-
-    def generate_batch(self, count: int) -> List[Persona]:
-        """Generiert mehrere Personas auf einmal"""
-        return [self.generate_persona() for _ in range(count)]
+        return self.rng.randint(chosen_range[0], chosen_range[1])
+
+    def get_regional_education_preferences(self, region: LanguageRegion) -> Mapping[str, float]:
+        """Gibt regionale Bildungspräferenzen zurück (read-only, aus dem Katalog)"""
+        return self.catalog.education_preferences[region]
+
+    def generate_batch(self, count: int, vectorized: bool = True) -> List[Persona]:
+        """Generiert mehrere Personas auf einmal
+
+        Standardmässig werden alle Merkmale in einem Zug als NumPy-Arrays
+        gezogen (siehe ``generate_arrays``); ``vectorized=False`` nutzt die
+        Einzelgenerierung pro Persona. Die pydantic-Modelle entstehen in beiden
+        Fällen einzeln, der vektorisierte Pfad ist daher nur etwa 1.2-1.7x
+        schneller; die Grössenordnung gewinnt nur, wer direkt mit
+        ``generate_arrays`` arbeitet.
+        """
+        if not vectorized:
+            return [self.generate_persona() for _ in range(count)]
+        personas = self.generate_arrays(count).to_personas(validate=self._validate_each)
+        if self.validation == "sample":
+            for persona in personas[::self.validation_interval]:
+                validate_model(persona)
+        return personas
+
+    def generate_arrays(self, count: int):
+        """Zieht Region, Kanton, Stadt, Geschlecht, Alter, Namen und Sektor
+        für ``count`` Personas als NumPy-Arrays (``PersonaArrays``)"""
+        from .vectorized import draw_persona_arrays
+
+        if self._np_rng is None:
+            import numpy as np
+            self._np_rng = np.random.default_rng(self.random_seed)
+        return draw_persona_arrays(self._np_rng, count, self.current_year, self.catalog)
 
     def get_statistics_summary(self, personas: List[Persona]) -> Dict[str, Any]:
         """Erstellt Statistik-Zusammenfassung für Validierung"""
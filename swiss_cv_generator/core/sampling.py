@@ -0,0 +1,76 @@
+"""
+Vorkompilierte Stichproben-Verteilungen (Alias-Methode nach Walker/Vose)
+"""
+
+import random
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasSampler(Generic[T]):
+    """Gewichtete Auswahl in O(1) pro Ziehung
+
+    Die Verteilung wird einmalig in eine Alias-Tabelle übersetzt. Danach
+    kostet jede Ziehung eine Zufallszahl und einen Vergleich, unabhängig von
+    der Anzahl Werte - im Gegensatz zu ``random.choices``, das bei jedem
+    Aufruf die kumulierten Gewichte neu aufbaut.
+    """
+
+    def __init__(self, values: Sequence[T], weights: Sequence[float]):
+        if len(values) != len(weights) or not values:
+            raise ValueError("Werte und Gewichte müssen gleich lang und nicht leer sein")
+        total = float(sum(weights))
+        if total <= 0 or any(w < 0 for w in weights):
+            raise ValueError("Gewichte müssen nicht-negativ sein und eine positive Summe haben")
+
+        self.values: List[T] = list(values)
+        self.weights: List[float] = [float(w) for w in weights]
+        self.n = len(values)
+
+        # Vose: skalierte Wahrscheinlichkeiten in "zu klein" und "zu gross" aufteilen
+        scaled = [w * self.n / total for w in self.weights]
+        self.prob: List[float] = [1.0] * self.n
+        self.alias: List[int] = list(range(self.n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            under = small.pop()
+            over = large.pop()
+            self.prob[under] = scaled[under]
+            self.alias[under] = over
+            scaled[over] = scaled[over] + scaled[under] - 1.0
+            (small if scaled[over] < 1.0 else large).append(over)
+
+        # Rest (Rundungsfehler) hat Wahrscheinlichkeit 1
+        for i in small + large:
+            self.prob[i] = 1.0
+
+        self._np_tables = None
+
+    def sample_index(self, rng: random.Random) -> int:
+        """Zieht einen Index mit einer einzigen Zufallszahl"""
+        u = rng.random() * self.n
+        i = min(int(u), self.n - 1)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def sample(self, rng: random.Random) -> T:
+        """Zieht einen Wert"""
+        return self.values[self.sample_index(rng)]
+
+    def sample_indices(self, np_rng, size: int):
+        """Zieht ``size`` Indizes als NumPy-Array aus einem ``numpy.random.Generator``"""
+        import numpy as np
+
+        if self._np_tables is None:
+            self._np_tables = (np.array(self.prob), np.array(self.alias, dtype=np.int64))
+        prob, alias = self._np_tables
+
+        i = np_rng.integers(0, self.n, size=size)
+        return np.where(np_rng.random(size) < prob[i], i, alias[i])
+
+    def probabilities(self) -> List[float]:
+        """Normalisierte Zielwahrscheinlichkeiten pro Wert"""
+        total = sum(self.weights)
+        return [w / total for w in self.weights]
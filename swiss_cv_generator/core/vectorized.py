@@ -0,0 +1,159 @@
+"""
+Vektorisierte Persona-Ziehung - zieht demografische Merkmale für viele Personas
+auf einmal als NumPy-Arrays statt pro Persona einzeln
+"""
+
+import weakref
+from typing import List
+
+import numpy as np
+
+from ..data.catalog import ReferenceCatalog
+from ..data_models import PersonalInfo, Persona, build_model
+
+
+def _flatten(groups: List[List[str]]):
+    """Legt Teillisten hintereinander ab und liefert (Werte, Startindizes, Längen)"""
+    values = [value for group in groups for value in group]
+    counts = np.array([len(group) for group in groups], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    return values, starts, counts
+
+
+class _PersonaTables:
+    """Aus dem Referenzkatalog abgeleitete Arrays für die vektorisierte Ziehung"""
+
+    def __init__(self, catalog: ReferenceCatalog):
+        # Keine Referenz auf den Katalog: er ist der schwache Schlüssel in _TABLES
+        self.regions = catalog.region_sampler.values
+        self.languages = [catalog.languages[r] for r in self.regions]
+
+        self.cantons, self.canton_start, self.canton_count = _flatten(
+            [catalog.cantons[r] for r in self.regions])
+        self.cities, self.city_start, self.city_count = _flatten(
+            [catalog.cities[r] for r in self.regions])
+
+        self.genders = catalog.gender_sampler.values
+
+        # Vornamen je (Sprachregion, Geschlecht), Index = Region * Anzahl Geschlechter + Geschlecht
+        self.first_names, self.first_name_start, self.first_name_count = _flatten([
+            catalog.first_names[(language, gender)]
+            for language in self.languages for gender in self.genders
+        ])
+        self.surnames, self.surname_start, self.surname_count = _flatten(
+            [catalog.surnames[language] for language in self.languages])
+
+        age_ranges = catalog.age_range_sampler.values
+        self.age_low = np.array([low for low, _, _ in age_ranges], dtype=np.int64)
+        self.age_span = np.array([high - low + 1 for low, high, _ in age_ranges], dtype=np.int64)
+
+        self.sectors = catalog.sector_sampler.values
+        self.region_p = np.array(catalog.region_sampler.probabilities())
+        self.gender_p = np.array(catalog.gender_sampler.probabilities())
+        self.sector_p = np.array(catalog.sector_sampler.probabilities())
+
+
+# Tabellen pro Katalog-Instanz; entfallen mit dem Katalog, damit eigene
+# Kataloge der Aufrufer den Cache nicht unbegrenzt wachsen lassen
+_TABLES: "weakref.WeakKeyDictionary[ReferenceCatalog, _PersonaTables]" = weakref.WeakKeyDictionary()
+
+
+def _get_tables(catalog: ReferenceCatalog) -> _PersonaTables:
+    tables = _TABLES.get(catalog)
+    if tables is None:
+        tables = _TABLES[catalog] = _PersonaTables(catalog)
+    return tables
+
+
+def _pick(rng: np.random.Generator, start: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """Gleichverteilte Auswahl innerhalb der Teilliste [start, start + count)"""
+    return start + (rng.random(len(start)) * count).astype(np.int64)
+
+
+class PersonaArrays:
+    """Demografische Merkmale von N Personas als parallele Code-Arrays
+
+    Kategoriale Merkmale sind als Indizes in die Vokabulare der Klasse
+    (``regions``, ``cantons``, ``cities``, ...) abgelegt.
+    """
+
+    def __init__(self, tables: _PersonaTables, region: np.ndarray, canton: np.ndarray,
+                 city: np.ndarray, gender: np.ndarray, age: np.ndarray, birth_year: np.ndarray,
+                 first_name: np.ndarray, last_name: np.ndarray, sector: np.ndarray):
+        self.tables = tables
+        self.region = region
+        self.canton = canton
+        self.city = city
+        self.gender = gender
+        self.age = age
+        self.birth_year = birth_year
+        self.first_name = first_name
+        self.last_name = last_name
+        self.sector = sector
+
+    def __len__(self) -> int:
+        return len(self.age)
+
+    def to_personas(self, validate: bool = True) -> List[Persona]:
+        """Baut ``Persona``-Objekte aus den gezogenen Arrays
+
+        ``validate=False`` überspringt die pydantic-Validierung (die Werte
+        stammen aus dem Referenzkatalog und sind per Konstruktion gültig).
+        """
+        t = self.tables
+        personas = []
+        for region, canton, city, gender, age, birth_year, first_name, last_name, sector in zip(
+            self.region.tolist(), self.canton.tolist(), self.city.tolist(),
+            self.gender.tolist(), self.age.tolist(), self.birth_year.tolist(),
+            self.first_name.tolist(), self.last_name.tolist(), self.sector.tolist()
+        ):
+            sector_key = t.sectors[sector]
+            personal_info = build_model(
+                PersonalInfo, validate,
+                first_name=t.first_names[first_name],
+                last_name=t.surnames[last_name],
+                age=age,
+                birth_year=birth_year,
+                gender=t.genders[gender],
+                language_region=t.regions[region],
+                primary_language=t.languages[region],
+                canton=t.cantons[canton],
+                city=t.cities[city]
+            )
+            personas.append(build_model(
+                Persona, validate,
+                personal=personal_info,
+                sector=sector_key
+            ))
+        return personas
+
+
+def draw_persona_arrays(rng: np.random.Generator, count: int, current_year: int,
+                        catalog: ReferenceCatalog) -> PersonaArrays:
+    """Zieht alle Persona-Merkmale für ``count`` Personas in einem Durchgang
+
+    Die Verteilungen entsprechen ``SwissPersonaGenerator.generate_persona``:
+    gewichtete Merkmale über dieselben Alias-Sampler, Kanton/Stadt/Namen
+    gleichverteilt innerhalb der Region.
+    """
+    t = _get_tables(catalog)
+
+    region = catalog.region_sampler.sample_indices(rng, count)
+    canton = _pick(rng, t.canton_start[region], t.canton_count[region])
+    city = _pick(rng, t.city_start[region], t.city_count[region])
+    gender = catalog.gender_sampler.sample_indices(rng, count)
+
+    age_range = catalog.age_range_sampler.sample_indices(rng, count)
+    age = t.age_low[age_range] + (rng.random(count) * t.age_span[age_range]).astype(np.int64)
+    birth_year = current_year - age
+
+    name_group = region * len(t.genders) + gender
+    first_name = _pick(rng, t.first_name_start[name_group], t.first_name_count[name_group])
+    last_name = _pick(rng, t.surname_start[region], t.surname_count[region])
+
+    sector = catalog.sector_sampler.sample_indices(rng, count)
+
+    return PersonaArrays(
+        t, region=region, canton=canton, city=city, gender=gender, age=age,
+        birth_year=birth_year, first_name=first_name, last_name=last_name, sector=sector
+    )
@@ -0,0 +1,414 @@
+"""
+Spaltenorientierter CV-Container (Struct-of-Arrays) als speichersparende
+Alternative zu List[CV]
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .data_models import (
+    CV, Persona, PersonalInfo, Education, Career, Skills,
+    Gender, LanguageRegion, EducationLevel, EDUCATION_PRIORITY, construct_model
+)
+
+GENDERS = list(Gender)
+LANGUAGE_REGIONS = list(LanguageRegion)
+EDUCATION_LEVELS = list(EducationLevel)
+
+# Spalten pro CV: Name -> NumPy-Datentyp. Zeichenketten-Spalten mit int32 sind
+# Codes in das Vokabular des Batches, Enum-Spalten (int8) Indizes in die Enum-Reihenfolge.
+CV_COLUMNS: Dict[str, str] = {
+    "cv_id": "U",
+    "generated_date": "datetime64[us]",
+    "first_name": "int32",
+    "last_name": "int32",
+    "age": "int16",
+    "birth_year": "int16",
+    "gender": "int8",
+    "language_region": "int8",
+    "primary_language": "int32",
+    "canton": "int32",
+    "city": "int32",
+    "sector": "int32",
+}
+
+# Listenfelder variabler Länge: Gruppe -> Spalten der Einträge. Jede Gruppe hat
+# zusätzlich ein Offset-Array "<gruppe>_offsets" der Länge N+1.
+LIST_COLUMNS: Dict[str, Dict[str, str]] = {
+    "education": {
+        "education_level": "int8",
+        "education_institution": "int32",
+        "education_start_year": "int16",
+        "education_end_year": "int16",
+        "education_qualification": "int32",
+        "education_field_of_study": "int32",
+    },
+    "career": {
+        "career_position": "int32",
+        "career_company": "int32",
+        "career_location": "int32",
+        "career_start_year": "int16",
+        "career_end_year": "int16",
+        "career_duration_years": "int16",
+        "career_employment_type": "int32",
+        "career_workload": "int32",
+    },
+    "responsibilities": {"responsibilities": "int32"},
+    "languages": {"language": "int32", "language_level": "int32"},
+    "professional_skills": {"professional_skills": "int32"},
+    "it_skills": {"it_skills": "int32"},
+    "certifications": {"certifications": "int32"},
+    "hobbies": {"hobbies": "int32"},
+}
+
+# Alle Spalten mit Vokabular-Codes
+STRING_COLUMNS = [
+    name for name, dtype in list(CV_COLUMNS.items())
+    + [item for group in LIST_COLUMNS.values() for item in group.items()]
+    if dtype == "int32"
+]
+
+# Verschachtelte Gruppe: Verantwortlichkeiten hängen an Karriere-Einträgen, nicht an CVs
+NESTED_GROUPS = {"responsibilities": "career"}
+
+# Priorität der Bildungsstufen (Index in EDUCATION_LEVELS -> Priorität)
+_LEVEL_PRIORITY = np.array([EDUCATION_PRIORITY[level] for level in EDUCATION_LEVELS], dtype=np.int8)
+
+MISSING = -1
+
+
+class Vocabulary:
+    """Dictionary-Encoding für Zeichenketten (Wert <-> Integer-Code)"""
+
+    def __init__(self, values: Optional[Iterable[str]] = None):
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+        for value in values or []:
+            self.encode(value)
+
+    def encode(self, value: Optional[str]) -> int:
+        """Liefert den Code eines Werts und nimmt neue Werte auf (None -> MISSING)"""
+        if value is None:
+            return MISSING
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.index[value] = code
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return None if code == MISSING else self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _offsets(lengths: List[int]) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+class CVBatch:
+    """Batch von CVs als typisierte Spalten
+
+    Zeichenketten sind über ein gemeinsames ``Vocabulary`` kodiert, Listenfelder
+    (Bildung, Karriere, Sprachen, Skills, Hobbies) als Werte-Arrays plus
+    Offset-Array. Einzelne ``CV``-Objekte werden erst beim Indexzugriff gebaut.
+    Slices teilen sich die Arrays mit dem Ursprungs-Batch (keine Kopie), daher
+    beginnen Offsets nicht zwingend bei 0.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], vocab: Vocabulary):
+        self.columns = columns
+        self.vocab = vocab
+
+    @classmethod
+    def from_cvs(cls, cvs: Iterable[CV], vocab: Optional[Vocabulary] = None) -> "CVBatch":
+        """Kodiert CV-Objekte spaltenweise"""
+        builder = CVBatchBuilder(vocab)
+        for cv in cvs:
+            builder.append(cv)
+        return builder.build()
+
+    @classmethod
+    def concat(cls, batches: List["CVBatch"]) -> "CVBatch":
+        """Hängt Batches aneinander
+
+        Batches mit abweichendem Vokabular werden auf das Vokabular des ersten
+        Batches umkodiert.
+        """
+        if not batches:
+            raise ValueError("Keine Batches zum Zusammenfügen")
+        vocab = batches[0].vocab
+        batches = [batch if batch.vocab is vocab else batch.recode(vocab) for batch in batches]
+
+        columns = {name: np.concatenate([b.columns[name] for b in batches]) for name in CV_COLUMNS}
+        for group, group_columns in LIST_COLUMNS.items():
+            parts = [b.list_column(group) for b in batches]
+            lengths = np.concatenate([np.diff(offsets) for offsets, _ in parts])
+            columns[f"{group}_offsets"] = _offsets(lengths)
+            for name in group_columns:
+                columns[name] = np.concatenate([values[name] for _, values in parts])
+        return cls(columns, vocab)
+
+    def recode(self, vocab: Vocabulary) -> "CVBatch":
+        """Kodiert alle Zeichenketten-Spalten auf ein anderes Vokabular um"""
+        mapping = np.array([vocab.encode(value) for value in self.vocab.values] + [MISSING],
+                           dtype=np.int32)
+        columns = dict(self.columns)
+        for name in STRING_COLUMNS:
+            # MISSING (-1) zeigt auf den letzten Eintrag und bleibt damit MISSING
+            columns[name] = mapping[self.columns[name]]
+        return CVBatch(columns, vocab)
+
+    def __len__(self) -> int:
+        return len(self.columns["cv_id"])
+
+    def __iter__(self) -> Iterator[CV]:
+        for i in range(len(self)):
+            yield self._cv_at(i)
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("Nur zusammenhängende Slices werden unterstützt")
+            stop = max(start, stop)
+            columns = {name: self.columns[name][start:stop] for name in CV_COLUMNS}
+            for group, group_columns in LIST_COLUMNS.items():
+                offsets_name = f"{group}_offsets"
+                if group in NESTED_GROUPS:
+                    columns[offsets_name] = self.columns[offsets_name]
+                else:
+                    columns[offsets_name] = self.columns[offsets_name][start:stop + 1]
+                for name in group_columns:
+                    columns[name] = self.columns[name]
+            return CVBatch(columns, self.vocab)
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("CV-Index ausserhalb des Batches")
+        return self._cv_at(key)
+
+    def list_column(self, group: str):
+        """Liefert (Offsets ab 0, {Spalte: Werte}) einer Listengruppe für diesen Batch"""
+        offsets = self.columns[f"{group}_offsets"]
+        parent = NESTED_GROUPS.get(group)
+        if parent is not None:
+            parent_offsets = self.columns[f"{parent}_offsets"]
+            offsets = offsets[parent_offsets[0]:parent_offsets[-1] + 1]
+        start, stop = offsets[0], offsets[-1]
+        values = {name: self.columns[name][start:stop] for name in LIST_COLUMNS[group]}
+        return offsets - start, values
+
+    def decode(self, name: str) -> List[Optional[str]]:
+        """Dekodiert eine Zeichenketten- oder Enum-Spalte pro CV"""
+        codes = self.columns[name].tolist()
+        if name == "gender":
+            return [GENDERS[c].value for c in codes]
+        if name == "language_region":
+            return [LANGUAGE_REGIONS[c].value for c in codes]
+        return [self.vocab.decode(c) for c in codes]
+
+    def value_counts(self, name: str) -> Dict[str, int]:
+        """Häufigkeiten einer kategorialen Spalte (inkl. ``education_level``)"""
+        if name == "education_level":
+            codes = self.highest_education_levels()
+            labels = [level.value for level in EDUCATION_LEVELS]
+        elif name == "gender":
+            codes, labels = self.columns[name], [g.value for g in GENDERS]
+        elif name == "language_region":
+            codes, labels = self.columns[name], [r.value for r in LANGUAGE_REGIONS]
+        else:
+            codes, labels = self.columns[name], self.vocab.values
+
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+        return {labels[code]: int(count) for code, count in enumerate(counts) if count}
+
+    def highest_education_levels(self) -> np.ndarray:
+        """Index (in EDUCATION_LEVELS) des höchsten Abschlusses pro CV, MISSING ohne Einträge"""
+        offsets, values = self.list_column("education")
+        levels = values["education_level"]
+        result = np.full(len(self), MISSING, dtype=np.int8)
+        if len(levels) == 0:
+            return result
+
+        lengths = np.diff(offsets)
+        has_education = lengths > 0
+        priority = _LEVEL_PRIORITY[levels]
+        best = np.maximum.reduceat(priority, offsets[:-1][has_education])
+        # Priorität -> Level-Index zurückübersetzen
+        level_by_priority = np.zeros(_LEVEL_PRIORITY.max() + 1, dtype=np.int8)
+        level_by_priority[_LEVEL_PRIORITY] = np.arange(len(EDUCATION_LEVELS), dtype=np.int8)
+        result[has_education] = level_by_priority[best]
+        return result
+
+    def _strings(self, name: str, start: int, stop: int) -> List[str]:
+        return [self.vocab.values[c] for c in self.columns[name][start:stop].tolist()]
+
+    def _cv_at(self, i: int) -> CV:
+        # Die Spalten stammen aus validierten CVs, daher ohne erneute Validierung
+        c = self.columns
+        decode = self.vocab.decode
+        sector = decode(int(c["sector"][i]))
+
+        personal = construct_model(
+            PersonalInfo,
+            first_name=decode(int(c["first_name"][i])),
+            last_name=decode(int(c["last_name"][i])),
+            age=int(c["age"][i]),
+            birth_year=int(c["birth_year"][i]),
+            gender=GENDERS[c["gender"][i]],
+            language_region=LANGUAGE_REGIONS[c["language_region"][i]],
+            primary_language=decode(int(c["primary_language"][i])),
+            canton=decode(int(c["canton"][i])),
+            city=decode(int(c["city"][i]))
+        )
+
+        edu_start, edu_stop = c["education_offsets"][i:i + 2].tolist()
+        education = [
+            construct_model(
+                Education,
+                level=EDUCATION_LEVELS[c["education_level"][j]],
+                institution=decode(int(c["education_institution"][j])),
+                start_year=int(c["education_start_year"][j]),
+                end_year=int(c["education_end_year"][j]),
+                qualification=decode(int(c["education_qualification"][j])),
+                field_of_study=decode(int(c["education_field_of_study"][j]))
+            )
+            for j in range(edu_start, edu_stop)
+        ]
+
+        career_start, career_stop = c["career_offsets"][i:i + 2].tolist()
+        career = []
+        for j in range(career_start, career_stop):
+            resp_start, resp_stop = c["responsibilities_offsets"][j:j + 2].tolist()
+            end_year = int(c["career_end_year"][j])
+            career.append(construct_model(
+                Career,
+                position=decode(int(c["career_position"][j])),
+                company=decode(int(c["career_company"][j])),
+                location=decode(int(c["career_location"][j])),
+                start_year=int(c["career_start_year"][j]),
+                end_year=None if end_year == MISSING else end_year,
+                duration_years=int(c["career_duration_years"][j]),
+                employment_type=decode(int(c["career_employment_type"][j])),
+                workload=decode(int(c["career_workload"][j])),
+                responsibilities=self._strings("responsibilities", resp_start, resp_stop) or None
+            ))
+
+        lang_start, lang_stop = c["languages_offsets"][i:i + 2].tolist()
+        languages = {
+            decode(int(c["language"][j])): decode(int(c["language_level"][j]))
+            for j in range(lang_start, lang_stop)
+        }
+
+        def items(group: str) -> List[str]:
+            start, stop = c[f"{group}_offsets"][i:i + 2].tolist()
+            return self._strings(group, start, stop)
+
+        return construct_model(
+            CV,
+            cv_id=str(c["cv_id"][i]),
+            persona=construct_model(
+                Persona,
+                personal=personal,
+                sector=sector
+            ),
+            education=education,
+            career=career,
+            skills=construct_model(
+                Skills,
+                languages=languages,
+                professional_skills=items("professional_skills"),
+                it_skills=items("it_skills"),
+                certifications=items("certifications")
+            ),
+            hobbies=items("hobbies"),
+            generated_date=c["generated_date"][i].item()
+        )
+
+
+class CVBatchBuilder:
+    """Sammelt CVs zeilenweise und baut daraus einen ``CVBatch``"""
+
+    def __init__(self, vocab: Optional[Vocabulary] = None):
+        self.vocab = vocab if vocab is not None else Vocabulary()
+        self._values: Dict[str, list] = {name: [] for name in CV_COLUMNS}
+        self._lengths: Dict[str, List[int]] = {group: [] for group in LIST_COLUMNS}
+        for group_columns in LIST_COLUMNS.values():
+            for name in group_columns:
+                self._values[name] = []
+
+    def __len__(self) -> int:
+        return len(self._values["cv_id"])
+
+    def append(self, cv: CV) -> None:
+        encode = self.vocab.encode
+        v = self._values
+        p = cv.persona.personal
+
+        v["cv_id"].append(cv.cv_id)
+        v["generated_date"].append(cv.generated_date)
+        v["first_name"].append(encode(p.first_name))
+        v["last_name"].append(encode(p.last_name))
+        v["age"].append(p.age)
+        v["birth_year"].append(p.birth_year)
+        v["gender"].append(GENDERS.index(p.gender))
+        v["language_region"].append(LANGUAGE_REGIONS.index(p.language_region))
+        v["primary_language"].append(encode(p.primary_language))
+        v["canton"].append(encode(p.canton))
+        v["city"].append(encode(p.city))
+        v["sector"].append(encode(cv.persona.sector))
+
+        self._lengths["education"].append(len(cv.education))
+        for edu in cv.education:
+            v["education_level"].append(EDUCATION_LEVELS.index(edu.level))
+            v["education_institution"].append(encode(edu.institution))
+            v["education_start_year"].append(edu.start_year)
+            v["education_end_year"].append(edu.end_year)
+            v["education_qualification"].append(encode(edu.qualification))
+            v["education_field_of_study"].append(encode(edu.field_of_study))
+
+        self._lengths["career"].append(len(cv.career))
+        for career in cv.career:
+            v["career_position"].append(encode(career.position))
+            v["career_company"].append(encode(career.company))
+            v["career_location"].append(encode(career.location))
+            v["career_start_year"].append(career.start_year)
+            v["career_end_year"].append(MISSING if career.end_year is None else career.end_year)
+            v["career_duration_years"].append(career.duration_years)
+            v["career_employment_type"].append(encode(career.employment_type))
+            v["career_workload"].append(encode(career.workload))
+            responsibilities = career.responsibilities or []
+            self._lengths["responsibilities"].append(len(responsibilities))
+            v["responsibilities"].extend(encode(r) for r in responsibilities)
+
+        self._lengths["languages"].append(len(cv.skills.languages))
+        for language, level in cv.skills.languages.items():
+            v["language"].append(encode(language))
+            v["language_level"].append(encode(level))
+
+        for group, items in (
+            ("professional_skills", cv.skills.professional_skills),
+            ("it_skills", cv.skills.it_skills),
+            ("certifications", cv.skills.certifications),
+            ("hobbies", cv.hobbies),
+        ):
+            self._lengths[group].append(len(items))
+            v[group].extend(encode(item) for item in items)
+
+    def build(self) -> CVBatch:
+        """Erzeugt die typisierten Arrays"""
+        columns = {}
+        for name, dtype in CV_COLUMNS.items():
+            columns[name] = np.array(self._values[name], dtype=dtype)
+        for group, group_columns in LIST_COLUMNS.items():
+            columns[f"{group}_offsets"] = _offsets(self._lengths[group])
+            for name, dtype in group_columns.items():
+                columns[name] = np.array(self._values[name], dtype=dtype)
+        return CVBatch(columns, self.vocab)
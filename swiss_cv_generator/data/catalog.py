@@ -0,0 +1,145 @@
+"""
+Kompilierter Referenzdaten-Katalog - lädt alle statischen Daten einmalig und
+berechnet abgeleitete Lookup-Tabellen vor
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+
+from .statistics import (
+    SWISS_LABOR_STATISTICS, OCCUPATIONAL_SECTORS, SWISS_CANTONS,
+    LANGUAGE_REGION_KEYS, WORKFORCE_AGE_RANGES, GENDER_WEIGHTS
+)
+from .names import SWISS_NAMES
+from .companies import SWISS_COMPANIES, SECTOR_COMPANIES, COMPANY_SIZE_WEIGHTS
+from .education import EDUCATION_INSTITUTIONS, QUALIFICATIONS, REGIONAL_EDUCATION_PREFERENCES
+from .skills import (
+    SECTOR_SKILLS, DEFAULT_SKILLS, IT_SKILLS, SWISS_HOBBIES,
+    SWISS_LANGUAGES, LANGUAGE_LEVELS, LANGUAGE_LEVEL_WEIGHTS
+)
+from ..data_models import Gender, LanguageRegion
+from ..core.sampling import AliasSampler
+
+
+def _freeze(value: Any) -> Any:
+    """Wandelt verschachtelte Dicts/Listen in unveränderliche Strukturen um"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Gegenstück zu ``_freeze``: liefert veränderbare, JSON-serialisierbare Kopien"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class ReferenceCatalog:
+    """Read-only Sicht auf alle Referenzdaten mit vorberechneten Indizes
+
+    Wird pro Prozess einmal über ``get_catalog()`` aufgebaut und von allen
+    Generator-Instanzen geteilt. Alle Tabellen sind Tupel bzw.
+    ``MappingProxyType`` und dürfen nicht verändert werden.
+    """
+
+    def __init__(self):
+        # Sprachregionen, Kantone, Städte
+        self.regions: Tuple[LanguageRegion, ...] = tuple(LanguageRegion)
+        self.region_codes = MappingProxyType({region: i for i, region in enumerate(self.regions)})
+        self.cantons = _freeze({r: SWISS_CANTONS[r.value]["cantons"] for r in self.regions})
+        self.cities = _freeze({r: SWISS_CANTONS[r.value]["major_cities"] for r in self.regions})
+        self.languages = MappingProxyType({r: SWISS_CANTONS[r.value]["language"] for r in self.regions})
+
+        # Geschlecht und Namen
+        self.genders: Tuple[Gender, ...] = tuple(Gender)
+        self.gender_codes = MappingProxyType({gender: i for i, gender in enumerate(self.genders)})
+        self.first_names = _freeze({
+            (language, gender): SWISS_NAMES[language][gender.value]
+            for language in self.languages.values() for gender in self.genders
+        })
+        self.surnames = _freeze({language: SWISS_NAMES[language]["surnames"]
+                                 for language in self.languages.values()})
+
+        # Sektoren
+        self.sectors: Tuple[str, ...] = tuple(OCCUPATIONAL_SECTORS)
+        self.sector_codes = MappingProxyType({sector: i for i, sector in enumerate(self.sectors)})
+        self.sector_data: Mapping[str, Mapping[str, Any]] = _freeze(OCCUPATIONAL_SECTORS)
+        self.sector_skills = _freeze({sector: SECTOR_SKILLS.get(sector, DEFAULT_SKILLS)
+                                      for sector in self.sectors})
+        self.default_skills: Tuple[str, ...] = tuple(DEFAULT_SKILLS)
+
+        # Unternehmen pro (Sektor, Grösse): sektor-spezifisch wenn verfügbar
+        self.company_sizes: Tuple[str, ...] = tuple(SWISS_COMPANIES)
+        self.general_companies = _freeze(SWISS_COMPANIES)
+        self.companies = _freeze({
+            (sector, size): SECTOR_COMPANIES.get(sector, {}).get(size, SWISS_COMPANIES[size])
+            for sector in self.sectors for size in self.company_sizes
+        })
+
+        # Bildung
+        self.qualifications = _freeze(QUALIFICATIONS)
+        self.bachelor_qualifications: Tuple[str, ...] = tuple(
+            q for q in QUALIFICATIONS["universitaet"] if "Bachelor" in q)
+        self.master_qualifications: Tuple[str, ...] = tuple(
+            q for q in QUALIFICATIONS["universitaet"] if "Master" in q)
+        self.institutions = _freeze({
+            (kind, region): EDUCATION_INSTITUTIONS[kind][region.value]
+            for kind in EDUCATION_INSTITUTIONS for region in self.regions
+        })
+        self.education_preferences = _freeze({
+            region: REGIONAL_EDUCATION_PREFERENCES[region.value] for region in self.regions
+        })
+
+        # Skills, Sprachen, Hobbies
+        self.it_skills: Tuple[str, ...] = tuple(IT_SKILLS)
+        self.hobbies: Tuple[str, ...] = tuple(SWISS_HOBBIES)
+        self.swiss_languages: Tuple[str, ...] = tuple(SWISS_LANGUAGES)
+        self.other_swiss_languages = MappingProxyType({
+            language: tuple(other for other in SWISS_LANGUAGES if other != language)
+            for language in SWISS_LANGUAGES
+        })
+        self.age_ranges: Tuple[Tuple[int, int, float], ...] = tuple(WORKFORCE_AGE_RANGES)
+
+        # Vorkompilierte Verteilungen für alle gewichteten Ziehungen
+        self.region_sampler = AliasSampler(
+            self.regions,
+            [SWISS_LABOR_STATISTICS["language_regions"][LANGUAGE_REGION_KEYS[r.value]]
+             for r in self.regions]
+        )
+        self.gender_sampler = AliasSampler(self.genders, [GENDER_WEIGHTS[g.value] for g in self.genders])
+        self.age_range_sampler = AliasSampler(self.age_ranges, [w for _, _, w in self.age_ranges])
+        self.sector_sampler = AliasSampler(
+            self.sectors, [OCCUPATIONAL_SECTORS[s]["percentage"] for s in self.sectors])
+        self.education_route_samplers = MappingProxyType({
+            region: AliasSampler(list(prefs), list(prefs.values()))
+            for region, prefs in self.education_preferences.items()
+        })
+        self.company_size_samplers = MappingProxyType({
+            level: AliasSampler(list(weights), list(weights.values()))
+            for level, weights in COMPANY_SIZE_WEIGHTS.items()
+        })
+        self.language_level_samplers = MappingProxyType({
+            kind: AliasSampler(LANGUAGE_LEVELS, weights)
+            for kind, weights in LANGUAGE_LEVEL_WEIGHTS.items()
+        })
+
+    def companies_for(self, sector: str, size: str) -> Tuple[str, ...]:
+        """Unternehmensliste für Sektor und Grösse (allgemeine Liste für unbekannte Sektoren)"""
+        companies = self.companies.get((sector, size))
+        return companies if companies is not None else self.general_companies[size]
+
+    def sector_table(self) -> Dict[str, Dict[str, Any]]:
+        """Sektor-Referenzdaten als serialisierbares Dict (für Export-Metadaten)"""
+        return _thaw(self.sector_data)
+
+
+@lru_cache(maxsize=None)
+def get_catalog() -> ReferenceCatalog:
+    """Liefert den prozessweit geteilten Referenzdaten-Katalog"""
+    return ReferenceCatalog()
@@ -68,3 +68,9 @@ SECTOR_COMPANIES: Dict[str, Dict[str, List[str]]] = {
         "small": ["Local Market AG", "Swiss Retail Solutions", "Village Store GmbH"]
     }
 }
+
+# Unternehmensgröße nach Karrierelevel (Klein, Mittel, Groß)
+COMPANY_SIZE_WEIGHTS: Dict[str, Dict[str, int]] = {
+    "junior": {"small": 50, "medium": 30, "large": 20},
+    "senior": {"small": 20, "medium": 40, "large": 40}   # Mehr große Unternehmen für Senior-Positionen
+}
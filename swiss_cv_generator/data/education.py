@@ -141,3 +141,19 @@ QUALIFICATIONS: Dict[str, List[str]] = {
         "EMBA Executive Master of Business Administration"
     ]
 }
+
+# Regionale Bildungspräferenzen (Anteil Berufslehre vs. Gymnasialweg)
+REGIONAL_EDUCATION_PREFERENCES: Dict[str, Dict[str, float]] = {
+    "deutschschweiz": {
+        "vocational": 0.70,     # Höhere Lehrlingsquote
+        "academic": 0.30
+    },
+    "romandie": {
+        "vocational": 0.55,     # Niedrigere Lehrlingsquote
+        "academic": 0.45        # Höhere Gymnasialquote
+    },
+    "ticino": {
+        "vocational": 0.55,
+        "academic": 0.45
+    }
+}
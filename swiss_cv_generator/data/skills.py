@@ -0,0 +1,69 @@
+"""
+Berufsspezifische Fähigkeiten, IT-Kenntnisse und Hobbies
+"""
+
+from typing import Dict, List
+
+# Berufsspezifische Fähigkeiten nach Sektor
+SECTOR_SKILLS: Dict[str, List[str]] = {
+    "commercial_administrative": [
+        "MS Office", "SAP", "Projektmanagement", "Buchhaltung", 
+        "Personalwesen", "Marketing", "Kundenbetreuung"
+    ],
+    "healthcare_social": [
+        "Patientenbetreuung", "Medizinische Dokumentation", 
+        "Qualitätsmanagement", "Erste Hilfe", "Pflegeplanung"
+    ],
+    "technical_engineering": [
+        "CAD", "Projektmanagement", "Qualitätssicherung", 
+        "Programmierung", "Technische Dokumentation"
+    ],
+    "finance_banking": [
+        "Financial Analysis", "Risk Management", "Compliance", 
+        "Bloomberg Terminal", "Kundenberatung"
+    ],
+    "construction": [
+        "Bauleitung", "Arbeitssicherheit", "Kostenkalkulation", 
+        "Baurecht", "Projektmanagement"
+    ],
+    "hospitality_tourism": [
+        "Kundenservice", "Eventorganisation", "Fremdsprachen", 
+        "Reservationssysteme", "Gastronomie"
+    ],
+    "education": [
+        "Didaktik", "Curriculum Development", "Klassenführung", 
+        "Pädagogische Diagnostik", "E-Learning"
+    ],
+    "retail_sales": [
+        "Verkaufstechniken", "Warenwirtschaft", "Visual Merchandising", 
+        "Kundenberatung", "Kassensysteme"
+    ]
+}
+
+# Fallback für Sektoren ohne eigene Liste
+DEFAULT_SKILLS: List[str] = ["Teamwork", "Kommunikation"]
+
+IT_SKILLS: List[str] = [
+    "MS Office", "E-Mail", "Internet", "Datenbanken", 
+    "Social Media", "ERP-Systeme", "CRM-Systeme"
+]
+
+# Typische Schweizer Hobbies
+SWISS_HOBBIES: List[str] = [
+    "Wandern", "Skifahren", "Snowboarden", "Lesen", "Reisen", 
+    "Kochen", "Sport", "Musik", "Fotografie", "Gärtnern", 
+    "Radfahren", "Schwimmen", "Vereinstätigkeit", "Tennis", 
+    "Joggen", "Kultur", "Theater", "Kino", "Bergsport"
+]
+
+SWISS_LANGUAGES: List[str] = ["deutsch", "français", "italiano"]
+
+LANGUAGE_LEVELS: List[str] = [
+    "Grundkenntnisse", "Gute Kenntnisse", "Sehr gute Kenntnisse", "Verhandlungssicher"
+]
+
+# Gewichtung der Sprachniveaus (gleiche Reihenfolge wie LANGUAGE_LEVELS)
+LANGUAGE_LEVEL_WEIGHTS: Dict[str, List[int]] = {
+    "swiss": [20, 35, 30, 15],    # Andere Schweizer Landessprachen
+    "english": [15, 35, 35, 15]   # Englisch (sehr verbreitet in der Schweiz)
+}
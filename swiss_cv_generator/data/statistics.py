@@ -181,3 +181,21 @@ SWISS_CANTONS = {
         "apprenticeship_rate": 28.5
     }
 }
+
+# Zuordnung Sprachregion -> Schlüssel in SWISS_LABOR_STATISTICS["language_regions"]
+LANGUAGE_REGION_KEYS = {
+    "deutschschweiz": "german_speaking",
+    "romandie": "french_speaking",
+    "ticino": "italian_speaking"
+}
+
+# Gewichtung basierend auf Erwerbsquoten nach Altersgruppen
+WORKFORCE_AGE_RANGES = [
+    (22, 30, 0.8),   # Junge Erwerbstätige
+    (31, 45, 1.5),   # Kern-Erwerbsjahre
+    (46, 55, 1.3),   # Erfahrene Arbeitskräfte
+    (56, 65, 0.7)    # Ältere Erwerbstätige
+]
+
+# Geschlecht (leicht mehr Männer in der Erwerbsbevölkerung)
+GENDER_WEIGHTS = {"male": 52, "female": 48}
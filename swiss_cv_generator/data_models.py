@@ -3,11 +3,93 @@ Datenmodelle für den Swiss CV Generator
 """
 
 from datetime import datetime, date
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, validator
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Mapping, Tuple
+from pydantic import VERSION as PYDANTIC_VERSION, BaseModel, Field, validator
 from enum import Enum
 
 
+# pydantic v2 benennt construct()/dict() in model_construct()/model_dump() um
+_PYDANTIC_V2 = hasattr(BaseModel, "model_construct")
+
+# Versionen, für die der schnelle Pfad in construct_model geprüft ist (siehe
+# test_construct_model_matches_pydantic); neuere nutzen model_construct
+_FAST_CONSTRUCT_VERSIONS = ((2, 0), (2, 15))
+_FAST_CONSTRUCT = (_PYDANTIC_V2 and _FAST_CONSTRUCT_VERSIONS[0]
+                   <= tuple(int(part) for part in PYDANTIC_VERSION.split(".")[:2])
+                   < _FAST_CONSTRUCT_VERSIONS[1])
+
+
+# Standardwerte pro Modellklasse: (feste Defaults, default_factory-Felder).
+# pydantic v2 prüft in model_construct für jede Factory per inspect.signature,
+# ob sie validierte Daten erwartet - das dominiert sonst die Laufzeit
+_MODEL_DEFAULTS: Dict[type, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+
+def _model_defaults(model_cls) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    defaults = _MODEL_DEFAULTS.get(model_cls)
+    if defaults is None:
+        fields = model_cls.model_fields if _PYDANTIC_V2 else model_cls.__fields__
+        static = {}
+        factories = {}
+        for name, field in fields.items():
+            if field.default_factory is not None:
+                factories[name] = field.default_factory
+            elif not (field.is_required() if _PYDANTIC_V2 else field.required):
+                static[name] = field.default
+        defaults = _MODEL_DEFAULTS[model_cls] = (static, factories)
+    return defaults
+
+
+def construct_model(model_cls, **values):
+    """Baut ein Modell ohne Validierung (nur für vertrauenswürdige, generierte Daten)"""
+    static, factories = _model_defaults(model_cls)
+    fields_set = set(values)
+    for name, factory in factories.items():
+        if name not in values:
+            values[name] = factory()
+    if not _PYDANTIC_V2:
+        return model_cls.construct(_fields_set=fields_set, **values)
+
+    # Private Attribute, extra-Felder und ungeprüfte pydantic-Versionen
+    # bleiben model_construct überlassen
+    if (not _FAST_CONSTRUCT or model_cls.__private_attributes__
+            or model_cls.model_config.get("extra") == "allow"):
+        return model_cls.model_construct(_fields_set=fields_set, **values)
+
+    # Entspricht model_construct ohne die Schleife über alle Felder; nutzt die
+    # internen Attribute von pydantic 2.x (geprüft in test_construct_model_matches_pydantic)
+    model = model_cls.__new__(model_cls)
+    object.__setattr__(model, "__dict__", {**static, **values})
+    object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def build_model(model_cls, validate: bool, **values):
+    """Baut ein Modell mit (``validate=True``) oder ohne pydantic-Validierung"""
+    if validate:
+        return model_cls(**values)
+    return construct_model(model_cls, **values)
+
+
+def model_to_dict(model: BaseModel) -> Dict[str, Any]:
+    """Konvertiert ein Modell rekursiv in ein Dictionary"""
+    return model.model_dump() if _PYDANTIC_V2 else model.dict()
+
+
+def validate_model(model: BaseModel) -> BaseModel:
+    """Validiert ein (ggf. ohne Validierung gebautes) Modell vollständig nach
+
+    Wirft ``ValidationError``, falls die Daten nicht dem Schema entsprechen.
+    """
+    return type(model)(**model_to_dict(model))
+
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
 class LanguageRegion(str, Enum):
     DEUTSCHSCHWEIZ = "deutschschweiz"
     ROMANDIE = "romandie"
@@ -28,6 +110,18 @@ class EducationLevel(str, Enum):
     HOEHERE_BERUFSBILDUNG = "Höhere Berufsbildung"
 
 
+# Priorität der Bildungsstufen für den höchsten Abschluss; als str-Enum
+# funktionieren auch die Werte (z.B. "Gymnasium") als Schlüssel
+EDUCATION_PRIORITY: Dict[EducationLevel, int] = {
+    EducationLevel.UNIVERSITAET: 6,
+    EducationLevel.FACHHOCHSCHULE: 5,
+    EducationLevel.HOEHERE_BERUFSBILDUNG: 4,
+    EducationLevel.GYMNASIUM: 3,
+    EducationLevel.BERUFSLEHRE: 2,
+    EducationLevel.OBLIGATORISCH: 1
+}
+
+
 class PersonalInfo(BaseModel):
     """Persönliche Informationen einer Person"""
     first_name: str
@@ -109,11 +203,16 @@ class Persona(BaseModel):
     """Persona mit allen Grunddaten"""
     personal: PersonalInfo
     sector: str
-    sector_data: Dict[str, Any]
 
     class Config:
         arbitrary_types_allowed = True
 
+    @property
+    def sector_data(self) -> Mapping[str, Any]:
+        """Referenzdaten des Sektors (geteilt und read-only, aus dem Referenzkatalog)"""
+        from .data.catalog import get_catalog
+        return get_catalog().sector_data.get(self.sector, _EMPTY_MAPPING)
+
 
 class CV(BaseModel):
     """Vollständiger Lebenslauf"""
@@ -145,17 +244,7 @@ class CV(BaseModel):
         if not self.education:
             return "Keine Angabe"
 
-        # Sortiere nach Bildungslevel-Priorität
-        level_priority = {
-            EducationLevel.UNIVERSITAET: 6,
-            EducationLevel.FACHHOCHSCHULE: 5,
-            EducationLevel.HOEHERE_BERUFSBILDUNG: 4,
-            EducationLevel.GYMNASIUM: 3,
-            EducationLevel.BERUFSLEHRE: 2,
-            EducationLevel.OBLIGATORISCH: 1
-        }
-
-        highest = max(self.education, key=lambda x: level_priority.get(x.level, 0))
+        highest = max(self.education, key=lambda x: EDUCATION_PRIORITY.get(x.level, 0))
         return highest.level.value
 
     def to_dict(self) -> Dict[str, Any]:
@@ -0,0 +1,649 @@
+"""
+Lesen eigener Exporte: JSON, NDJSON, CSV und CV-Archive (``.cvb``)
+
+``load_cvs`` liest die Dateien gestreamt (auch gzip/xz/zstd-komprimiert) und
+liefert CV-Objekte, ``CVBatch``-Chunks oder - mit ``fields`` - nur die
+angeforderten flachen Felder, ohne Modelle zu bauen. ``accumulate_file``
+validiert beliebig grosse Dateien blockweise, optional in Worker-Prozessen;
+``sample_file`` zieht dafür eine Stichprobe für die Näherungsvalidierung.
+"""
+
+import ast
+import csv
+import json
+import math
+import os
+import random
+from collections import deque
+from datetime import datetime
+from io import BytesIO
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .data_models import (
+    CV, Persona, PersonalInfo, Education, Career, Skills,
+    Gender, LanguageRegion, EducationLevel, EDUCATION_PRIORITY, construct_model
+)
+from .utils.compression import COMPRESSION_SUFFIXES, compression_for, open_input
+from .utils.sinks import CSV_COLUMNS
+from .utils.validators import STRATIFIED_BYTES, VALIDATION_FIELDS, ValidationAccumulator
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Dateiendung -> Format
+LOAD_FORMATS = {".json": "json", ".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".cvb": "cvb"}
+
+# Projizierbare Felder: die flachen Spalten des CSV-Exports
+PROJECTION_FIELDS: List[str] = list(CSV_COLUMNS)
+
+# Blockgrösse beim gestreamten Lesen von JSON-Dokumenten
+_JSON_BLOCK_SIZE = 1 << 20
+
+# Blockgrösse (Bytes) pro Chunk bei der Validierung von CSV/NDJSON
+DEFAULT_VALIDATION_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Standard-Stichprobengrösse der Näherungsvalidierung
+DEFAULT_SAMPLE_SIZE = 10_000
+
+# pandas-Typen der CSV-Spalten für die Validierung
+VALIDATION_DTYPES = {
+    "gender": "category",
+    "language_region": "category",
+    "sector": "category",
+    "education_level": "category",
+    "age": "int16",
+}
+
+
+def detect_format(path: str) -> str:
+    """Format aus der Dateiendung, Kompressions-Endungen werden ignoriert"""
+    base, suffix = os.path.splitext(path.lower())
+    if suffix in COMPRESSION_SUFFIXES:
+        suffix = os.path.splitext(base)[1]
+    if suffix not in LOAD_FORMATS:
+        raise ValueError(f"Unbekanntes Eingabeformat: {path} (unterstützt: {', '.join(LOAD_FORMATS)})")
+    return LOAD_FORMATS[suffix]
+
+
+class _JSONStream:
+    """Liest Werte eines JSON-Dokuments blockweise mit ``raw_decode``"""
+
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, f, block_size: int = _JSON_BLOCK_SIZE):
+        self._file = f
+        self._block_size = block_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        block = self._file.read(self._block_size)
+        if not block:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + block
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Nächstes Zeichen ausser Leerraum ("" am Dateiende)"""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Ungültiges JSON: '{char}' erwartet an Position {self._pos}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Dekodiert den nächsten vollständigen Wert, lädt bei Bedarf nach"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Eine Zahl am Pufferende könnte im nächsten Block weitergehen
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        """Elemente eines Arrays einzeln"""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Ungültiges JSON: ',' oder ']' erwartet an Position {self._pos - 1}")
+
+
+def iter_json_records(f, metadata: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """CV-Datensätze aus einem ``export_json``-Dokument (oder einem reinen Array)
+
+    Nur das Array ``"cvs"`` wird elementweise gelesen; andere Felder (z.B.
+    ``"metadata"``) landen, falls übergeben, in ``metadata``.
+    """
+    stream = _JSONStream(f)
+    if stream.peek() == "[":
+        yield from stream.array()
+        return
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key == "cvs":
+            yield from stream.array()
+        else:
+            value = stream.value()
+            if metadata is not None:
+                metadata[key] = value
+        char = stream.peek()
+        stream._pos += 1
+        if char == "}":
+            return
+        if char != ",":
+            raise ValueError("Ungültiges JSON: ',' oder '}' erwartet")
+
+
+def iter_ndjson_records(f) -> Iterator[Dict[str, Any]]:
+    """CV-Datensätze aus JSON Lines (leere Zeilen werden übersprungen)"""
+    loads = json.loads
+    for line in f:
+        if line.strip():
+            yield loads(line)
+
+
+def cv_from_record(record: Dict[str, Any], validate: bool = False) -> CV:
+    """Baut einen CV aus einem exportierten JSON-Datensatz (``json_record``)
+
+    Ohne ``validate`` werden die Modelle ohne pydantic-Validierung gebaut.
+    """
+    if validate:
+        return CV(**record)
+
+    persona = record["persona"]
+    personal = dict(persona["personal"])
+    personal["gender"] = Gender(personal["gender"])
+    personal["language_region"] = LanguageRegion(personal["language_region"])
+
+    education = []
+    for entry in record["education"]:
+        entry = dict(entry)
+        entry["level"] = EducationLevel(entry["level"])
+        education.append(construct_model(Education, **entry))
+
+    generated_date = record.get("generated_date")
+    values = {}
+    if generated_date is not None:
+        values["generated_date"] = datetime.fromisoformat(generated_date)
+    return construct_model(
+        CV,
+        cv_id=record["cv_id"],
+        persona=construct_model(
+            Persona,
+            personal=construct_model(PersonalInfo, **personal),
+            sector=persona["sector"]
+        ),
+        education=education,
+        career=[construct_model(Career, **entry) for entry in record["career"]],
+        skills=construct_model(Skills, **record["skills"]),
+        hobbies=list(record.get("hobbies", [])),
+        **values
+    )
+
+
+def _education_level(record: Dict[str, Any]) -> str:
+    levels = [entry["level"] for entry in record["education"]]
+    if not levels:
+        return "Keine Angabe"
+    return max(levels, key=lambda level: EDUCATION_PRIORITY.get(level, 0))
+
+
+def _current_position(record: Dict[str, Any]) -> Optional[str]:
+    for entry in record["career"]:
+        if entry.get("end_year") is None:
+            return entry["position"]
+    return None
+
+
+def _personal(name: str) -> Callable[[Dict[str, Any]], Any]:
+    return lambda record: record["persona"]["personal"][name]
+
+
+# Feld -> Extraktor aus einem JSON-Datensatz (gleiche Werte wie ``csv_row``)
+RECORD_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "cv_id": lambda record: record["cv_id"],
+    "first_name": _personal("first_name"),
+    "last_name": _personal("last_name"),
+    "age": _personal("age"),
+    "gender": _personal("gender"),
+    "canton": _personal("canton"),
+    "city": _personal("city"),
+    "language_region": _personal("language_region"),
+    "sector": lambda record: record["persona"]["sector"],
+    "education_level": _education_level,
+    "total_experience": lambda record: sum(entry["duration_years"] for entry in record["career"]),
+    "current_position": _current_position,
+    "languages": lambda record: list(record["skills"]["languages"]),
+    "generated_date": lambda record: datetime.fromisoformat(record["generated_date"]).isoformat(),
+    "education_count": lambda record: len(record["education"]),
+    "career_positions": lambda record: len(record["career"]),
+    "language_count": lambda record: len(record["skills"]["languages"]),
+    "professional_skills_count": lambda record: len(record["skills"]["professional_skills"]),
+    "languages_list": lambda record: "; ".join(record["skills"]["languages"]),
+    "professional_skills_list": lambda record: "; ".join(record["skills"]["professional_skills"]),
+    "it_skills_list": lambda record: "; ".join(record["skills"]["it_skills"]),
+    "hobbies_list": lambda record: "; ".join(record.get("hobbies", [])),
+}
+
+# Typumwandlung der CSV-Spalten (alle übrigen bleiben Zeichenketten)
+_CSV_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "age": int,
+    "total_experience": int,
+    "education_count": int,
+    "career_positions": int,
+    "language_count": int,
+    "professional_skills_count": int,
+    "current_position": lambda value: value or None,
+    "languages": lambda value: ast.literal_eval(value) if value else [],
+}
+
+
+def _check_fields(fields: Sequence[str]) -> List[str]:
+    unknown = [name for name in fields if name not in PROJECTION_FIELDS]
+    if unknown:
+        raise ValueError(f"Unbekannte Felder: {', '.join(unknown)} "
+                         f"(verfügbar: {', '.join(PROJECTION_FIELDS)})")
+    return list(fields)
+
+
+def _iter_csv_rows(f, fields: List[str]) -> Iterator[Dict[str, Any]]:
+    """Typisierte CSV-Zeilen, nur die Spalten aus ``fields`` werden umgewandelt"""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    missing = [name for name in fields if name not in header]
+    if missing:
+        raise ValueError(f"Spalten fehlen in der CSV-Datei: {', '.join(missing)}")
+    selected = [(name, header.index(name), _CSV_CONVERTERS.get(name)) for name in fields]
+    for row in reader:
+        yield {name: convert(row[index]) if convert else row[index]
+               for name, index, convert in selected}
+
+
+def _chunked(items: Iterator[Any], chunk_size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _to_columns(rows: List[Dict[str, Any]], fields: List[str]) -> Dict[str, List[Any]]:
+    return {name: [row[name] for row in rows] for name in fields}
+
+
+def _iter_archive(path: str, fields: Optional[List[str]], columnar: bool,
+                  chunk_size: int) -> Iterator[Any]:
+    from .utils.archive import CVArchiveReader
+    from .utils.sinks import csv_row
+
+    with CVArchiveReader(path) as reader:
+        if fields is None:
+            if columnar:
+                yield from reader.iter_batches()
+            else:
+                yield from reader
+            return
+        rows = ({name: row[name] for name in fields} for row in map(csv_row, reader))
+        if columnar:
+            for chunk in _chunked(rows, chunk_size):
+                yield _to_columns(chunk, fields)
+        else:
+            yield from rows
+
+
+def load_cvs(path: str, format: Optional[str] = None, fields: Optional[Sequence[str]] = None,
+             columnar: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+             validate: bool = False, compression: Optional[str] = None) -> Iterator[Any]:
+    """Liest einen Export gestreamt zurück
+
+    ``format`` ("json", "ndjson", "csv", "cvb") und ``compression`` werden
+    sonst aus der Dateiendung abgeleitet. Geliefert werden:
+
+    - ohne ``fields``: ``CV``-Objekte bzw. mit ``columnar`` ``CVBatch``-Chunks
+      (CSV enthält keine vollständigen CVs und liefert alle flachen Spalten)
+    - mit ``fields`` (Namen aus ``PROJECTION_FIELDS``): Dictionaries nur mit
+      diesen Feldern bzw. mit ``columnar`` Chunks ``{Feld: Werte}``;
+      es werden keine Modelle gebaut
+
+    ``validate`` validiert CVs aus JSON/NDJSON mit pydantic.
+    """
+    format = format or detect_format(path)
+    if fields is not None:
+        fields = _check_fields(fields)
+    if chunk_size < 1:
+        raise ValueError("Chunk-Grösse muss mindestens 1 sein")
+
+    if format == "cvb":
+        yield from _iter_archive(path, fields, columnar, chunk_size)
+        return
+    if format not in ("json", "ndjson", "csv"):
+        raise ValueError(f"Unbekanntes Eingabeformat: {format}")
+
+    with open_input(path, compression) as f:
+        if format == "csv":
+            rows = _iter_csv_rows(f, fields if fields is not None else PROJECTION_FIELDS)
+            if columnar:
+                for chunk in _chunked(rows, chunk_size):
+                    yield _to_columns(chunk, fields if fields is not None else PROJECTION_FIELDS)
+            else:
+                yield from rows
+            return
+
+        records = iter_json_records(f) if format == "json" else iter_ndjson_records(f)
+        if fields is not None:
+            extractors = [(name, RECORD_FIELDS[name]) for name in fields]
+            rows = ({name: extract(record) for name, extract in extractors} for record in records)
+            if columnar:
+                for chunk in _chunked(rows, chunk_size):
+                    yield _to_columns(chunk, fields)
+            else:
+                yield from rows
+            return
+
+        cvs = (cv_from_record(record, validate) for record in records)
+        if not columnar:
+            yield from cvs
+            return
+
+        from .cv_batch import CVBatch, Vocabulary
+
+        vocab = Vocabulary()
+        for chunk in _chunked(cvs, chunk_size):
+            yield CVBatch.from_cvs(chunk, vocab)
+
+
+def iter_line_blocks(f, block_size: int = DEFAULT_VALIDATION_BLOCK_SIZE) -> Iterator[bytes]:
+    """Liest eine Binärdatei in Blöcken von etwa ``block_size``, geschnitten an Zeilenenden"""
+    rest = b""
+    while True:
+        data = f.read(block_size)
+        if not data:
+            break
+        data = rest + data
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            rest = data
+            continue
+        yield data[:cut]
+        rest = data[cut:]
+    if rest:
+        yield rest
+
+
+def _accumulate_csv_block(task: tuple) -> ValidationAccumulator:
+    """Worker-Task: CSV-Block (mit Kopfzeile) mit festen Typen einlesen und zählen"""
+    import pandas as pd
+
+    header, block = task
+    frame = pd.read_csv(BytesIO(header + block), usecols=VALIDATION_FIELDS,
+                        dtype=VALIDATION_DTYPES)
+    return ValidationAccumulator().update_columns(frame)
+
+
+def _accumulate_ndjson_block(block: bytes) -> ValidationAccumulator:
+    """Worker-Task: NDJSON-Block zählen, ohne Modelle zu bauen"""
+    loads = json.loads
+    records = [loads(line) for line in block.splitlines() if line.strip()]
+    return ValidationAccumulator().update_columns(
+        {name: [RECORD_FIELDS[name](record) for record in records] for name in VALIDATION_FIELDS}
+    )
+
+
+def _accumulate_archive_chunk(task: tuple) -> ValidationAccumulator:
+    """Worker-Task: einen Chunk eines CV-Archivs zählen"""
+    from .utils.archive import CVArchiveReader
+
+    path, index = task
+    with CVArchiveReader(path) as reader:
+        return ValidationAccumulator().update(reader.chunk(index))
+
+
+def accumulate_file(path: str, format: Optional[str] = None, workers: int = 1,
+                    block_size: int = DEFAULT_VALIDATION_BLOCK_SIZE,
+                    compression: Optional[str] = None) -> ValidationAccumulator:
+    """Zählt alle Validierungs-Metriken einer Datei mit beschränktem Speicherbedarf
+
+    CSV und NDJSON werden in Blöcken von ``block_size`` Bytes gelesen und bei
+    ``workers > 1`` in Worker-Prozessen geparst (höchstens ``2 * workers``
+    Blöcke gleichzeitig im Speicher); die Teil-Akkumulatoren werden
+    zusammengeführt. Zeilenumbrüche innerhalb von CSV-Feldern werden nicht
+    unterstützt. JSON-Dokumente werden im Hauptprozess gestreamt, Archive
+    chunkweise verteilt.
+    """
+    from .utils.exporters import _ordered_map
+
+    format = format or detect_format(path)
+    if block_size < 1:
+        raise ValueError("Blockgrösse muss mindestens 1 sein")
+    if workers < 1:
+        raise ValueError("Anzahl Worker muss mindestens 1 sein")
+    accumulator = ValidationAccumulator()
+
+    if format == "json":
+        for columns in load_cvs(path, format, fields=VALIDATION_FIELDS, columnar=True,
+                                compression=compression):
+            accumulator.update_columns(columns)
+        return accumulator
+
+    if format == "cvb":
+        from .utils.archive import CVArchiveReader
+
+        with CVArchiveReader(path) as reader:
+            tasks = [(path, index) for index in range(len(reader.chunk_sizes))]
+        for partial in _ordered_map(_accumulate_archive_chunk, tasks, workers):
+            accumulator.merge(partial)
+        return accumulator
+
+    if format not in ("csv", "ndjson"):
+        raise ValueError(f"Unbekanntes Eingabeformat: {format}")
+
+    with open_input(path, compression, binary=True) as f:
+        if format == "csv":
+            header = f.readline()
+            tasks = ((header, block) for block in iter_line_blocks(f, block_size))
+            function = _accumulate_csv_block
+        else:
+            tasks = iter_line_blocks(f, block_size)
+            function = _accumulate_ndjson_block
+        for partial in _ordered_map(function, tasks, workers):
+            accumulator.merge(partial)
+    return accumulator
+
+
+def reservoir_sample(items: Iterable[Any], size: int, rng: random.Random) -> Tuple[List[Any], int]:
+    """Gleichverteilte Stichprobe in einem Durchlauf (Reservoir, Algorithmus L)
+
+    Übersprungene Elemente werden nur weitergezählt, nicht angefasst.
+    Liefert (Stichprobe, Anzahl aller Elemente).
+    """
+    iterator = enumerate(items)
+    reservoir = [item for _, item in islice(iterator, size)]
+    if len(reservoir) < size:
+        return reservoir, len(reservoir)
+
+    seen = size
+    weight = math.exp(math.log(rng.random() or 5e-324) / size)
+    while True:
+        skip = int(math.log(rng.random() or 5e-324) / math.log1p(-weight)) if weight < 1.0 else 0
+        skipped = deque(islice(iterator, skip), maxlen=1)
+        if skipped:
+            seen = skipped[0][0] + 1
+        entry = next(iterator, None)
+        if entry is None:
+            return reservoir, seen
+        seen = entry[0] + 1
+        reservoir[rng.randrange(size)] = entry[1]
+        weight *= math.exp(math.log(rng.random() or 5e-324) / size)
+
+
+def _stratified_lines(f, start: int, end: int, size: int, rng: random.Random) -> List[bytes]:
+    """Je eine Zeile ab einer zufälligen Byte-Position in ``size`` gleich grossen Abschnitten
+
+    Gewählt wird die Zeile nach der getroffenen; ihre Wahrscheinlichkeit hängt
+    von der Länge der Vorgängerzeile ab, nicht von ihrem eigenen Inhalt.
+    """
+    lines = []
+    seen = set()
+    for stratum in range(size):
+        low = start + stratum * (end - start) // size
+        high = start + (stratum + 1) * (end - start) // size
+        offset = rng.randrange(low, high) if high > low else low
+        if offset > start:
+            f.seek(offset - 1)
+            f.readline()
+        else:
+            f.seek(start)
+        position = f.tell()
+        if position >= end or position in seen:
+            continue
+        seen.add(position)
+        line = f.readline()
+        if line.strip():
+            lines.append(line if line.endswith(b"\n") else line + b"\n")
+    return lines
+
+
+def _batch_validation_columns(batch, rows) -> Dict[str, List[Any]]:
+    """Validierungsfelder ausgewählter Zeilen eines ``CVBatch``"""
+    from .cv_batch import EDUCATION_LEVELS, GENDERS, LANGUAGE_REGIONS, MISSING
+
+    columns = batch.columns
+    levels = batch.highest_education_levels()[rows].tolist()
+    return {
+        "gender": [GENDERS[code].value for code in columns["gender"][rows].tolist()],
+        "language_region": [LANGUAGE_REGIONS[code].value
+                            for code in columns["language_region"][rows].tolist()],
+        "sector": [batch.vocab.decode(code) for code in columns["sector"][rows].tolist()],
+        "education_level": [EDUCATION_LEVELS[code].value if code != MISSING else "Keine Angabe"
+                            for code in levels],
+        "age": columns["age"][rows].tolist(),
+    }
+
+
+def _sample_archive(path: str, size: int, rng: random.Random) -> Tuple[ValidationAccumulator, int, str]:
+    import numpy as np
+    from .utils.archive import CVArchiveReader
+
+    accumulator = ValidationAccumulator()
+    with CVArchiveReader(path) as reader:
+        total = len(reader)
+        if size >= total:
+            for batch in reader.iter_batches():
+                accumulator.update(batch)
+            return accumulator, total, "vollständig"
+
+        # Geschichtet: eine zufällige Position pro Abschnitt, gelesen über mmap
+        positions = np.array([rng.randrange(i * total // size, (i + 1) * total // size)
+                              for i in range(size)], dtype=np.int64)
+        starts = np.concatenate([[0], np.cumsum(reader.chunk_sizes)])
+        chunk_indexes = np.searchsorted(starts, positions, side="right") - 1
+        for index in np.unique(chunk_indexes).tolist():
+            rows = positions[chunk_indexes == index] - starts[index]
+            accumulator.update_columns(_batch_validation_columns(reader.chunk(index), rows))
+    return accumulator, total, "geschichtet (Archiv-Positionen)"
+
+
+def sample_file(path: str, size: int = DEFAULT_SAMPLE_SIZE, format: Optional[str] = None,
+                seed: Optional[int] = None,
+                compression: Optional[str] = None) -> Tuple[ValidationAccumulator, Optional[int], str]:
+    """Zieht eine Stichprobe der Validierungsfelder und zählt sie
+
+    - ``.cvb``: geschichtet nach Position, nur die getroffenen Chunks werden gelesen
+    - unkomprimierte CSV/NDJSON: geschichtet nach Byte-Position per ``seek``;
+      die Laufzeit hängt nicht von der Dateigrösse ab, die Anzahl CVs wird
+      aus Dateigrösse und mittlerer Länge der gezogenen Zeilen geschätzt
+    - komprimierte Dateien und JSON-Dokumente: Reservoir in einem Durchlauf,
+      geparst werden nur die gezogenen Zeilen (JSON: alle Datensätze)
+
+    Kleine Dateien werden vollständig gelesen. Liefert (Akkumulator der
+    Stichprobe, Anzahl CVs der Datei (geschätzt bei ``STRATIFIED_BYTES``), Verfahren).
+    """
+    format = format or detect_format(path)
+    if size < 1:
+        raise ValueError("Stichprobengrösse muss mindestens 1 sein")
+    rng = random.Random(seed)
+
+    if format == "cvb":
+        return _sample_archive(path, size, rng)
+
+    if format == "json":
+        rows, total = reservoir_sample(load_cvs(path, format, fields=VALIDATION_FIELDS,
+                                                compression=compression), size, rng)
+        accumulator = ValidationAccumulator().update_columns(
+            {name: [row[name] for row in rows] for name in VALIDATION_FIELDS})
+        return accumulator, total, "vollständig" if total <= size else "Reservoir"
+
+    if format not in ("csv", "ndjson"):
+        raise ValueError(f"Unbekanntes Eingabeformat: {format}")
+
+    seekable = compression_for(path, compression) is None
+    with open_input(path, compression, binary=True) as f:
+        header = f.readline() if format == "csv" else b""
+        if format == "csv" and not header.endswith(b"\n"):
+            header += b"\n"
+        start = f.tell() if seekable else 0
+        total = None
+        method = STRATIFIED_BYTES
+        if seekable:
+            # Kleine Dateien (geschätzt höchstens 2 * size Zeilen) vollständig
+            end = os.fstat(f.fileno()).st_size
+            probe = f.read(64 * 1024)
+            line_length = len(probe) / max(probe.count(b"\n"), 1)
+            seekable = (end - start) / max(line_length, 1) > 2 * size
+            f.seek(start)
+        if seekable:
+            lines = _stratified_lines(f, start, end, size, rng)
+            # Die Länge der gezogenen Zeile ist unabhängig von ihrer Ziehwahrscheinlichkeit
+            sampled_bytes = sum(len(line) for line in lines)
+            if sampled_bytes:
+                total = max(round((end - start) * len(lines) / sampled_bytes), len(lines))
+        else:
+            lines, total = reservoir_sample(f, size, rng)
+            lines = [line if line.endswith(b"\n") else line + b"\n" for line in lines]
+            method = "vollständig" if total <= size else "Reservoir"
+
+    if format == "csv":
+        accumulator = _accumulate_csv_block((header, b"".join(lines)))
+    else:
+        accumulator = _accumulate_ndjson_block(b"".join(lines))
+    return accumulator, total, method
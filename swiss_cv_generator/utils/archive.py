@@ -0,0 +1,478 @@
+"""
+Kompaktes binäres Archivformat für CV-Korpora (``.cvb``)
+
+Aufbau (little-endian)::
+
+    Header      MAGIC, Format-Version, reserviert
+    Chunk 1..n  Anzahl CVs, Breite der cv_id, Einträge pro Listengruppe,
+                danach die Spalten eines ``CVBatch`` als Arrays fester Breite
+                (auf 8 Byte ausgerichtet), Listengruppen als Offset-Array plus Werte
+    Footer      Vokabular (einmal für die ganze Datei), Metadaten (JSON),
+                Chunk-Verzeichnis (Datei-Offset und Anzahl CVs pro Chunk),
+                ab Version 2 ein Hash-Index cv_id -> Position
+    Trailer     Footer-Offset, Anzahl CVs, MAGIC, Format-Version
+
+Zeichenketten stehen nur im Vokabular, die Spalten enthalten Integer-Codes.
+Das Vokabular wird erst im Footer geschrieben, weil es beim Schreiben wächst.
+Der Reader bildet die Datei per ``mmap`` ab; Chunks und Index werden direkt
+aus der Abbildung gelesen, mehrere Prozesse teilen sich dieselben Seiten.
+"""
+
+import bisect
+import json
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from ..data_models import CV
+
+if TYPE_CHECKING:
+    from ..cv_batch import CVBatch
+
+# NumPy wird erst beim Lesen/Schreiben importiert
+
+MAGIC = b"SCVB"
+FORMAT_VERSION = 2
+# Version 1 hat keinen cv_id-Index; er wird beim ersten Zugriff aufgebaut
+SUPPORTED_VERSIONS = (1, 2)
+
+_HEADER = struct.Struct("<4sHHQ")
+_TRAILER = struct.Struct("<QQ4sHH")
+_ALIGNMENT = 8
+
+# Offsets innerhalb eines Chunks passen in 32 Bit
+_OFFSET_DTYPE = "<i4"
+
+# Anzahl dekodierter Chunks, die der Reader für wiederholte Zugriffe vorhält
+CHUNK_CACHE_SIZE = 8
+
+
+def _list_groups():
+    from ..cv_batch import LIST_COLUMNS
+
+    return list(LIST_COLUMNS)
+
+
+def _padding(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+def _chunk_header() -> struct.Struct:
+    """Chunk-Kopf: Anzahl CVs, Breite der cv_id, Einträge pro Listengruppe"""
+    return struct.Struct(f"<II{len(_list_groups())}I")
+
+
+_LAYOUT: List[Tuple[str, Any, Optional[str]]] = []
+
+
+def _chunk_layout() -> List[Tuple[str, Any, Optional[str]]]:
+    """(Spalte, Datentyp auf Platte, Längenquelle) in Schreibreihenfolge, einmal berechnet
+
+    Längenquelle ``None`` steht für die Anzahl CVs, sonst für die Anzahl
+    Einträge der genannten Gruppe; Offset-Arrays haben einen Eintrag mehr.
+    """
+    if not _LAYOUT:
+        import numpy as np
+        from ..cv_batch import CV_COLUMNS, LIST_COLUMNS, NESTED_GROUPS
+
+        def little_endian(dtype: str):
+            return np.dtype(dtype).newbyteorder("<")
+
+        for name, dtype in CV_COLUMNS.items():
+            if name == "cv_id":
+                # Breite pro Chunk variabel, siehe _chunk_arrays
+                _LAYOUT.append((name, None, None))
+            elif name == "generated_date":
+                _LAYOUT.append((name, little_endian("int64"), None))
+            else:
+                _LAYOUT.append((name, little_endian(dtype), None))
+        for group, group_columns in LIST_COLUMNS.items():
+            _LAYOUT.append((f"{group}_offsets", little_endian(_OFFSET_DTYPE), NESTED_GROUPS.get(group)))
+            for name, dtype in group_columns.items():
+                _LAYOUT.append((name, little_endian(dtype), group))
+    return _LAYOUT
+
+
+def _chunk_arrays(size: int, id_width: int, entries: Dict[str, int]) -> List[Tuple[str, Any, int]]:
+    """(Spalte, Datentyp auf Platte, Anzahl Elemente) in Schreibreihenfolge"""
+    import numpy as np
+
+    arrays = []
+    for name, dtype, source in _chunk_layout():
+        if dtype is None:
+            arrays.append((name, np.dtype(f"S{id_width}"), size))
+        elif name.endswith("_offsets"):
+            arrays.append((name, dtype, (entries[source] if source else size) + 1))
+        else:
+            arrays.append((name, dtype, entries[source] if source else size))
+    return arrays
+
+
+def encode_chunk(batch) -> bytes:
+    """Serialisiert einen ``CVBatch`` (Codes im Vokabular des Archivs) als Chunk"""
+    import numpy as np
+
+    size = len(batch)
+    cv_ids = batch.columns["cv_id"].astype("S")
+    id_width = max(cv_ids.dtype.itemsize, 1)
+
+    columns: Dict[str, Any] = {name: batch.columns[name] for name in batch.columns}
+    columns["cv_id"] = cv_ids
+    columns["generated_date"] = batch.columns["generated_date"].astype("datetime64[us]").view("int64")
+    entries = {}
+    for group in _list_groups():
+        offsets, values = batch.list_column(group)
+        entries[group] = int(offsets[-1])
+        columns[f"{group}_offsets"] = offsets
+        columns.update(values)
+
+    parts = [_chunk_header().pack(size, id_width, *(entries[group] for group in _list_groups()))]
+    parts.append(b"\0" * _padding(len(parts[0])))
+    for name, dtype, count in _chunk_arrays(size, id_width, entries):
+        data = np.ascontiguousarray(columns[name], dtype=dtype).tobytes()
+        parts.append(data)
+        parts.append(b"\0" * _padding(len(data)))
+    return b"".join(parts)
+
+
+def cv_id_hashes(cv_ids: Iterable[str]):
+    """Stabiler 32-Bit-Hash (CRC32 über UTF-8) pro cv_id"""
+    import numpy as np
+
+    return np.fromiter((zlib.crc32(cv_id.encode("utf-8")) for cv_id in cv_ids), dtype=np.uint32)
+
+
+def build_id_index(hashes) -> Tuple[Any, Any]:
+    """Hash-Index als (Bucket-Offsets, Positionen je Bucket), Bucket = Hash & (B - 1)
+
+    Mit B >= Anzahl CVs (Zweierpotenz) enthält ein Bucket im Mittel
+    höchstens einen Eintrag; die Suche ist damit O(1).
+    """
+    import numpy as np
+
+    bucket_count = 1 << max(int(len(hashes)) - 1, 0).bit_length()
+    buckets = hashes & np.uint32(bucket_count - 1)
+    positions = np.argsort(buckets, kind="stable").astype("<u8")
+    offsets = np.zeros(bucket_count + 1, dtype="<u8")
+    np.cumsum(np.bincount(buckets, minlength=bucket_count), out=offsets[1:])
+    return offsets, positions
+
+
+def _decode_ids(cv_ids):
+    """Bytes-cv_ids -> Unicode-Array; reines ASCII direkt über UCS4-Erweiterung (~20x schneller)"""
+    import numpy as np
+
+    raw = cv_ids.view(np.uint8)
+    if raw.max(initial=0) < 128:
+        return raw.astype(np.uint32).view(f"<U{cv_ids.dtype.itemsize}")
+    return np.char.decode(cv_ids, "utf-8")
+
+
+def decode_chunk(buffer, offset: int, vocab) -> "CVBatch":
+    """Liest einen Chunk ab ``offset`` aus ``buffer`` (bytes oder mmap)
+
+    Die Arrays sind Sichten auf ``buffer`` (ohne Kopie); nur die cv_id wird
+    in Unicode umgewandelt.
+    """
+    import numpy as np
+    from ..cv_batch import CVBatch
+
+    header = _chunk_header()
+    size, id_width, *counts = header.unpack_from(buffer, offset)
+    entries = dict(zip(_list_groups(), counts))
+    position = offset + header.size + _padding(header.size)
+
+    columns = {}
+    for name, dtype, count in _chunk_arrays(size, id_width, entries):
+        array = np.frombuffer(buffer, dtype=dtype, count=count, offset=position)
+        position += array.nbytes + _padding(array.nbytes)
+        columns[name] = array
+    columns["cv_id"] = _decode_ids(columns["cv_id"])
+    columns["generated_date"] = columns["generated_date"].astype("int64", copy=False).view("datetime64[us]")
+    return CVBatch(columns, vocab)
+
+
+def _encode_footer(vocab_values: List[str], metadata: Dict[str, Any],
+                   chunk_offsets: List[int], chunk_sizes: List[int], id_index) -> bytes:
+    import numpy as np
+
+    bucket_offsets, positions = id_index
+    encoded = [value.encode("utf-8") for value in vocab_values]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(value) for value in encoded], out=string_offsets[1:])
+    meta = json.dumps(metadata, ensure_ascii=False, default=str).encode("utf-8")
+    return b"".join([
+        struct.pack("<Q", len(encoded)), string_offsets.tobytes(), b"".join(encoded),
+        struct.pack("<Q", len(meta)), meta,
+        struct.pack("<Q", len(chunk_offsets)),
+        np.asarray(chunk_offsets, dtype="<u8").tobytes(),
+        np.asarray(chunk_sizes, dtype="<u8").tobytes(),
+        struct.pack("<Q", len(bucket_offsets) - 1), bucket_offsets.tobytes(), positions.tobytes(),
+    ])
+
+
+def _decode_footer(buffer, offset: int, version: int, total: int):
+    import numpy as np
+
+    (vocab_size,) = struct.unpack_from("<Q", buffer, offset)
+    offset += 8
+    string_offsets = np.frombuffer(buffer, dtype="<u8", count=vocab_size + 1, offset=offset).tolist()
+    offset += 8 * (vocab_size + 1)
+    blob = bytes(buffer[offset:offset + string_offsets[-1]])
+    offset += string_offsets[-1]
+    vocab_values = [blob[start:stop].decode("utf-8")
+                    for start, stop in zip(string_offsets, string_offsets[1:])]
+
+    (meta_size,) = struct.unpack_from("<Q", buffer, offset)
+    offset += 8
+    metadata = json.loads(bytes(buffer[offset:offset + meta_size]).decode("utf-8"))
+    offset += meta_size
+
+    (chunk_count,) = struct.unpack_from("<Q", buffer, offset)
+    offset += 8
+    chunk_offsets = np.frombuffer(buffer, dtype="<u8", count=chunk_count, offset=offset).tolist()
+    offset += 8 * chunk_count
+    chunk_sizes = np.frombuffer(buffer, dtype="<u8", count=chunk_count, offset=offset).tolist()
+    offset += 8 * chunk_count
+
+    id_index = None
+    if version >= 2:
+        (bucket_count,) = struct.unpack_from("<Q", buffer, offset)
+        offset += 8
+        bucket_offsets = np.frombuffer(buffer, dtype="<u8", count=bucket_count + 1, offset=offset)
+        offset += 8 * (bucket_count + 1)
+        id_index = (bucket_offsets, np.frombuffer(buffer, dtype="<u8", count=total, offset=offset))
+    return vocab_values, metadata, chunk_offsets, chunk_sizes, id_index
+
+
+class CVArchiveWriter:
+    """Schreibt Chunks (Listen von CVs oder ``CVBatch``) in ein ``.cvb``-Archiv
+
+    Alle Chunks werden auf ein gemeinsames Vokabular umkodiert, das beim
+    Schliessen zusammen mit den Metadaten und dem Chunk-Verzeichnis im
+    Footer landet.
+    """
+
+    def __init__(self, filename: str):
+        from ..cv_batch import Vocabulary
+
+        self.filename = filename
+        self.vocab = Vocabulary()
+        self.count = 0
+        self._file = open(filename, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0))
+        self._position = _HEADER.size
+        self._chunk_offsets: List[int] = []
+        self._chunk_sizes: List[int] = []
+        self._hashes: List[Any] = []
+
+    def encode(self, chunk) -> Tuple[bytes, Any]:
+        """Kodiert einen Chunk im Archiv-Vokabular (nicht threadsicher, in Reihenfolge aufrufen)"""
+        from ..cv_batch import CVBatch
+        from .lazy import is_cv_batch
+
+        if is_cv_batch(chunk):
+            batch = chunk if chunk.vocab is self.vocab else chunk.recode(self.vocab)
+        else:
+            batch = CVBatch.from_cvs([chunk] if isinstance(chunk, CV) else chunk, self.vocab)
+        return encode_chunk(batch), cv_id_hashes(batch.columns["cv_id"].tolist())
+
+    def write_encoded(self, payload: Tuple[bytes, Any], count: int) -> None:
+        if count == 0:
+            return
+        data, hashes = payload
+        self._file.write(data)
+        self._hashes.append(hashes)
+        self._chunk_offsets.append(self._position)
+        self._chunk_sizes.append(count)
+        self._position += len(data)
+        self.count += count
+
+    def close(self, metadata: Optional[Dict[str, Any]] = None) -> None:
+        if self._file.closed:
+            return
+        import numpy as np
+
+        try:
+            hashes = np.concatenate(self._hashes) if self._hashes else np.zeros(0, dtype=np.uint32)
+            footer = _encode_footer(self.vocab.values, metadata or {}, self._chunk_offsets,
+                                    self._chunk_sizes, build_id_index(hashes))
+            self._file.write(footer)
+            self._file.write(_TRAILER.pack(self._position, self.count, MAGIC, FORMAT_VERSION, 0))
+        finally:
+            self._file.close()
+
+
+class CVArchiveReader:
+    """Liest ein ``.cvb``-Archiv über eine schreibgeschützte Speicherabbildung
+
+    Neben dem sequentiellen Lesen (Chunks als ``CVBatch`` oder CV-Objekte)
+    gibt es wahlfreien Zugriff: ``reader[i]`` bzw. ``reader.get(cv_id)`` in
+    O(1) und ``reader[start:stop]`` als ``CVBatch``, das innerhalb eines
+    Chunks ohne Kopie auf die Abbildung zeigt. Der Reader lässt sich an
+    Worker-Prozesse übergeben; diese bilden die Datei selbst ab.
+    """
+
+    def __init__(self, filename: str):
+        from ..cv_batch import Vocabulary
+
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            size = f.seek(0, 2)
+            if size < _HEADER.size + _TRAILER.size:
+                raise ValueError(f"Keine gültige CV-Archivdatei: {filename}")
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = self._buffer
+        magic, version, _, _ = _HEADER.unpack_from(buffer, 0)
+        footer_offset, total, end_magic, _, _ = _TRAILER.unpack_from(buffer, size - _TRAILER.size)
+        if magic != MAGIC or end_magic != MAGIC:
+            raise ValueError(f"Keine gültige CV-Archivdatei: {filename}")
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Nicht unterstützte Archiv-Version {version} (erwartet {FORMAT_VERSION})")
+
+        vocab_values, self.metadata, self.chunk_offsets, self.chunk_sizes, self._id_index = (
+            _decode_footer(buffer, footer_offset, version, total)
+        )
+        self.vocab = Vocabulary(vocab_values)
+        self.version = version
+        self._total = total
+        # Position des ersten CVs pro Chunk
+        self._chunk_starts = [0]
+        for chunk_size in self.chunk_sizes[:-1]:
+            self._chunk_starts.append(self._chunk_starts[-1] + chunk_size)
+        self._cache: "OrderedDict[int, CVBatch]" = OrderedDict()
+
+    def __reduce__(self):
+        # Mappings lassen sich nicht picklen: Worker öffnen die Datei neu
+        return (type(self), (self.filename,))
+
+    def __len__(self) -> int:
+        return self._total
+
+    def chunk(self, index: int) -> "CVBatch":
+        """Chunk ``index`` als ``CVBatch`` (Sicht auf die Abbildung, zwischengespeichert)"""
+        batch = self._cache.get(index)
+        if batch is None:
+            batch = decode_chunk(self._buffer, self.chunk_offsets[index], self.vocab)
+            self._cache[index] = batch
+            if len(self._cache) > CHUNK_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(index)
+        return batch
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """(Chunk-Index, Position im Chunk) einer globalen Position"""
+        if position < 0:
+            position += self._total
+        if not 0 <= position < self._total:
+            raise IndexError("CV-Index ausserhalb des Archivs")
+        index = bisect.bisect_right(self._chunk_starts, position) - 1
+        return index, position - self._chunk_starts[index]
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._total)
+            if step != 1:
+                raise ValueError("Nur zusammenhängende Slices werden unterstützt")
+            return self.slice(start, stop)
+        index, local = self._locate(key)
+        return self.chunk(index)[local]
+
+    def slice(self, start: int, stop: int) -> "CVBatch":
+        """CVs ``start`` bis ``stop`` als ``CVBatch``
+
+        Liegt der Bereich in einem Chunk, zeigt das Ergebnis ohne Kopie auf
+        die Abbildung; über Chunk-Grenzen hinweg werden die Teile zusammengefügt.
+        """
+        from ..cv_batch import CVBatch
+
+        stop = min(max(start, stop), self._total)
+        if start >= stop:
+            return CVBatch.from_cvs([], self.vocab)
+        first, first_local = self._locate(start)
+        last, last_local = self._locate(stop - 1)
+        if first == last:
+            return self.chunk(first)[first_local:last_local + 1]
+        parts = [self.chunk(first)[first_local:]]
+        parts.extend(self.chunk(index) for index in range(first + 1, last))
+        parts.append(self.chunk(last)[:last_local + 1])
+        return CVBatch.concat(parts)
+
+    def cv_id_at(self, position: int) -> str:
+        """cv_id an einer Position, direkt aus der Abbildung (ohne den Chunk zu dekodieren)"""
+        index, local = self._locate(position)
+        # cv_id ist die erste Spalte nach dem Chunk-Kopf
+        header = _chunk_header()
+        offset = self.chunk_offsets[index]
+        _, id_width = struct.unpack_from("<II", self._buffer, offset)
+        start = offset + header.size + _padding(header.size) + local * id_width
+        return self._buffer[start:start + id_width].rstrip(b"\0").decode("utf-8")
+
+    def _ensure_id_index(self):
+        if self._id_index is None:
+            import numpy as np
+
+            # Version 1: Index einmalig aus den cv_id-Spalten aufbauen
+            hashes = [cv_id_hashes(self.chunk(index).columns["cv_id"].tolist())
+                      for index in range(len(self.chunk_offsets))]
+            self._id_index = build_id_index(
+                np.concatenate(hashes) if hashes else np.zeros(0, dtype=np.uint32)
+            )
+        return self._id_index
+
+    def positions_of(self, cv_id: str) -> List[int]:
+        """Alle Positionen mit dieser cv_id (cv_ids sind nicht garantiert eindeutig)"""
+        bucket_offsets, positions = self._ensure_id_index()
+        bucket_count = len(bucket_offsets) - 1
+        bucket = zlib.crc32(cv_id.encode("utf-8")) & (bucket_count - 1)
+        candidates = positions[int(bucket_offsets[bucket]):int(bucket_offsets[bucket + 1])].tolist()
+        return [position for position in candidates if self.cv_id_at(position) == cv_id]
+
+    def get(self, cv_id: str) -> CV:
+        """Erster CV mit dieser cv_id; ``KeyError``, falls nicht vorhanden"""
+        positions = self.positions_of(cv_id)
+        if not positions:
+            raise KeyError(cv_id)
+        return self[positions[0]]
+
+    def iter_batches(self) -> Iterator["CVBatch"]:
+        """Liefert die Chunks als ``CVBatch`` mit gemeinsamem Vokabular"""
+        for offset in self.chunk_offsets:
+            yield decode_chunk(self._buffer, offset, self.vocab)
+
+    def __iter__(self) -> Iterator[CV]:
+        for batch in self.iter_batches():
+            yield from batch
+
+    def read_batch(self) -> "CVBatch":
+        """Das ganze Archiv als ein ``CVBatch`` (Kopie, unabhängig von der Abbildung)"""
+        from ..cv_batch import CVBatch
+
+        batches = list(self.iter_batches())
+        return CVBatch.concat(batches) if batches else CVBatch.from_cvs([], self.vocab)
+
+    def close(self) -> None:
+        """Gibt die Abbildung frei, sobald keine Sichten mehr darauf zeigen"""
+        self._cache.clear()
+        self._id_index = None
+        try:
+            self._buffer.close()
+        except BufferError:
+            # Noch referenzierte Arrays halten die Abbildung am Leben
+            pass
+
+    def __enter__(self) -> "CVArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_archive(filename: str, columnar: bool = False) -> Union[List[CV], "CVBatch"]:
+    """Liest ein ``.cvb``-Archiv als Liste von CVs oder (``columnar=True``) als ``CVBatch``"""
+    with CVArchiveReader(filename) as reader:
+        return reader.read_batch() if columnar else list(reader)
@@ -0,0 +1,168 @@
+"""
+Transparente Kompression der Export-Dateien (gzip, xz, zstd)
+
+Die Kompression wird über die Dateiendung oder explizit gewählt. Mit
+``threads > 1`` wird blockweise parallel komprimiert: jeder Block wird zu
+einem eigenständigen gzip-Member bzw. xz-/zstd-Frame, die aneinandergehängt
+eine gültige Datei ergeben (wie bei ``pigz``).
+"""
+
+import io
+import os
+from collections import deque
+from typing import Callable, Optional
+
+COMPRESSIONS = ("gzip", "xz", "zstd")
+
+# Dateiendung -> Kompression
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".xz": "xz", ".zst": "zstd"}
+SUFFIX_BY_COMPRESSION = {compression: suffix for suffix, compression in COMPRESSION_SUFFIXES.items()}
+
+# Standard-Kompressionsstufen: gzip und zstd mit schnellen Stufen, xz mit dem
+# üblichen Preset (deutlich langsamer, dafür ~30% kleiner als gzip)
+DEFAULT_LEVELS = {"gzip": 6, "xz": 6, "zstd": 3}
+
+# Blockgrösse der parallelen Kompression (unkomprimiert)
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+def compression_for(filename: str, compression: Optional[str] = None) -> Optional[str]:
+    """Kompression für eine Datei: explizit angegeben oder aus der Endung abgeleitet
+
+    ``"none"`` schaltet die Kompression auch bei passender Endung ab.
+    """
+    if compression == "none":
+        return None
+    if compression is not None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unbekannte Kompression: {compression}")
+        return compression
+    return COMPRESSION_SUFFIXES.get(os.path.splitext(filename)[1].lower())
+
+
+def _import_zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd-Kompression benötigt zstandard: pip install swiss-cv-generator[zstd]"
+        ) from e
+    return zstandard
+
+
+def _block_compressor(compression: str, level: int) -> Callable[[bytes], bytes]:
+    """Funktion, die einen Block in ein eigenständiges Member/Frame komprimiert"""
+    if compression == "gzip":
+        import gzip
+        return lambda block: gzip.compress(block, compresslevel=level, mtime=0)
+    if compression == "xz":
+        import lzma
+        return lambda block: lzma.compress(block, preset=level)
+    zstandard = _import_zstd()
+    compressor = zstandard.ZstdCompressor(level=level)
+    return compressor.compress
+
+
+class BlockCompressedWriter(io.BufferedIOBase):
+    """Binärer Writer, der Blöcke in einem Thread-Pool komprimiert
+
+    zlib, lzma und zstd geben während der Kompression den GIL frei, die
+    Blöcke werden also tatsächlich parallel komprimiert. Höchstens
+    ``2 * threads`` Blöcke sind gleichzeitig in Arbeit; die Ausgabe erfolgt
+    in Eingabereihenfolge.
+    """
+
+    def __init__(self, raw, compress: Callable[[bytes], bytes], threads: int,
+                 block_size: Optional[int] = None):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._raw = raw
+        self._compress = compress
+        self._block_size = block_size or DEFAULT_BLOCK_SIZE
+        self._buffer = bytearray()
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        self._pending = deque()
+        self._max_pending = 2 * threads
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[:self._block_size]))
+            del self._buffer[:self._block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) >= self._max_pending:
+            self._raw.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._raw.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            self._raw.close()
+            super().close()
+
+
+def open_output(filename: str, compression: Optional[str] = None, threads: int = 1,
+                level: Optional[int] = None):
+    """Öffnet eine Ausgabedatei im Textmodus, bei Bedarf komprimiert
+
+    ``compression=None`` leitet die Kompression aus der Dateiendung ab
+    (``.gz``, ``.xz``, ``.zst``). Mit ``threads > 1`` wird blockweise
+    parallel komprimiert.
+    """
+    if threads < 1:
+        raise ValueError("Anzahl Kompressions-Threads muss mindestens 1 sein")
+    compression = compression_for(filename, compression)
+    if compression is None:
+        return open(filename, 'w', encoding='utf-8', newline='')
+
+    level = DEFAULT_LEVELS[compression] if level is None else level
+    if threads > 1:
+        binary = BlockCompressedWriter(open(filename, 'wb'), _block_compressor(compression, level),
+                                       threads)
+    elif compression == "gzip":
+        import gzip
+        binary = gzip.open(filename, 'wb', compresslevel=level)
+    elif compression == "xz":
+        import lzma
+        binary = lzma.open(filename, 'wb', preset=level)
+    else:
+        binary = _import_zstd().ZstdCompressor(level=level).stream_writer(open(filename, 'wb'))
+    return io.TextIOWrapper(binary, encoding='utf-8', newline='')
+
+
+def open_input(filename: str, compression: Optional[str] = None, binary: bool = False):
+    """Öffnet eine (ggf. komprimierte) Eingabedatei im Text- oder Binärmodus
+
+    Auch mehrteilige Dateien aus der parallelen Kompression werden gelesen,
+    da gzip, xz und zstd aneinandergehängte Member/Frames unterstützen.
+    """
+    compression = compression_for(filename, compression)
+    if compression is None:
+        if binary:
+            return open(filename, 'rb')
+        return open(filename, 'r', encoding='utf-8', newline='')
+    if compression == "gzip":
+        import gzip
+        raw = gzip.open(filename, 'rb')
+    elif compression == "xz":
+        import lzma
+        raw = lzma.open(filename, 'rb')
+    else:
+        raw = _import_zstd().ZstdDecompressor().stream_reader(open(filename, 'rb'),
+                                                              read_across_frames=True)
+    if binary:
+        return raw
+    return io.TextIOWrapper(raw, encoding='utf-8', newline='')
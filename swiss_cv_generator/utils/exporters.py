@@ -2,239 +2,352 @@
 Export-Utilities für verschiedene Ausgabeformate
 """
 
-import json
-import csv
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-import pandas as pd
+from collections import deque
+from itertools import chain
+from typing import List, Any, Optional, Sequence, Union, Iterator, Iterable, TYPE_CHECKING
 from ..data_models import CV
+from .lazy import is_cv_batch
+
+if TYPE_CHECKING:
+    from ..cv_batch import CVBatch
+    from .pipeline import PipelineStats
+
+# pandas, NumPy und openpyxl werden erst beim jeweiligen Export importiert
+
+# Exporter akzeptieren Listen von CVs ebenso wie spaltenorientierte Batches
+CVCollection = Union[List[CV], "CVBatch"]
+
+# Feste Chunk-Grösse für die Seed-Ableitung: das Ergebnis hängt nur von
+# (Seed, Anzahl, Chunk-Grösse) ab, nicht von der Anzahl Worker
+DEFAULT_CHUNK_SIZE = 1000
+
+# Maximale Anzahl Chunks pro Queue im Pipeline-Export
+DEFAULT_QUEUE_SIZE = 4
+
+
+def iter_cv_stream(source: Iterable) -> Iterator[CV]:
+    """Flacht einen Strom aus CVs und/oder Chunks (Listen, ``CVBatch``) zu einzelnen CVs ab"""
+    for item in source:
+        if isinstance(item, list) or is_cv_batch(item):
+            yield from item
+        else:
+            yield item
+
+
+def derive_chunk_seeds(seed: Optional[int], chunk_count: int) -> List[int]:
+    """Leitet unabhängige Seed-Streams pro Chunk aus einem Basis-Seed ab"""
+    import numpy as np
+
+    children = np.random.SeedSequence(seed).spawn(chunk_count)
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+
+def _generate_chunk(task) -> CVCollection:
+    """Erzeugt einen Chunk in einem Worker-Prozess mit eigenem Generator"""
+    generator_class, options, seed, count, columnar = task
+    generator = generator_class(random_seed=seed, **options)
+    return generator.generate_batch(count, columnar=columnar)
+
+
+def _render_chunk(task) -> List[tuple]:
+    """Erzeugt und rendert einen Chunk in einem Worker-Prozess; liefert (cv_id, Dokument)"""
+    from .renderer import render_cvs
+
+    generator_class, options, seed, count, format = task
+    generator = generator_class(random_seed=seed, **options)
+    return render_cvs(generator.generate_batch(count), format)
+
+
+def _check_parallelism(workers: int, chunk_size: int) -> None:
+    """Prüft Worker-Anzahl und Chunk-Grösse, bevor Arbeit verteilt wird"""
+    if workers < 1:
+        raise ValueError("Anzahl Worker muss mindestens 1 sein")
+    if chunk_size < 1:
+        raise ValueError("Chunk-Grösse muss mindestens 1 sein")
+
+
+def _ordered_map(function, tasks: Iterable, workers: int) -> Iterator:
+    """Wendet ``function`` auf die Tasks an, bei ``workers > 1`` in einem Prozess-Pool
+
+    Die Ergebnisse kommen in Task-Reihenfolge; höchstens ``2 * workers``
+    Tasks sind gleichzeitig in Arbeit.
+    """
+    if workers <= 1:
+        for task in tasks:
+            yield function(task)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(function, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 class BatchGenerator:
     """Batch-Generierung und Export von CVs"""
 
+    # Format -> (Export-Methode, Dateiendung)
+    FORMATS = {
+        "csv": ("export_csv", "csv"),
+        "json": ("export_json", "json"),
+        "ndjson": ("export_ndjson", "ndjson"),
+        "parquet": ("export_parquet", "parquet"),
+        "excel": ("export_excel", "xlsx"),
+        "sqlite": ("export_sqlite", "sqlite"),
+        "cvb": ("export_cvb", "cvb"),
+    }
+
     def __init__(self, cv_generator):
         self.cv_generator = cv_generator
 
-    def generate_batch(self, count: int) -> List[CV]:
-        """Generiert eine Batch von CVs"""
-        return self.cv_generator.generate_batch(count)
-
-    def export_csv(self, cvs: List[CV], filename: str) -> str:
-        """Exportiert CVs als CSV"""
-        if not cvs:
-            raise ValueError("Keine CVs zum Exportieren")
-
-        # Konvertiere zu flacher Datenstruktur
-        data = []
-        for cv in cvs:
-            row = cv.to_dict()
-
-            # Zusätzliche berechnete Felder
-            row.update({
-                "education_count": len(cv.education),
-                "career_positions": len(cv.career),
-                "language_count": len(cv.skills.languages),
-                "professional_skills_count": len(cv.skills.professional_skills),
-                "languages_list": "; ".join(cv.skills.languages.keys()),
-                "professional_skills_list": "; ".join(cv.skills.professional_skills),
-                "it_skills_list": "; ".join(cv.skills.it_skills),
-                "hobbies_list": "; ".join(cv.hobbies)
-            })
-
-            data.append(row)
-
-        # Zu Pandas DataFrame und CSV exportieren
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False, encoding='utf-8')
-
-        return f"Erfolgreich {len(cvs)} CVs nach {filename} exportiert"
-
-    def export_json(self, cvs: List[CV], filename: str, pretty: bool = True) -> str:
-        """Exportiert CVs als JSON"""
-        if not cvs:
-            raise ValueError("Keine CVs zum Exportieren")
-
-        # Konvertiere zu serialisierbarer Struktur
-        data = {
-            "metadata": {
-                "generated_at": datetime.now().isoformat(),
-                "total_cvs": len(cvs),
-                "generator_version": "1.0.0"
-            },
-            "cvs": [cv.dict() for cv in cvs]
-        }
-
-        with open(filename, 'w', encoding='utf-8') as f:
-            if pretty:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            else:
-                json.dump(data, f, ensure_ascii=False, default=str)
-
-        return f"Erfolgreich {len(cvs)} CVs nach {filename} exportiert"
-
-    def export_excel(self, cvs: List[CV], filename: str) -> str:
-        """Exportiert CVs als Excel mit mehreren Sheets"""
-        if not cvs:
-            raise ValueError("Keine CVs zum Exportieren")
-
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            # Haupt-CV-Daten
-            main_data = [cv.to_dict() for cv in cvs]
-            df_main = pd.DataFrame(main_data)
-            df_main.to_excel(writer, sheet_name='CVs_Übersicht', index=False)
-
-            # Bildungsdaten
-            education_data = []
-            for cv in cvs:
-                for edu in cv.education:
-                    education_data.append({
-                        'cv_id': cv.cv_id,
-                        'person': f"{cv.persona.personal.first_name} {cv.persona.personal.last_name}",
-                        'level': edu.level.value,
-                        'institution': edu.institution,
-                        'start_year': edu.start_year,
-                        'end_year': edu.end_year,
-                        'qualification': edu.qualification
-                    })
-
-            if education_data:
-                df_edu = pd.DataFrame(education_data)
-                df_edu.to_excel(writer, sheet_name='Bildungswege', index=False)
-
-            # Karrieredaten
-            career_data = []
-            for cv in cvs:
-                for career in cv.career:
-                    career_data.append({
-                        'cv_id': cv.cv_id,
-                        'person': f"{cv.persona.personal.first_name} {cv.persona.personal.last_name}",
-                        'position': career.position,
-                        'company': career.company,
-                        'start_year': career.start_year,
-                        'end_year': career.end_year,
-                        'duration_years': career.duration_years,
-                        'workload': career.workload
-                    })
-
-            if career_data:
-                df_career = pd.DataFrame(career_data)
-                df_career.to_excel(writer, sheet_name='Karriereverläufe', index=False)
-
-        return f"Erfolgreich {len(cvs)} CVs nach {filename} exportiert"
+    def generate_batch(self, count: int, columnar: bool = False, workers: int = 1,
+                       seed: Optional[int] = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> CVCollection:
+        """Generiert eine Batch von CVs (optional als ``CVBatch``)
 
+        Mit ``seed`` oder ``workers > 1`` wird in Chunks fester Grösse generiert,
+        jeder Chunk mit eigenem, aus ``seed`` abgeleitetem Generator. Das Ergebnis
+        ist für gleiche (``seed``, ``count``) unabhängig von der Worker-Anzahl.
+        """
+        _check_parallelism(workers, chunk_size)
+        if workers <= 1 and seed is None:
+            return self.cv_generator.generate_batch(count, columnar=columnar)
+
+        chunks = list(self.iter_batches(count, columnar=columnar, workers=workers,
+                                        seed=seed, chunk_size=chunk_size))
+        if columnar:
+            from ..cv_batch import CVBatch
+
+            return CVBatch.concat(chunks) if chunks else CVBatch.from_cvs([])
+        return [cv for chunk in chunks for cv in chunk]
+
+    def iter_batches(self, count: int, columnar: bool = False, workers: int = 1,
+                     seed: Optional[int] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CVCollection]:
+        """Liefert die Batch chunkweise in stabiler Reihenfolge
+
+        Ohne ``seed`` und mit einem Worker wird der bestehende Generator
+        verwendet. Sonst läuft jeder Chunk mit abgeleitetem Seed, bei
+        ``workers > 1`` verteilt auf einen Prozess-Pool. Es sind höchstens
+        ``2 * workers`` Chunks gleichzeitig in Arbeit.
+        """
+        _check_parallelism(workers, chunk_size)
+        if workers <= 1 and seed is None:
+            yield from self.cv_generator.iter_cvs(count, chunk_size=chunk_size, columnar=columnar)
+            return
+
+        yield from _ordered_map(_generate_chunk, self._chunk_tasks(count, chunk_size, seed, columnar),
+                                workers)
+
+    def _chunk_tasks(self, count: int, chunk_size: int, seed: Optional[int], *extra: Any) -> List[tuple]:
+        """Worker-Tasks (Generator-Klasse, Optionen, Chunk-Seed, Anzahl, *extra) pro Chunk"""
+        chunk_counts = [min(chunk_size, count - start) for start in range(0, count, chunk_size)]
+        generator_class = type(self.cv_generator)
+        options = self.cv_generator.generator_options()
+        seeds = derive_chunk_seeds(seed, len(chunk_counts))
+        return [(generator_class, options, chunk_seed, chunk_count, *extra)
+                for chunk_seed, chunk_count in zip(seeds, chunk_counts)]
+
+    def iter_rendered(self, count: int, format: str, workers: int = 1, seed: Optional[int] = None,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[tuple]]:
+        """Liefert gerenderte Dokumente chunkweise als Listen von (cv_id, Dokument)
+
+        Generierung und Rendering laufen bei ``workers > 1`` gemeinsam in den
+        Worker-Prozessen, zurück kommen nur die fertigen Zeichenketten.
+        Reihenfolge und Seeds wie bei ``iter_batches``.
+        """
+        from .renderer import render_cvs
 
-class CVFormatter:
-    """Formatierung von CVs für verschiedene Ausgaben"""
+        _check_parallelism(workers, chunk_size)
+        if workers <= 1 and seed is None:
+            for chunk in self.cv_generator.iter_cvs(count, chunk_size=chunk_size):
+                yield render_cvs(chunk, format)
+            return
 
-    @staticmethod
-    def to_formatted_text(cv: CV) -> str:
-        """Formatiert CV als lesbaren Text"""
-        return cv.to_formatted_text()
+        yield from _ordered_map(_render_chunk, self._chunk_tasks(count, chunk_size, seed, format),
+                                workers)
+
+    def render(self, count: int, output: str, format: str = "html", workers: int = 1,
+               seed: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Generiert und rendert ``count`` CVs nach ``output``
+
+        ``output`` ist ein Verzeichnis (eine Datei pro CV) oder ein Archiv
+        (.zip, .tar, .tar.gz, .tgz, .tar.xz). Liefert die Anzahl Dokumente.
+        """
+        from .renderer import RENDERERS, document_name, open_document_writer
+
+        if format not in RENDERERS:
+            raise ValueError(f"Unbekanntes Render-Format: {format}")
+        _check_parallelism(workers, chunk_size)
+        with open_document_writer(output) as writer:
+            for chunk in self.iter_rendered(count, format, workers=workers, seed=seed,
+                                            chunk_size=chunk_size):
+                for cv_id, document in chunk:
+                    writer.write(document_name(writer.count + 1, cv_id, format), document)
+        return writer.count
+
+    def export(self, cvs: Union[CVCollection, Iterable], filename: str, format: str,
+               **options: Any) -> str:
+        """Exportiert CVs im angegebenen Format (siehe ``FORMATS``)
+
+        ``options`` werden an die Export-Methode bzw. Sink weitergereicht,
+        z.B. ``compression`` ("gzip", "xz", "zstd", "none"; sonst aus der
+        Dateiendung abgeleitet) und ``compress_threads`` für die parallele
+        Blockkompression.
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unbekanntes Export-Format: {format}")
+        method, _ = self.FORMATS[format]
+        return getattr(self, method)(cvs, filename, **options)
+
+    def export_pipelined(self, cvs: Union[CVCollection, Iterable], filename: str, format: str,
+                         queue_size: int = DEFAULT_QUEUE_SIZE, **options: Any) -> "PipelineStats":
+        """Exportiert einen Chunk-Strom über die Pipeline Generieren -> Serialisieren -> Schreiben
+
+        Serialisierung und Schreiben laufen in Hintergrund-Threads, verbunden
+        über Queues mit höchstens ``queue_size`` Chunks. Liefert die
+        Durchsatz-Statistik pro Stufe.
+        """
+        from .pipeline import Pipeline
+        from .sinks import open_sink
+
+        source = self._sink_source(cvs)
+        with open_sink(format, filename, **options) as sink:
+            return Pipeline(sink, queue_size).run(source)
 
     @staticmethod
-    def to_html(cv: CV) -> str:
-        """Formatiert CV als HTML"""
-        persona = cv.persona.personal
-
-        html = f"""
-        <div class="cv">
-            <div class="header">
-                <h1>{persona.first_name} {persona.last_name}</h1>
-                <p>Alter: {persona.age} | {persona.city}, {persona.canton}</p>
-                <p>Sprachregion: {persona.language_region.value}</p>
-            </div>
-
-            <div class="section">
-                <h2>Ausbildung</h2>
-                <ul>
+    def _sink_source(cvs: Union[CVCollection, Iterable]) -> Iterable:
+        """Chunk-Strom für eine Sink; leere Eingaben scheitern, bevor eine Datei entsteht
+
+        Bei Strömen wird bis zum ersten nicht-leeren Chunk vorausgelesen.
         """
+        if isinstance(cvs, list) or is_cv_batch(cvs):
+            if len(cvs) == 0:
+                raise ValueError("Keine CVs zum Exportieren")
+            return [cvs]
+        chunks = iter(cvs)
+        for chunk in chunks:
+            if isinstance(chunk, CV) or len(chunk):
+                return chain([chunk], chunks)
+        raise ValueError("Keine CVs zum Exportieren")
+
+    def _write_sink(self, sink_class, filename: str, cvs: Union[CVCollection, Iterable],
+                    **options: Any) -> str:
+        """Schreibt CVs, eine Batch oder einen Chunk-Strom über eine neue ``sink_class``"""
+        source = self._sink_source(cvs)
+        with sink_class(filename, **options) as sink:
+            count = sink.write_all(source)
+        return f"Erfolgreich {count} CVs nach {sink.filename} exportiert"
+
+    def export_csv(self, cvs: Union[CVCollection, Iterable], filename: str, **options: Any) -> str:
+        """Exportiert CVs als CSV
+
+        Akzeptiert Listen, ``CVBatch`` und Ströme von CVs oder CV-Chunks (z.B.
+        aus ``iter_cvs``); die Zeilen werden inkrementell mit fester
+        Spaltenreihenfolge (``CSV_COLUMNS``) geschrieben.
+        """
+        from .sinks import CSVSink
+
+        return self._write_sink(CSVSink, filename, cvs, **options)
 
-        for edu in cv.education:
-            html += f"""
-                    <li>
-                        <strong>{edu.start_year}-{edu.end_year}:</strong> {edu.level.value}<br>
-                        {edu.institution}<br>
-                        <em>{edu.qualification}</em>
-                    </li>
-            """
-
-        html += """
-                </ul>
-            </div>
-
-            <div class="section">
-                <h2>Beruflicher Werdegang</h2>
-                <ul>
+    def export_json(self, cvs: Union[CVCollection, Iterable], filename: str,
+                    pretty: bool = True, **options: Any) -> str:
+        """Exportiert CVs als JSON
+
+        Das Dokument wird inkrementell geschrieben; bei Strömen folgen die
+        Metadaten dem CV-Array, da die Anzahl erst am Ende feststeht. Die
+        Sektordaten stehen einmal in den Metadaten, die CVs referenzieren
+        sie über "sector".
         """
+        from .sinks import JSONArraySink
+
+        total = len(cvs) if isinstance(cvs, list) or is_cv_batch(cvs) else None
+        return self._write_sink(JSONArraySink, filename, cvs, total=total, pretty=pretty, **options)
 
-        for career in cv.career:
-            end_year = career.end_year if career.end_year else "heute"
-            html += f"""
-                    <li>
-                        <strong>{career.start_year}-{end_year}:</strong> {career.position}<br>
-                        {career.company}, {career.location}<br>
-                        <em>{career.employment_type}, {career.workload}</em>
-                    </li>
-            """
-
-        html += f"""
-                </ul>
-            </div>
-
-            <div class="section">
-                <h2>Sprachkenntnisse</h2>
-                <ul>
+    def export_ndjson(self, cvs: Union[CVCollection, Iterable], filename: str,
+                      **options: Any) -> str:
+        """Exportiert CVs als JSON Lines (ein CV pro Zeile)
+
+        Die Metadaten werden in ``<filename>.meta.json`` abgelegt.
         """
+        from .sinks import NDJSONSink
 
-        for lang, level in cv.skills.languages.items():
-            html += f"<li>{lang.capitalize()}: {level}</li>"
+        return self._write_sink(NDJSONSink, filename, cvs, **options)
 
-        html += f"""
-                </ul>
-            </div>
+    def export_parquet(self, cvs: Union[CVCollection, Iterable], directory: str,
+                       partition_by: Sequence[str] = (), **options: Any) -> str:
+        """Exportiert CVs als normalisierte Parquet-Tabellen
 
-            <div class="section">
-                <h2>Hobbies</h2>
-                <p>{', '.join(cv.hobbies)}</p>
-            </div>
-        </div>
+        Schreibt die Tabellen cvs, education, career, skills und languages
+        (verknüpft über ``cv_id``) chunkweise nach ``directory``, optional
+        partitioniert nach ``language_region`` und/oder ``sector``.
+        Benötigt das optionale Paket pyarrow.
         """
+        from .sinks import ParquetSink
 
-        return html
+        return self._write_sink(ParquetSink, directory, cvs, partition_by=partition_by, **options)
 
-    @staticmethod
-    def to_markdown(cv: CV) -> str:
-        """Formatiert CV als Markdown"""
-        persona = cv.persona.personal
+    def export_excel(self, cvs: Union[CVCollection, Iterable], filename: str,
+                     **options: Any) -> str:
+        """Exportiert CVs als Excel mit mehreren Sheets
+
+        Die Zeilen werden im write-only-Modus von openpyxl gestreamt; Blätter
+        über dem Excel-Zeilenlimit werden auf ``<Blatt>_2``, ... aufgeteilt.
+        """
+        from .sinks import ExcelSink
+
+        return self._write_sink(ExcelSink, filename, cvs, **options)
+
+    def export_sqlite(self, cvs: Union[CVCollection, Iterable], filename: str,
+                      **options: Any) -> str:
+        """Exportiert CVs in eine SQLite-Datenbank
 
-        md = (
-            f"# {persona.first_name} {persona.last_name}\n\n"
-            f"**Alter:** {persona.age} Jahre  \n"
-            f"**Wohnort:** {persona.city}, {persona.canton}  \n"
-            f"**Sprachregion:** {persona.language_region.value}  \n"
-            f"**Sektor:** {cv.persona.sector}\n\n"
-            "## Ausbildung\n\n"
-        )
+        Normalisierte Tabellen cvs, education, career, skills, languages und
+        hobbies (verknüpft über ``cvs.id``) plus eine Tabelle metadata. Die
+        Zeilen werden per ``executemany`` in grossen Transaktionen geladen,
+        die Indizes erst am Ende angelegt.
+        """
+        from .sinks import SQLiteSink
+
+        return self._write_sink(SQLiteSink, filename, cvs, **options)
 
-        for edu in cv.education:
-            md += f"- **{edu.start_year}-{edu.end_year}:** {edu.level.value}  \n"
-            md += f"  *{edu.institution}*  \n"
-            md += f"  {edu.qualification}\n\n"
+    def export_cvb(self, cvs: Union[CVCollection, Iterable], filename: str,
+                   **options: Any) -> str:
+        """Exportiert CVs als binäres, dictionary-kodiertes Archiv (``.cvb``)
 
-        md += "## Beruflicher Werdegang\n\n"
+        Zeichenketten werden einmal im Vokabular abgelegt, die CVs als
+        Integer-Spalten fester Breite plus Offset-Arrays. Gelesen wird mit
+        ``archive.read_archive`` bzw. ``CVArchiveReader``.
+        """
+        from .sinks import ArchiveSink
 
-        for career in cv.career:
-            end_year = career.end_year if career.end_year else "heute"
-            md += f"- **{career.start_year}-{end_year}:** {career.position}  \n"
-            md += f"  *{career.company}, {career.location}*  \n"
-            md += f"  {career.employment_type}, {career.workload}\n\n"
+        return self._write_sink(ArchiveSink, filename, cvs, **options)
 
-        md += "## Sprachkenntnisse\n\n"
 
-        for lang, level in cv.skills.languages.items():
-            md += f"- **{lang.capitalize()}:** {level}\n"
+class CVFormatter:
+    """Formatierung von CVs für verschiedene Ausgaben (siehe ``renderer``)"""
+
+    @staticmethod
+    def to_formatted_text(cv: CV) -> str:
+        """Formatiert CV als lesbaren Text"""
+        return cv.to_formatted_text()
 
-        md += f"\n## Hobbies\n\n{', '.join(cv.hobbies)}"
+    @staticmethod
+    def to_html(cv: CV) -> str:
+        """Formatiert CV als HTML"""
+        from .renderer import render_html
+
+        return render_html(cv)
+
+    @staticmethod
+    def to_markdown(cv: CV) -> str:
+        """Formatiert CV als Markdown"""
+        from .renderer import render_markdown
 
-        return md
+        return render_markdown(cv)
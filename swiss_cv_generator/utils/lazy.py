@@ -0,0 +1,15 @@
+"""
+Hilfsfunktionen für verzögerte Imports schwerer Abhängigkeiten
+"""
+
+import sys
+from typing import Any
+
+
+def is_cv_batch(obj: Any) -> bool:
+    """Prüft auf ``CVBatch``, ohne das Modul (und damit NumPy) zu importieren
+
+    Existiert ein ``CVBatch``-Objekt, ist das Modul bereits geladen.
+    """
+    module = sys.modules.get("swiss_cv_generator.cv_batch")
+    return module is not None and isinstance(obj, module.CVBatch)
@@ -0,0 +1,184 @@
+"""
+Pipeline Generierung -> Serialisierung -> Schreiben mit Hintergrund-Threads
+
+Die Stufen sind über beschränkte Queues verbunden: ist eine nachgelagerte
+Stufe langsamer, blockiert die vorgelagerte (Backpressure), der Speicher
+bleibt auf wenige Chunks pro Queue begrenzt.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .lazy import is_cv_batch
+from .exporters import DEFAULT_QUEUE_SIZE
+
+# Markiert das Ende des Stroms in einer Queue
+_DONE = object()
+
+
+class StageStats:
+    """Durchsatz einer Pipeline-Stufe (Wartezeit auf Queues nicht mitgezählt)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.chunks = 0
+        self.cvs = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def cvs_per_second(self) -> float:
+        return self.cvs / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.name,
+            "chunks": self.chunks,
+            "cvs": self.cvs,
+            "busy_seconds": self.busy_seconds,
+            "cvs_per_second": self.cvs_per_second,
+        }
+
+
+class PipelineStats:
+    """Statistik eines Pipeline-Laufs"""
+
+    def __init__(self):
+        self.stages: List[StageStats] = [
+            StageStats("generieren"), StageStats("serialisieren"), StageStats("schreiben")
+        ]
+        self.wall_seconds = 0.0
+
+    @property
+    def count(self) -> int:
+        """Anzahl geschriebener CVs"""
+        return self.stages[-1].cvs
+
+    def summary(self) -> str:
+        """Lesbare Zusammenfassung pro Stufe"""
+        lines = [f"Pipeline: {self.count} CVs in {self.wall_seconds:.2f}s"]
+        for stage in self.stages:
+            lines.append(f"  {stage.name:<14} {stage.busy_seconds:8.2f}s aktiv "
+                         f"{stage.cvs_per_second:12,.0f} CVs/s")
+        return "\n".join(lines)
+
+
+def _chunk_len(chunk) -> int:
+    return len(chunk) if isinstance(chunk, list) or is_cv_batch(chunk) else 1
+
+
+class _Stage(threading.Thread):
+    """Hintergrund-Thread, der Elemente aus einer Queue verarbeitet"""
+
+    def __init__(self, pipeline: "Pipeline", stats: StageStats, inbox: queue.Queue,
+                 outbox: Optional[queue.Queue], work):
+        super().__init__(name=f"pipeline-{stats.name}", daemon=True)
+        self.pipeline = pipeline
+        self.stats = stats
+        self.inbox = inbox
+        self.outbox = outbox
+        self.work = work
+
+    def run(self) -> None:
+        try:
+            while True:
+                item = self.pipeline.get(self.inbox)
+                if item is _DONE:
+                    break
+                payload, count = item
+                started = time.perf_counter()
+                result = self.work(payload, count)
+                self.stats.busy_seconds += time.perf_counter() - started
+                self.stats.chunks += 1
+                self.stats.cvs += count
+                if self.outbox is not None and not self.pipeline.put(self.outbox, (result, count)):
+                    return
+        except BaseException as e:
+            self.pipeline.fail(e)
+            return
+        if self.outbox is not None:
+            self.pipeline.put(self.outbox, _DONE)
+
+
+class Pipeline:
+    """Schreibt einen Chunk-Strom über Serialisierer- und Writer-Thread in eine Sink
+
+    Die Generierung läuft im aufrufenden Thread (z.B. ``iter_batches``, ggf.
+    mit Worker-Prozessen). ``sink.encode`` läuft im Serialisierer-Thread,
+    ``sink.write_encoded`` im Writer-Thread.
+    """
+
+    def __init__(self, sink, queue_size: int = DEFAULT_QUEUE_SIZE):
+        if queue_size < 1:
+            raise ValueError("Queue-Grösse muss mindestens 1 sein")
+        self.sink = sink
+        self.queue_size = queue_size
+        self.stats = PipelineStats()
+        self._error: Optional[BaseException] = None
+        self._failed = threading.Event()
+
+    def fail(self, error: BaseException) -> None:
+        if self._error is None:
+            self._error = error
+        self._failed.set()
+
+    def get(self, source: queue.Queue):
+        """Blockierendes get, das bei einem Fehler in einer anderen Stufe ``_DONE`` liefert"""
+        while True:
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                if self._failed.is_set():
+                    return _DONE
+
+    def put(self, target: queue.Queue, item) -> bool:
+        """Blockierendes put, das bei einem Fehler in einer anderen Stufe abbricht"""
+        while not self._failed.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(self, source: Iterable) -> PipelineStats:
+        """Verarbeitet alle Chunks aus ``source`` und liefert die Statistik"""
+        generate, serialize, write = self.stats.stages
+        to_serializer: queue.Queue = queue.Queue(self.queue_size)
+        to_writer: queue.Queue = queue.Queue(self.queue_size)
+
+        stages = [
+            _Stage(self, serialize, to_serializer, to_writer,
+                   lambda chunk, count: self.sink.encode(chunk)),
+            _Stage(self, write, to_writer, None, self.sink.write_encoded),
+        ]
+        started = time.perf_counter()
+        for stage in stages:
+            stage.start()
+
+        try:
+            iterator = iter(source)
+            while not self._failed.is_set():
+                chunk_started = time.perf_counter()
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    break
+                count = _chunk_len(chunk)
+                generate.busy_seconds += time.perf_counter() - chunk_started
+                generate.chunks += 1
+                generate.cvs += count
+                if not self.put(to_serializer, (chunk, count)):
+                    break
+        except BaseException as e:
+            self.fail(e)
+        finally:
+            self.put(to_serializer, _DONE)
+            for stage in stages:
+                stage.join()
+
+        self.stats.wall_seconds = time.perf_counter() - started
+        if self._error is not None:
+            raise self._error
+        return self.stats
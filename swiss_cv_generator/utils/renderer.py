@@ -0,0 +1,258 @@
+"""
+Massen-Rendering von CVs als HTML, Markdown oder Text
+
+Die Vorlagen sind vorab als %-Formatstrings aufgebaut; ein
+Dokument wird aus Teilstücken in einer Liste aufgebaut und mit einem einzigen
+``join`` zusammengesetzt. Die Dokumente landen als einzelne Dateien in einem
+Verzeichnis oder gestreamt in einem zip-/tar-Archiv.
+"""
+
+import io
+import os
+import tarfile
+import time
+import zipfile
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from ..data_models import CV
+
+# Vorlagen mit positionellen %-Platzhaltern: das Einsetzen läuft vollständig
+# in C und ist schneller als str.format mit Schlüsselwörtern
+
+# --- HTML -------------------------------------------------------------------
+
+_HTML_HEAD = """
+        <div class="cv">
+            <div class="header">
+                <h1>%s %s</h1>
+                <p>Alter: %s | %s, %s</p>
+                <p>Sprachregion: %s</p>
+            </div>
+
+            <div class="section">
+                <h2>Ausbildung</h2>
+                <ul>
+        """
+
+_HTML_EDUCATION = """
+                    <li>
+                        <strong>%s-%s:</strong> %s<br>
+                        %s<br>
+                        <em>%s</em>
+                    </li>
+            """
+
+_HTML_CAREER_HEAD = """
+                </ul>
+            </div>
+
+            <div class="section">
+                <h2>Beruflicher Werdegang</h2>
+                <ul>
+        """
+
+_HTML_CAREER = """
+                    <li>
+                        <strong>%s-%s:</strong> %s<br>
+                        %s, %s<br>
+                        <em>%s, %s</em>
+                    </li>
+            """
+
+_HTML_LANGUAGES_HEAD = """
+                </ul>
+            </div>
+
+            <div class="section">
+                <h2>Sprachkenntnisse</h2>
+                <ul>
+        """
+
+_HTML_LANGUAGE = "<li>%s: %s</li>"
+
+_HTML_TAIL = """
+                </ul>
+            </div>
+
+            <div class="section">
+                <h2>Hobbies</h2>
+                <p>%s</p>
+            </div>
+        </div>
+        """
+
+# --- Markdown ---------------------------------------------------------------
+
+_MD_HEAD = (
+    "# %s %s\n\n"
+    "**Alter:** %s Jahre  \n"
+    "**Wohnort:** %s, %s  \n"
+    "**Sprachregion:** %s  \n"
+    "**Sektor:** %s\n\n"
+    "## Ausbildung\n\n"
+)
+_MD_EDUCATION = "- **%s-%s:** %s  \n  *%s*  \n  %s\n\n"
+_MD_CAREER_HEAD = "## Beruflicher Werdegang\n\n"
+_MD_CAREER = "- **%s-%s:** %s  \n  *%s, %s*  \n  %s, %s\n\n"
+_MD_LANGUAGES_HEAD = "## Sprachkenntnisse\n\n"
+_MD_LANGUAGE = "- **%s:** %s\n"
+_MD_TAIL = "\n## Hobbies\n\n%s"
+
+# --- Text (wie ``CV.to_formatted_text``) -------------------------------------
+
+_TEXT_HEAD = (
+    "=" * 60 + "\nSYNTHETISCHER LEBENSLAUF\n" + "=" * 60 + "\n\n"
+    "PERSÖNLICHE ANGABEN\n" + "-" * 20 + "\n"
+    "Name: %s %s\n"
+    "Alter: %s Jahre (%s)\n"
+    "Wohnort: %s, %s\n"
+    "Sprachregion: %s\n\n"
+    "AUSBILDUNG\n" + "-" * 10 + "\n"
+)
+_TEXT_EDUCATION = "%s-%s: %s\n  %s\n  %s\n\n"
+_TEXT_CAREER_HEAD = "BERUFLICHER WERDEGANG\n" + "-" * 22 + "\n"
+_TEXT_CAREER = "%s-%s: %s\n  %s, %s\n  %s, %s\n\n"
+_TEXT_LANGUAGES_HEAD = "SPRACHKENNTNISSE\n" + "-" * 16 + "\n"
+_TEXT_LANGUAGE = "  %s: %s\n"
+
+
+def _body(cv: CV, education: str, career_head: str, career: str, languages_head: str,
+          language: str) -> List[str]:
+    """Teilstücke von Ausbildung bis Sprachkenntnisse"""
+    parts = [education % (edu.start_year, edu.end_year, edu.level.value, edu.institution,
+                          edu.qualification)
+             for edu in cv.education]
+    parts.append(career_head)
+    parts += [career % (position.start_year, position.end_year or "heute", position.position,
+                        position.company, position.location, position.employment_type,
+                        position.workload)
+              for position in cv.career]
+    parts.append(languages_head)
+    parts += [language % (name.capitalize(), level) for name, level in cv.skills.languages.items()]
+    return parts
+
+
+def render_html(cv: CV) -> str:
+    """Rendert einen CV als HTML-Fragment"""
+    p = cv.persona.personal
+    head = _HTML_HEAD % (p.first_name, p.last_name, p.age, p.city, p.canton, p.language_region.value)
+    body = _body(cv, _HTML_EDUCATION, _HTML_CAREER_HEAD, _HTML_CAREER, _HTML_LANGUAGES_HEAD,
+                 _HTML_LANGUAGE)
+    return "".join([head, *body, _HTML_TAIL % ", ".join(cv.hobbies)])
+
+
+def render_markdown(cv: CV) -> str:
+    """Rendert einen CV als Markdown"""
+    p = cv.persona.personal
+    head = _MD_HEAD % (p.first_name, p.last_name, p.age, p.city, p.canton, p.language_region.value,
+                       cv.persona.sector)
+    body = _body(cv, _MD_EDUCATION, _MD_CAREER_HEAD, _MD_CAREER, _MD_LANGUAGES_HEAD, _MD_LANGUAGE)
+    return "".join([head, *body, _MD_TAIL % ", ".join(cv.hobbies)])
+
+
+def render_text(cv: CV) -> str:
+    """Rendert einen CV als lesbaren Text"""
+    p = cv.persona.personal
+    head = _TEXT_HEAD % (p.first_name, p.last_name, p.age, p.birth_year, p.city, p.canton,
+                         p.language_region.value)
+    body = _body(cv, _TEXT_EDUCATION, _TEXT_CAREER_HEAD, _TEXT_CAREER, _TEXT_LANGUAGES_HEAD,
+                 _TEXT_LANGUAGE)
+    return "".join([head, *body])
+
+
+# Format -> (Renderer, Dateiendung)
+RENDERERS: Dict[str, Tuple[Callable[[CV], str], str]] = {
+    "html": (render_html, "html"),
+    "markdown": (render_markdown, "md"),
+    "text": (render_text, "txt"),
+}
+
+
+def render_cvs(cvs: Iterable[CV], format: str) -> List[Tuple[str, str]]:
+    """Rendert CVs als Liste von (cv_id, Dokument)"""
+    if format not in RENDERERS:
+        raise ValueError(f"Unbekanntes Render-Format: {format}")
+    render = RENDERERS[format][0]
+    return [(cv.cv_id, render(cv)) for cv in cvs]
+
+
+def document_name(index: int, cv_id: str, format: str) -> str:
+    """Dateiname eines Dokuments; die laufende Nummer macht Namen trotz doppelter cv_ids eindeutig"""
+    return f"{index:06d}_{cv_id}.{RENDERERS[format][1]}"
+
+
+# --- Ausgabe ----------------------------------------------------------------
+
+# Archiv-Endung -> tarfile-Modus
+TAR_MODES = {".tar": "w", ".tar.gz": "w:gz", ".tgz": "w:gz", ".tar.xz": "w:xz"}
+
+
+class DocumentWriter:
+    """Schreibt Dokumente als einzelne Dateien in ein Verzeichnis"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, name: str, document: str) -> None:
+        with open(os.path.join(self.path, name), 'w', encoding='utf-8') as f:
+            f.write(document)
+        self.count += 1
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "DocumentWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class ZipDocumentWriter(DocumentWriter):
+    """Schreibt Dokumente gestreamt in ein zip-Archiv (deflate)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+
+    def write(self, name: str, document: str) -> None:
+        self._archive.writestr(name, document.encode('utf-8'))
+        self.count += 1
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+class TarDocumentWriter(DocumentWriter):
+    """Schreibt Dokumente gestreamt in ein (optional komprimiertes) tar-Archiv"""
+
+    def __init__(self, path: str, mode: str = "w"):
+        self.path = path
+        self.count = 0
+        self._archive = tarfile.open(path, mode)
+        self._mtime = int(time.time())
+
+    def write(self, name: str, document: str) -> None:
+        data = document.encode('utf-8')
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self._mtime
+        self._archive.addfile(info, io.BytesIO(data))
+        self.count += 1
+
+    def close(self) -> None:
+        self._archive.close()
+
+
+def open_document_writer(path: str) -> DocumentWriter:
+    """Wählt die Ausgabe anhand der Endung: .zip, .tar(.gz/.xz), .tgz oder Verzeichnis"""
+    lower = path.lower()
+    if lower.endswith(".zip"):
+        return ZipDocumentWriter(path)
+    for suffix, mode in TAR_MODES.items():
+        if lower.endswith(suffix):
+            return TarDocumentWriter(path, mode)
+    return DocumentWriter(path)
@@ -0,0 +1,889 @@
+"""
+Streaming-Sinks: schreiben CVs chunkweise in eine Datei, ohne die ganze Batch
+im Speicher zu halten
+
+Jede Sink trennt das Kodieren eines Chunks (``encode``) vom Schreiben des
+Ergebnisses (``write_encoded``), damit beide Schritte in unterschiedlichen
+Threads laufen können. ``write`` erledigt beides in einem Aufruf.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..data_models import CV
+from .compression import COMPRESSIONS, open_output
+from .lazy import is_cv_batch
+from .tables import TABLE_COLUMNS, TABLES, normalize_cvs
+
+# Spaltenreihenfolge des CSV-Exports: Felder aus ``CV.to_dict()`` gefolgt von
+# den berechneten Zähl- und Listenfeldern
+CSV_COLUMNS: List[str] = [
+    "cv_id", "first_name", "last_name", "age", "gender", "canton", "city",
+    "language_region", "sector", "education_level", "total_experience",
+    "current_position", "languages", "generated_date",
+    "education_count", "career_positions", "language_count", "professional_skills_count",
+    "languages_list", "professional_skills_list", "it_skills_list", "hobbies_list",
+]
+
+
+def csv_row(cv: CV) -> Dict[str, Any]:
+    """Flache CSV-Zeile eines CVs inklusive berechneter Felder"""
+    row = cv.to_dict()
+
+    # Zusätzliche berechnete Felder
+    row.update({
+        "education_count": len(cv.education),
+        "career_positions": len(cv.career),
+        "language_count": len(cv.skills.languages),
+        "professional_skills_count": len(cv.skills.professional_skills),
+        "languages_list": "; ".join(cv.skills.languages.keys()),
+        "professional_skills_list": "; ".join(cv.skills.professional_skills),
+        "it_skills_list": "; ".join(cv.skills.it_skills),
+        "hobbies_list": "; ".join(cv.hobbies)
+    })
+    return row
+
+
+def _grouped(batch, group: str, name: str) -> List[List[Any]]:
+    """Dekodierte Listenwerte einer Gruppe, aufgeteilt pro CV"""
+    offsets, values = batch.list_column(group)
+    codes = values[name].tolist()
+    strings = batch.vocab.values
+    decoded = [strings[code] for code in codes]
+    bounds = offsets.tolist()
+    return [decoded[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+
+def _batch_summary(batch) -> Tuple[List[int], List[Optional[str]], List[str]]:
+    """Berufserfahrung, aktuelle Position und höchster Abschluss pro CV eines ``CVBatch``"""
+    import numpy as np
+    from ..cv_batch import EDUCATION_LEVELS, MISSING
+
+    career_offsets, career = batch.list_column("career")
+    career_bounds = career_offsets.tolist()
+    # Berufserfahrung pro CV als Differenz der kumulierten Dauern
+    cumulative = np.concatenate(([0], np.cumsum(career["career_duration_years"], dtype=np.int64)))
+    total_experience = (cumulative[career_offsets[1:]] - cumulative[career_offsets[:-1]]).tolist()
+    end_years = career["career_end_year"].tolist()
+    positions = career["career_position"].tolist()
+    strings = batch.vocab.values
+
+    current_positions: List[Optional[str]] = []
+    for i in range(len(batch)):
+        current_position = None
+        for j in range(career_bounds[i], career_bounds[i + 1]):
+            if end_years[j] == MISSING:
+                current_position = strings[positions[j]]
+                break
+        current_positions.append(current_position)
+
+    education_levels = [
+        EDUCATION_LEVELS[level].value if level != MISSING else "Keine Angabe"
+        for level in batch.highest_education_levels().tolist()
+    ]
+    return total_experience, current_positions, education_levels
+
+
+def batch_csv_rows(batch) -> List[List[Any]]:
+    """CSV-Zeilen eines ``CVBatch`` direkt aus den Spalten (ohne CV-Objekte)
+
+    Liefert dieselben Werte wie ``csv_row`` in der Reihenfolge von ``CSV_COLUMNS``.
+    """
+    import numpy as np
+
+    c = batch.columns
+    total_experience, current_positions, education_levels = _batch_summary(batch)
+    career_lengths = np.diff(batch.list_column("career")[0]).tolist()
+    education_lengths = np.diff(batch.list_column("education")[0]).tolist()
+
+    languages = _grouped(batch, "languages", "language")
+    professional_skills = _grouped(batch, "professional_skills", "professional_skills")
+    it_skills = _grouped(batch, "it_skills", "it_skills")
+    hobbies = _grouped(batch, "hobbies", "hobbies")
+
+    first_names = batch.decode("first_name")
+    last_names = batch.decode("last_name")
+    genders = batch.decode("gender")
+    cantons = batch.decode("canton")
+    cities = batch.decode("city")
+    regions = batch.decode("language_region")
+    sectors = batch.decode("sector")
+    ages = c["age"].tolist()
+    cv_ids = c["cv_id"].tolist()
+    dates = c["generated_date"].tolist()
+
+    rows = []
+    for i in range(len(batch)):
+        rows.append([
+            cv_ids[i], first_names[i], last_names[i], ages[i], genders[i], cantons[i], cities[i],
+            regions[i], sectors[i], education_levels[i],
+            total_experience[i], current_positions[i], languages[i], dates[i].isoformat(),
+            education_lengths[i], career_lengths[i], len(languages[i]),
+            len(professional_skills[i]),
+            "; ".join(languages[i]), "; ".join(professional_skills[i]),
+            "; ".join(it_skills[i]), "; ".join(hobbies[i]),
+        ])
+    return rows
+
+
+def json_record(cv: CV) -> Dict[str, Any]:
+    """JSON-taugliches Dict eines CVs ohne ``cv.dict()``-Umweg
+
+    Entspricht ``cv.dict()`` mit ``default=str``: Enums als Wert,
+    ``generated_date`` als ``str(datetime)``.
+    """
+    personal = cv.persona.personal
+    skills = cv.skills
+    return {
+        "cv_id": cv.cv_id,
+        "persona": {
+            "personal": {
+                "first_name": personal.first_name,
+                "last_name": personal.last_name,
+                "age": personal.age,
+                "birth_year": personal.birth_year,
+                "gender": personal.gender.value,
+                "language_region": personal.language_region.value,
+                "primary_language": personal.primary_language,
+                "canton": personal.canton,
+                "city": personal.city
+            },
+            "sector": cv.persona.sector
+        },
+        "education": [
+            {
+                "level": edu.level.value,
+                "institution": edu.institution,
+                "start_year": edu.start_year,
+                "end_year": edu.end_year,
+                "qualification": edu.qualification,
+                "field_of_study": edu.field_of_study
+            }
+            for edu in cv.education
+        ],
+        "career": [
+            {
+                "position": pos.position,
+                "company": pos.company,
+                "location": pos.location,
+                "start_year": pos.start_year,
+                "end_year": pos.end_year,
+                "duration_years": pos.duration_years,
+                "employment_type": pos.employment_type,
+                "workload": pos.workload,
+                "responsibilities": pos.responsibilities
+            }
+            for pos in cv.career
+        ],
+        "skills": {
+            "languages": dict(skills.languages),
+            "professional_skills": skills.professional_skills,
+            "it_skills": skills.it_skills,
+            "certifications": skills.certifications
+        },
+        "hobbies": cv.hobbies,
+        "generated_date": str(cv.generated_date)
+    }
+
+
+def export_metadata(total_cvs: int, **extra: Any) -> Dict[str, Any]:
+    """Metadaten der JSON-Exporte inklusive der einmalig abgelegten Sektordaten"""
+    from .. import __version__
+    from ..data.catalog import get_catalog
+
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "total_cvs": total_cvs,
+        "generator_version": __version__,
+        **extra,
+        "sectors": get_catalog().sector_table()
+    }
+
+
+def _chunk_cvs(chunk) -> Iterable[CV]:
+    if isinstance(chunk, CV):
+        return [chunk]
+    return chunk
+
+
+def _chunk_len(chunk) -> int:
+    return 1 if isinstance(chunk, CV) else len(chunk)
+
+
+class Sink:
+    """Basisklasse: Datei öffnen, Chunks kodieren und schreiben, CVs zählen
+
+    Textformate werden transparent komprimiert, wenn ``compression`` gesetzt
+    ist oder die Dateiendung passt (siehe ``open_output``).
+    """
+
+    # Unterstützte Werte für ``compression`` (neben None)
+    COMPRESSIONS: Tuple[str, ...] = ("none",) + COMPRESSIONS
+
+    def __init__(self, filename: str, compression: Optional[str] = None,
+                 compress_threads: int = 1):
+        self.filename = filename
+        self.count = 0
+        self._file = open_output(filename, compression, compress_threads)
+
+    def encode(self, chunk) -> str:
+        """Kodiert einen CV oder Chunk als Text (ohne Dateizugriff)"""
+        raise NotImplementedError
+
+    def write_encoded(self, payload: str, count: int) -> None:
+        """Schreibt einen mit ``encode`` kodierten Chunk mit ``count`` CVs"""
+        self._file.write(payload)
+        self.count += count
+
+    def write(self, chunk) -> None:
+        """Kodiert und schreibt einen CV oder Chunk"""
+        self.write_encoded(self.encode(chunk), _chunk_len(chunk))
+
+    def write_all(self, source: Iterable) -> int:
+        """Schreibt alle CVs/Chunks eines Stroms und liefert die Anzahl CVs"""
+        for chunk in source:
+            self.write(chunk)
+        return self.count
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CSVSink(Sink):
+    """Schreibt CVs zeilenweise mit fester Spaltenreihenfolge (``CSV_COLUMNS``)
+
+    Akzeptiert einzelne CVs, Listen von CVs und ``CVBatch``-Chunks.
+    """
+
+    def __init__(self, filename: str, **options: Any):
+        super().__init__(filename, **options)
+        csv.writer(self._file, lineterminator='\n').writerow(CSV_COLUMNS)
+
+    def encode(self, chunk) -> str:
+        """Kodiert einen Chunk als CSV-Text"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        if is_cv_batch(chunk):
+            writer.writerows(batch_csv_rows(chunk))
+        else:
+            for cv in _chunk_cvs(chunk):
+                row = csv_row(cv)
+                writer.writerow([row[name] for name in CSV_COLUMNS])
+        return buffer.getvalue()
+
+
+class NDJSONSink(Sink):
+    """Schreibt einen CV pro Zeile (JSON Lines)
+
+    Die Metadaten landen beim Schliessen in der Sidecar-Datei
+    ``<filename>.meta.json``, damit die Datei selbst zeilenweise lesbar bleibt.
+    """
+
+    def __init__(self, filename: str, **options: Any):
+        super().__init__(filename, **options)
+        self._encoder = json.JSONEncoder(ensure_ascii=False)
+
+    @staticmethod
+    def metadata_path(filename: str) -> str:
+        return f"{filename}.meta.json"
+
+    def encode(self, chunk) -> str:
+        """Kodiert einen Chunk als JSON-Zeilen"""
+        encode = self._encoder.encode
+        return "".join(encode(json_record(cv)) + "\n" for cv in _chunk_cvs(chunk))
+
+    def close(self) -> None:
+        super().close()
+        metadata = export_metadata(self.count, format="ndjson",
+                                   data_file=os.path.basename(self.filename))
+        with open(self.metadata_path(self.filename), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+
+
+class JSONArraySink(Sink):
+    """Schreibt das Layout ``{"metadata": ..., "cvs": [...]}`` inkrementell
+
+    Die Ausgabe entspricht ``json.dump`` des ganzen Dokuments. Ist ``total``
+    bekannt, stehen die Metadaten wie bisher am Anfang; sonst folgen sie dem
+    CV-Array, sobald die Anzahl feststeht.
+    """
+
+    def __init__(self, filename: str, total: Optional[int] = None, pretty: bool = True,
+                 **options: Any):
+        super().__init__(filename, **options)
+        self.total = total
+        self.pretty = pretty
+        self._encoder = json.JSONEncoder(ensure_ascii=False, indent=2 if pretty else None)
+        # Einrückung der Objekt-Felder (Ebene 1) und der Array-Elemente (Ebene 2)
+        self._member_separator = ",\n  " if pretty else ", "
+        self._item_prefix = "\n    " if pretty else ""
+        self._item_separator = "," if pretty else ", "
+
+        self._file.write("{\n  " if pretty else "{")
+        if total is not None:
+            self._file.write(self._metadata_member(total) + self._member_separator)
+        self._file.write('"cvs": [')
+
+    def _metadata_member(self, total: int) -> str:
+        metadata = self._encoder.encode(export_metadata(total))
+        return '"metadata": ' + metadata.replace("\n", "\n  ")
+
+    def encode(self, chunk) -> str:
+        """Kodiert einen Chunk als durch Komma getrennte Array-Elemente"""
+        prefix = self._item_prefix
+        return self._item_separator.join(
+            prefix + self._encoder.encode(json_record(cv)).replace("\n", prefix)
+            for cv in _chunk_cvs(chunk)
+        )
+
+    def write_encoded(self, payload: str, count: int) -> None:
+        if not payload:
+            return
+        if self.count:
+            self._file.write(self._item_separator)
+        super().write_encoded(payload, count)
+
+    def close(self) -> None:
+        self._file.write("\n  ]" if self.pretty and self.count else "]")
+        if self.total is None:
+            self._file.write(self._member_separator + self._metadata_member(self.count))
+        self._file.write("\n}" if self.pretty else "}")
+        super().close()
+
+
+def _import_pyarrow():
+    """Importiert pyarrow (optionale Abhängigkeit) mit verständlicher Fehlermeldung"""
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet-Export benötigt pyarrow: pip install swiss-cv-generator[parquet]"
+        ) from e
+    return pyarrow
+
+
+def arrow_schemas(partition_by: Sequence[str] = ()) -> Dict[str, Any]:
+    """Arrow-Schemas der normalisierten Tabellen (Zeichenketten dictionary-kodiert)"""
+    pa = _import_pyarrow()
+    text = pa.dictionary(pa.int32(), pa.string())
+    year = pa.int16()
+    types = {
+        "cv_id": pa.string(), "seq": pa.int8(), "age": pa.int16(), "birth_year": year,
+        "start_year": year, "end_year": year, "duration_years": pa.int16(),
+        "total_experience": pa.int16(), "generated_date": pa.timestamp("us"),
+        "responsibilities": pa.list_(pa.string()),
+    }
+    schemas = {}
+    for table, columns in TABLE_COLUMNS.items():
+        names = list(columns) + [name for name in partition_by if name not in columns]
+        schemas[table] = pa.schema([(name, types.get(name, text)) for name in names])
+    return schemas
+
+
+def to_arrow_tables(cvs: Iterable[CV], partition_by: Sequence[str] = ()) -> Dict[str, Any]:
+    """Normalisierte Tabellen (siehe ``TABLE_COLUMNS``) als ``pyarrow.Table``
+
+    Mit ``partition_by`` erhalten auch die Detailtabellen die
+    Partitionierungs-Spalten des zugehörigen CVs.
+    """
+    pa = _import_pyarrow()
+    columns = normalize_cvs(cvs, propagate=partition_by)
+    schemas = arrow_schemas(partition_by)
+    return {table: pa.Table.from_pydict(columns[table], schema=schemas[table]) for table in columns}
+
+
+class ParquetSink(Sink):
+    """Schreibt die normalisierten Tabellen chunkweise als Parquet
+
+    Pro Tabelle entsteht ``<directory>/<tabelle>.parquet`` (ein Row-Group pro
+    Chunk), mit ``partition_by`` stattdessen ein Hive-partitioniertes
+    Verzeichnis ``<directory>/<tabelle>/<spalte>=<wert>/...``. Metadaten
+    stehen in ``<directory>/metadata.json``.
+    """
+
+    PARTITION_COLUMNS = ("language_region", "sector")
+
+    # Parquet komprimiert intern pro Spalte; xz wird nicht unterstützt
+    CODECS = {None: "zstd", "none": "none", "gzip": "gzip", "zstd": "zstd"}
+    COMPRESSIONS = ("none", "gzip", "zstd")
+
+    def __init__(self, directory: str, partition_by: Sequence[str] = (),
+                 compression: Optional[str] = None, compress_threads: int = 1):
+        if compression not in self.CODECS:
+            raise ValueError(f"Parquet unterstützt die Kompression {compression} nicht")
+        unknown = set(partition_by) - set(self.PARTITION_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unbekannte Partitionierungs-Spalten: {', '.join(sorted(unknown))}")
+        _import_pyarrow()
+
+        self.filename = directory
+        self.count = 0
+        self.partition_by = list(partition_by)
+        # pyarrow komprimiert mit eigenem Thread-Pool, compress_threads wird nicht benötigt
+        self.compression = self.CODECS[compression]
+        self._writers: Dict[str, Any] = {}
+        self._chunks = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def encode(self, chunk) -> Dict[str, Any]:
+        """Kodiert einen Chunk als Arrow-Tabellen"""
+        cvs = _chunk_cvs(chunk)
+        return to_arrow_tables(cvs, self.partition_by)
+
+    def write_encoded(self, payload: Dict[str, Any], count: int) -> None:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        for table, data in payload.items():
+            if self.partition_by:
+                ds.write_dataset(
+                    data, os.path.join(self.filename, table), format="parquet",
+                    partitioning=self.partition_by, partitioning_flavor="hive",
+                    basename_template=f"part-{self._chunks:06d}-{{i}}.parquet",
+                    existing_data_behavior="overwrite_or_ignore",
+                    file_options=ds.ParquetFileFormat().make_write_options(
+                        compression=self.compression),
+                )
+                continue
+            writer = self._writers.get(table)
+            if writer is None:
+                writer = self._writers[table] = pq.ParquetWriter(
+                    os.path.join(self.filename, f"{table}.parquet"), data.schema,
+                    compression=self.compression)
+            writer.write_table(data)
+        self._chunks += 1
+        self.count += count
+
+    def close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+        metadata = export_metadata(self.count, format="parquet", tables=TABLES,
+                                   partition_by=self.partition_by)
+        with open(os.path.join(self.filename, "metadata.json"), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+
+
+# Excel-Blätter: Basisname -> Spalten. Bildungs- und Karriere-Blätter enthalten
+# eine Zeile pro Eintrag, "person" ist der Name zur besseren Lesbarkeit.
+EXCEL_SHEETS: Dict[str, List[str]] = {
+    "CVs_Übersicht": [
+        "cv_id", "first_name", "last_name", "age", "gender", "canton", "city",
+        "language_region", "sector", "education_level", "total_experience",
+        "current_position", "languages", "generated_date",
+    ],
+    "Bildungswege": [
+        "cv_id", "person", "level", "institution", "start_year", "end_year", "qualification",
+    ],
+    "Karriereverläufe": [
+        "cv_id", "person", "position", "company", "start_year", "end_year",
+        "duration_years", "workload",
+    ],
+}
+
+# Zeilenlimit eines Excel-Arbeitsblatts (inklusive Kopfzeile)
+EXCEL_MAX_ROWS = 1_048_576
+
+
+def excel_rows(cvs: Iterable[CV]) -> Dict[str, List[List[Any]]]:
+    """Zeilen der Excel-Blätter (siehe ``EXCEL_SHEETS``) für eine Folge von CVs"""
+    overview, education, career = [], [], []
+    for cv in cvs:
+        row = cv.to_dict()
+        row["languages"] = str(row["languages"])
+        overview.append([row[name] for name in EXCEL_SHEETS["CVs_Übersicht"]])
+
+        person = f"{cv.persona.personal.first_name} {cv.persona.personal.last_name}"
+        for edu in cv.education:
+            education.append([cv.cv_id, person, edu.level.value, edu.institution,
+                              edu.start_year, edu.end_year, edu.qualification])
+        for position in cv.career:
+            career.append([cv.cv_id, person, position.position, position.company,
+                           position.start_year, position.end_year,
+                           position.duration_years, position.workload])
+    return {"CVs_Übersicht": overview, "Bildungswege": education, "Karriereverläufe": career}
+
+
+class ExcelSink(Sink):
+    """Schreibt CVs mit konstantem Speicherbedarf als xlsx (openpyxl write-only)
+
+    Zeilen werden beim Eintreffen angehängt. Erreicht ein Blatt das
+    Zeilenlimit, geht es auf ``<Blatt>_2``, ``<Blatt>_3``, ... weiter.
+    Blätter ohne Zeilen werden nicht angelegt.
+    """
+
+    COMPRESSIONS = ("none",)
+
+    def __init__(self, filename: str, max_rows: int = EXCEL_MAX_ROWS,
+                 compression: Optional[str] = None, compress_threads: int = 1):
+        from openpyxl import Workbook
+
+        if compression not in (None, "none"):
+            raise ValueError("xlsx-Dateien sind bereits komprimiert (ZIP-Container)")
+
+        self.filename = filename
+        self.count = 0
+        self.max_rows = max_rows
+        self._workbook = Workbook(write_only=True)
+        # Basisname -> (aktuelles Blatt, Anzahl Blätter, Zeilen im aktuellen Blatt)
+        self._sheets: Dict[str, List[Any]] = {}
+
+    def encode(self, chunk) -> Dict[str, List[List[Any]]]:
+        """Kodiert einen Chunk als Zeilen pro Blatt"""
+        return excel_rows(_chunk_cvs(chunk))
+
+    def _sheet(self, name: str):
+        state = self._sheets.get(name)
+        if state is None or state[2] >= self.max_rows:
+            number = 1 if state is None else state[1] + 1
+            title = name if number == 1 else f"{name}_{number}"
+            sheet = self._workbook.create_sheet(title)
+            sheet.append(EXCEL_SHEETS[name])
+            state = self._sheets[name] = [sheet, number, 1]
+        return state
+
+    def write_encoded(self, payload: Dict[str, List[List[Any]]], count: int) -> None:
+        for name, rows in payload.items():
+            for row in rows:
+                state = self._sheet(name)
+                state[0].append(row)
+                state[2] += 1
+        self.count += count
+
+    def close(self) -> None:
+        if not self._sheets:
+            # Eine Arbeitsmappe braucht mindestens ein Blatt
+            self._sheet("CVs_Übersicht")
+        self._workbook.save(self.filename)
+
+
+# Normalisiertes SQLite-Schema: Tabelle -> [(Spalte, Typ)]. cv_id ist nicht
+# eindeutig (6-stellige Zufallsnummer), die Detailtabellen verweisen daher auf cvs.id.
+SQLITE_TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "cvs": [
+        ("id", "INTEGER PRIMARY KEY"), ("cv_id", "TEXT NOT NULL"), ("first_name", "TEXT"),
+        ("last_name", "TEXT"), ("age", "INTEGER"), ("birth_year", "INTEGER"), ("gender", "TEXT"),
+        ("language_region", "TEXT"), ("primary_language", "TEXT"), ("canton", "TEXT"),
+        ("city", "TEXT"), ("sector", "TEXT"), ("education_level", "TEXT"),
+        ("total_experience", "INTEGER"), ("current_position", "TEXT"), ("generated_date", "TEXT"),
+    ],
+    "education": [
+        ("cv", "INTEGER NOT NULL REFERENCES cvs(id)"), ("seq", "INTEGER"), ("level", "TEXT"),
+        ("institution", "TEXT"), ("start_year", "INTEGER"), ("end_year", "INTEGER"),
+        ("qualification", "TEXT"), ("field_of_study", "TEXT"),
+    ],
+    "career": [
+        ("cv", "INTEGER NOT NULL REFERENCES cvs(id)"), ("seq", "INTEGER"), ("position", "TEXT"),
+        ("company", "TEXT"), ("location", "TEXT"), ("start_year", "INTEGER"),
+        ("end_year", "INTEGER"), ("duration_years", "INTEGER"), ("employment_type", "TEXT"),
+        ("workload", "TEXT"), ("responsibilities", "TEXT"),
+    ],
+    # Fachliche Skills, IT-Kenntnisse und Zertifikate, unterschieden über "category"
+    "skills": [("cv", "INTEGER NOT NULL REFERENCES cvs(id)"), ("category", "TEXT"), ("skill", "TEXT")],
+    "languages": [("cv", "INTEGER NOT NULL REFERENCES cvs(id)"), ("language", "TEXT"), ("level", "TEXT")],
+    "hobbies": [("cv", "INTEGER NOT NULL REFERENCES cvs(id)"), ("hobby", "TEXT")],
+    "metadata": [("key", "TEXT PRIMARY KEY"), ("value", "TEXT")],
+}
+
+# Sekundärindizes, erst nach dem Laden angelegt (schneller als laufende Pflege)
+SQLITE_INDEXES: List[str] = [
+    "CREATE INDEX idx_cvs_cv_id ON cvs(cv_id)",
+    "CREATE INDEX idx_cvs_sector ON cvs(sector)",
+    "CREATE INDEX idx_cvs_language_region ON cvs(language_region)",
+    "CREATE INDEX idx_education_cv ON education(cv)",
+    "CREATE INDEX idx_career_cv ON career(cv)",
+    "CREATE INDEX idx_career_position ON career(position)",
+    "CREATE INDEX idx_skills_cv ON skills(cv)",
+    "CREATE INDEX idx_skills_skill ON skills(skill)",
+    "CREATE INDEX idx_languages_cv ON languages(cv)",
+    "CREATE INDEX idx_hobbies_cv ON hobbies(cv)",
+]
+
+# Pragmas für den Bulk-Load: WAL, keine fsyncs während des Ladens, grosser Cache
+SQLITE_LOAD_PRAGMAS: List[str] = [
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+    "PRAGMA locking_mode = EXCLUSIVE",
+]
+
+
+def sqlite_rows(cvs: Iterable[CV], first_id: int) -> Dict[str, List[tuple]]:
+    """Zeilen-Tupel pro SQLite-Tabelle; CVs erhalten fortlaufende IDs ab ``first_id``"""
+    tables: Dict[str, List[tuple]] = {name: [] for name in SQLITE_TABLES if name != "metadata"}
+    cv_rows, edu_rows, career_rows = tables["cvs"], tables["education"], tables["career"]
+    skill_rows, language_rows, hobby_rows = tables["skills"], tables["languages"], tables["hobbies"]
+
+    for cv_key, cv in enumerate(cvs, start=first_id):
+        personal = cv.persona.personal
+        cv_rows.append((
+            cv_key, cv.cv_id, personal.first_name, personal.last_name, personal.age,
+            personal.birth_year, personal.gender.value, personal.language_region.value,
+            personal.primary_language, personal.canton, personal.city, cv.persona.sector,
+            cv.education_level, cv.total_experience_years, cv.current_position,
+            cv.generated_date.isoformat(),
+        ))
+        for seq, edu in enumerate(cv.education):
+            edu_rows.append((cv_key, seq, edu.level.value, edu.institution, edu.start_year,
+                             edu.end_year, edu.qualification, edu.field_of_study))
+        for seq, position in enumerate(cv.career):
+            responsibilities = "; ".join(position.responsibilities) if position.responsibilities else None
+            career_rows.append((cv_key, seq, position.position, position.company, position.location,
+                                position.start_year, position.end_year, position.duration_years,
+                                position.employment_type, position.workload, responsibilities))
+        skills = cv.skills
+        for category, values in (("professional", skills.professional_skills),
+                                 ("it", skills.it_skills),
+                                 ("certification", skills.certifications)):
+            skill_rows.extend((cv_key, category, skill) for skill in values)
+        language_rows.extend((cv_key, language, level) for language, level in skills.languages.items())
+        hobby_rows.extend((cv_key, hobby) for hobby in cv.hobbies)
+    return tables
+
+
+def batch_sqlite_rows(batch, first_id: int) -> Dict[str, List[tuple]]:
+    """SQLite-Zeilen eines ``CVBatch`` direkt aus den Spalten (ohne CV-Objekte)
+
+    Liefert dieselben Zeilen wie ``sqlite_rows``.
+    """
+    import numpy as np
+    from ..cv_batch import EDUCATION_LEVELS, MISSING
+
+    c = batch.columns
+    size = len(batch)
+    # MISSING (-1) zeigt auf den angehängten None-Eintrag
+    strings = batch.vocab.values + [None]
+    cv_keys = np.arange(first_id, first_id + size, dtype=np.int64)
+
+    def decode(values) -> List[Optional[str]]:
+        return [strings[code] for code in values.tolist()]
+
+    def owners(group: str):
+        """(CV-ID, Position in der Liste) pro Eintrag einer Listengruppe"""
+        offsets, values = batch.list_column(group)
+        lengths = np.diff(offsets)
+        keys = np.repeat(cv_keys, lengths)
+        seqs = np.arange(len(keys), dtype=np.int64) - np.repeat(offsets[:-1], lengths)
+        return keys.tolist(), seqs.tolist(), values
+
+    total_experience, current_positions, education_levels = _batch_summary(batch)
+    cv_rows = list(zip(
+        cv_keys.tolist(), c["cv_id"].tolist(), batch.decode("first_name"),
+        batch.decode("last_name"), c["age"].tolist(), c["birth_year"].tolist(),
+        batch.decode("gender"), batch.decode("language_region"),
+        batch.decode("primary_language"), batch.decode("canton"), batch.decode("city"),
+        batch.decode("sector"), education_levels, total_experience, current_positions,
+        [date.isoformat() for date in c["generated_date"].tolist()],
+    ))
+
+    keys, seqs, edu = owners("education")
+    edu_rows = list(zip(
+        keys, seqs, [EDUCATION_LEVELS[level].value for level in edu["education_level"].tolist()],
+        decode(edu["education_institution"]), edu["education_start_year"].tolist(),
+        edu["education_end_year"].tolist(), decode(edu["education_qualification"]),
+        decode(edu["education_field_of_study"]),
+    ))
+
+    keys, seqs, career = owners("career")
+    responsibilities = [
+        "; ".join(items) if items else None
+        for items in _grouped(batch, "responsibilities", "responsibilities")
+    ]
+    career_rows = list(zip(
+        keys, seqs, decode(career["career_position"]), decode(career["career_company"]),
+        decode(career["career_location"]), career["career_start_year"].tolist(),
+        [None if year == MISSING else year for year in career["career_end_year"].tolist()],
+        career["career_duration_years"].tolist(), decode(career["career_employment_type"]),
+        decode(career["career_workload"]), responsibilities,
+    ))
+
+    skill_rows: List[tuple] = []
+    for category, group in (("professional", "professional_skills"), ("it", "it_skills"),
+                            ("certification", "certifications")):
+        keys, _, values = owners(group)
+        skill_rows.extend(zip(keys, [category] * len(keys), decode(values[group])))
+    # Einträge in CV-Reihenfolge wie bei ``sqlite_rows``
+    skill_rows.sort(key=lambda row: row[0])
+
+    keys, _, languages = owners("languages")
+    language_rows = list(zip(keys, decode(languages["language"]), decode(languages["language_level"])))
+
+    keys, _, hobbies = owners("hobbies")
+    hobby_rows = list(zip(keys, decode(hobbies["hobbies"])))
+
+    return {
+        "cvs": cv_rows, "education": edu_rows, "career": career_rows,
+        "skills": skill_rows, "languages": language_rows, "hobbies": hobby_rows,
+    }
+
+
+class SQLiteSink(Sink):
+    """Lädt CVs in eine SQLite-Datenbank mit normalisiertem Schema
+
+    Eingefügt wird per ``executemany`` in grossen Transaktionen (Commit alle
+    ``commit_every`` CVs) mit Bulk-Load-Pragmas; Sekundärindizes werden erst
+    beim Schliessen angelegt. Eine bestehende Datei wird ersetzt.
+    """
+
+    COMPRESSIONS = ("none",)
+
+    def __init__(self, filename: str, commit_every: int = 100_000,
+                 compression: Optional[str] = None, compress_threads: int = 1):
+        import sqlite3
+
+        if compression not in (None, "none"):
+            raise ValueError("SQLite-Export unterstützt keine Kompression")
+        for path in (filename, f"{filename}-wal", f"{filename}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.filename = filename
+        self.count = 0
+        self.commit_every = commit_every
+        self._next_id = 1
+        self._uncommitted = 0
+        # Transaktionen werden explizit gesteuert
+        self._connection = sqlite3.connect(filename, isolation_level=None, check_same_thread=False)
+        for pragma in SQLITE_LOAD_PRAGMAS:
+            self._connection.execute(pragma)
+        for table, columns in SQLITE_TABLES.items():
+            definition = ", ".join(f"{name} {type_}" for name, type_ in columns)
+            self._connection.execute(f"CREATE TABLE {table} ({definition})")
+        self._inserts = {
+            table: f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+            for table, columns in SQLITE_TABLES.items()
+        }
+        self._connection.execute("BEGIN")
+
+    def encode(self, chunk) -> Dict[str, List[tuple]]:
+        """Kodiert einen Chunk als Zeilen-Tupel; IDs werden fortlaufend vergeben"""
+        if is_cv_batch(chunk):
+            rows = batch_sqlite_rows(chunk, self._next_id)
+        else:
+            rows = sqlite_rows(_chunk_cvs(chunk), self._next_id)
+        self._next_id += len(rows["cvs"])
+        return rows
+
+    def write_encoded(self, payload: Dict[str, List[tuple]], count: int) -> None:
+        execute = self._connection.executemany
+        for table, rows in payload.items():
+            if rows:
+                execute(self._inserts[table], rows)
+        self.count += count
+        self._uncommitted += count
+        if self._uncommitted >= self.commit_every:
+            self._connection.execute("COMMIT")
+            self._connection.execute("BEGIN")
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        connection = self._connection
+        try:
+            metadata = export_metadata(self.count, format="sqlite")
+            connection.executemany(
+                self._inserts["metadata"],
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()]
+            )
+            connection.execute("COMMIT")
+            connection.execute("BEGIN")
+            for statement in SQLITE_INDEXES:
+                connection.execute(statement)
+            connection.execute("COMMIT")
+            connection.execute("PRAGMA optimize")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            connection.close()
+
+
+class ArchiveSink(Sink):
+    """Schreibt CVs in ein binäres ``.cvb``-Archiv (siehe ``archive``)"""
+
+    COMPRESSIONS = ("none",)
+
+    def __init__(self, filename: str, compression: Optional[str] = None, compress_threads: int = 1):
+        from .archive import CVArchiveWriter
+
+        if compression not in (None, "none"):
+            raise ValueError("Das CV-Archiv unterstützt keine Kompression")
+        self.filename = filename
+        self._writer = CVArchiveWriter(filename)
+
+    @property
+    def count(self) -> int:
+        return self._writer.count
+
+    def encode(self, chunk) -> bytes:
+        return self._writer.encode(chunk)
+
+    def write_encoded(self, payload: bytes, count: int) -> None:
+        self._writer.write_encoded(payload, count)
+
+    def close(self) -> None:
+        self._writer.close(export_metadata(self.count, format="cvb"))
+
+
+# Format -> Sink-Klasse (Formate wie in ``BatchGenerator.FORMATS``)
+SINKS = {
+    "csv": CSVSink,
+    "json": JSONArraySink,
+    "ndjson": NDJSONSink,
+    "parquet": ParquetSink,
+    "excel": ExcelSink,
+    "sqlite": SQLiteSink,
+    "cvb": ArchiveSink,
+}
+
+
+def supported_compressions(format: str) -> Tuple[str, ...]:
+    """Werte von ``compression``, die das Export-Format unterstützt"""
+    if format not in SINKS:
+        raise ValueError(f"Unbekanntes Export-Format: {format}")
+    return SINKS[format].COMPRESSIONS
+
+
+def open_sink(format: str, filename: str, **options: Any) -> Sink:
+    """Öffnet die Sink für ein Export-Format"""
+    if format not in SINKS:
+        raise ValueError(f"Unbekanntes Export-Format: {format}")
+    return SINKS[format](filename, **options)
+
+
+# Markerdatei in abgebrochenen Verzeichnis-Exporten; pyarrow ignoriert
+# Dateien mit führendem Unterstrich beim Lesen als Dataset
+PARTIAL_MARKER = "_PARTIAL"
+
+
+def mark_partial(filename: str) -> List[str]:
+    """Kennzeichnet die Ausgabe eines abgebrochenen Exports als unvollständig
+
+    Datei bzw. Verzeichnis wird in ``<name>.partial`` umbenannt, eine
+    NDJSON-Sidecar passend dazu in ``<name>.partial.meta.json``.
+    Verzeichnisse (Parquet) erhalten zusätzlich die Markerdatei
+    ``PARTIAL_MARKER``. Liefert die neuen Pfade.
+    """
+    if not os.path.exists(filename):
+        return []
+    partial = f"{filename}.partial"
+    os.replace(filename, partial)
+    renamed = [partial]
+    if os.path.isdir(partial):
+        with open(os.path.join(partial, PARTIAL_MARKER), 'w', encoding='utf-8') as f:
+            f.write(f"Export abgebrochen: {os.path.basename(filename)} ist unvollständig\n")
+    sidecar = NDJSONSink.metadata_path(filename)
+    if os.path.exists(sidecar):
+        os.replace(sidecar, NDJSONSink.metadata_path(partial))
+        renamed.append(NDJSONSink.metadata_path(partial))
+    return renamed
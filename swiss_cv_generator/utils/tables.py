@@ -0,0 +1,113 @@
+"""
+Normalisierte Tabellen-Sicht auf CVs: eine Zeile pro CV plus Detailtabellen
+(Bildung, Karriere, Skills, Sprachen), verknüpft über ``cv_id``
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence
+
+from ..data_models import CV
+
+# Spalten pro Tabelle in fester Reihenfolge
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    "cvs": [
+        "cv_id", "first_name", "last_name", "age", "birth_year", "gender",
+        "language_region", "primary_language", "canton", "city", "sector",
+        "education_level", "total_experience", "current_position", "generated_date",
+    ],
+    "education": [
+        "cv_id", "seq", "level", "institution", "start_year", "end_year",
+        "qualification", "field_of_study",
+    ],
+    "career": [
+        "cv_id", "seq", "position", "company", "location", "start_year", "end_year",
+        "duration_years", "employment_type", "workload", "responsibilities",
+    ],
+    # Fachliche Skills, IT-Kenntnisse, Zertifikate und Hobbies, unterschieden über "category"
+    "skills": ["cv_id", "category", "skill"],
+    "languages": ["cv_id", "language", "level"],
+}
+
+TABLES = list(TABLE_COLUMNS)
+
+
+def normalize_cvs(cvs: Iterable[CV], propagate: Sequence[str] = ()) -> Dict[str, Dict[str, List[Any]]]:
+    """Flacht CVs spaltenweise in die Tabellen aus ``TABLE_COLUMNS`` ab
+
+    Die ``cvs``-Spalten in ``propagate`` werden zusätzlich in jede Zeile der
+    Detailtabellen übernommen, direkt beim Abflachen des jeweiligen CVs
+    (``cv_id`` ist nicht eindeutig und taugt nicht als Schlüssel dafür).
+    """
+    tables = {table: {name: [] for name in columns} for table, columns in TABLE_COLUMNS.items()}
+    cv_rows, edu_rows, career_rows = tables["cvs"], tables["education"], tables["career"]
+    skill_rows, language_rows = tables["skills"], tables["languages"]
+    details = [rows for table, rows in tables.items() if table != "cvs"]
+    for rows in details:
+        for name in propagate:
+            rows.setdefault(name, [])
+
+    for cv in cvs:
+        detail_counts = [len(rows["cv_id"]) for rows in details]
+        cv_id = cv.cv_id
+        personal = cv.persona.personal
+        for name, value in (
+            ("cv_id", cv_id),
+            ("first_name", personal.first_name),
+            ("last_name", personal.last_name),
+            ("age", personal.age),
+            ("birth_year", personal.birth_year),
+            ("gender", personal.gender.value),
+            ("language_region", personal.language_region.value),
+            ("primary_language", personal.primary_language),
+            ("canton", personal.canton),
+            ("city", personal.city),
+            ("sector", cv.persona.sector),
+            ("education_level", cv.education_level),
+            ("total_experience", cv.total_experience_years),
+            ("current_position", cv.current_position),
+            ("generated_date", cv.generated_date),
+        ):
+            cv_rows[name].append(value)
+
+        for seq, edu in enumerate(cv.education):
+            for name, value in (
+                ("cv_id", cv_id), ("seq", seq), ("level", edu.level.value),
+                ("institution", edu.institution), ("start_year", edu.start_year),
+                ("end_year", edu.end_year), ("qualification", edu.qualification),
+                ("field_of_study", edu.field_of_study),
+            ):
+                edu_rows[name].append(value)
+
+        for seq, position in enumerate(cv.career):
+            for name, value in (
+                ("cv_id", cv_id), ("seq", seq), ("position", position.position),
+                ("company", position.company), ("location", position.location),
+                ("start_year", position.start_year), ("end_year", position.end_year),
+                ("duration_years", position.duration_years),
+                ("employment_type", position.employment_type), ("workload", position.workload),
+                ("responsibilities", position.responsibilities),
+            ):
+                career_rows[name].append(value)
+
+        skills = cv.skills
+        for category, values in (
+            ("professional", skills.professional_skills),
+            ("it", skills.it_skills),
+            ("certification", skills.certifications),
+            ("hobby", cv.hobbies),
+        ):
+            for skill in values:
+                skill_rows["cv_id"].append(cv_id)
+                skill_rows["category"].append(category)
+                skill_rows["skill"].append(skill)
+
+        for language, level in skills.languages.items():
+            language_rows["cv_id"].append(cv_id)
+            language_rows["language"].append(language)
+            language_rows["level"].append(level)
+
+        for rows, before in zip(details, detail_counts):
+            added = len(rows["cv_id"]) - before
+            for name in propagate:
+                rows[name].extend([cv_rows[name][-1]] * added)
+
+    return tables
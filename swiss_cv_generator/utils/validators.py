@@ -2,66 +2,276 @@
 Validatoren für Schweizer Arbeitsmarktstatistiken
 """
 
-from typing import List, Dict, Any
-import pandas as pd
+import math
+from collections import Counter
+from statistics import NormalDist
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union, TYPE_CHECKING
 from ..data_models import CV, Persona
 from ..data.statistics import SWISS_LABOR_STATISTICS, OCCUPATIONAL_SECTORS
+from .lazy import is_cv_batch
+
+if TYPE_CHECKING:
+    from ..cv_batch import CVBatch
+
+CVCollection = Union[List[CV], "CVBatch"]
+
+# Zielwerte und Toleranzen der einzelnen Validierungen (Prozent bzw. Jahre)
+TARGET_MALE_PCT = 52.0
+REGION_TARGETS = {
+    "deutschschweiz": SWISS_LABOR_STATISTICS["language_regions"]["german_speaking"],
+    "romandie": SWISS_LABOR_STATISTICS["language_regions"]["french_speaking"],
+    "ticino": SWISS_LABOR_STATISTICS["language_regions"]["italian_speaking"]
+}
+GENDER_TOLERANCE = 5.0
+REGION_TOLERANCE = 8.0
+TARGET_VOCATIONAL_PCT = 64.0
+VOCATIONAL_TOLERANCE = 10.0
+MIN_SECTOR_COVERAGE = 70.0
+TARGET_MEAN_AGE = 44.0
+AGE_MEAN_TOLERANCE = 5.0
+TARGET_MIN_AGE = 22
+TARGET_MAX_AGE = 65
+AGE_BOUND_TOLERANCE = 5
+
+# Flache Felder (Spalten des CSV-Exports), aus denen sich alle Metriken ergeben
+VALIDATION_FIELDS = ["gender", "language_region", "sector", "education_level", "age"]
+
+# Konfidenz für --fail-fast (z-Wert) und Mindestanzahl CVs vor einem Urteil;
+# z = 4 hält Fehlabbrüche trotz Prüfung nach jedem Chunk sehr selten
+FAIL_FAST_Z = 4.0
+FAIL_FAST_MIN_COUNT = 1000
+
+# Konfidenzniveau der Näherungsvalidierung aus Stichproben
+DEFAULT_CONFIDENCE = 0.99
+
+# Stichprobenverfahren von io.sample_file mit Einschränkungen für den Bericht
+STRATIFIED_BYTES = "geschichtet (Byte-Positionen)"
+SAMPLING_CAVEATS = {
+    STRATIFIED_BYTES: ("Population aus Dateigrösse und mittlerer Zeilenlänge geschätzt; "
+                       "Zeilen nach langen Zeilen werden bevorzugt gezogen, "
+                       "die Intervalle sind nur näherungsweise gültig"),
+}
+
+
+def _education_group(education_level: str) -> str:
+    """Ordnet einen Abschluss einer der vier Gruppen der Bildungsvalidierung zu"""
+    if "Berufliche Grundbildung" in education_level or "Berufslehre" in education_level:
+        return "Berufslehre"
+    if "Höhere Berufsbildung" in education_level:
+        return "Höhere Berufsbildung"
+    if "Universitätsstudium" in education_level or "Universitätsabschluss" in education_level:
+        return "Universitätsabschluss"
+    return "Obligatorische Schulzeit"
+
+
+def _value_counts(values: Any) -> Dict[Any, int]:
+    """Häufigkeiten einer Spalte (pandas-Series oder Sequenz) mit Python-Schlüsseln"""
+    if hasattr(values, "value_counts"):
+        counts = values.value_counts(sort=False)
+        return {key: count for key, count in zip(counts.index.tolist(), counts.tolist()) if count}
+    return Counter(values)
+
+
+def z_for_confidence(confidence: float) -> float:
+    """z-Wert eines zweiseitigen Konfidenzintervalls (z.B. 0.99 -> 2.58)"""
+    if not 0 < confidence < 1:
+        raise ValueError("Konfidenzniveau muss zwischen 0 und 1 liegen")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def _proportion_interval(count: int, total: int, z: float) -> Tuple[float, float]:
+    """Wilson-Konfidenzintervall eines Anteils, in Prozent"""
+    p = count / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return (center - half_width) * 100, (center + half_width) * 100
+
+
+def _mean_interval(histogram: Dict[int, int], z: float) -> Tuple[float, float]:
+    """Konfidenzintervall des Mittelwerts (Normalapproximation) aus einem Histogramm"""
+    total = sum(histogram.values())
+    mean = sum(value * count for value, count in histogram.items()) / total
+    variance = sum(count * (value - mean) ** 2 for value, count in histogram.items()) / max(total - 1, 1)
+    half_width = z * math.sqrt(variance / total)
+    return mean - half_width, mean + half_width
+
+
+def _verdict(low: float, high: float, lower: float, upper: float) -> Optional[str]:
+    """PASS/FAIL, wenn [low, high] ganz innerhalb bzw. ausserhalb von (lower, upper) liegt"""
+    if lower < low and high < upper:
+        return "PASS"
+    if high <= lower or low >= upper:
+        return "FAIL"
+    return None
+
+
+def _age_bounds_fail(ages: Dict[int, int]) -> bool:
+    """Beobachtete Extremwerte ausserhalb des Zielbereichs; Minimum und Maximum
+    können sich durch weitere CVs nur weiter davon entfernen"""
+    return bool(ages) and (min(ages) < TARGET_MIN_AGE or max(ages) > TARGET_MAX_AGE)
+
+
+class ValidationAccumulator:
+    """Sammelt alle Kennzahlen der Validierung in einem Durchlauf
+
+    Es werden nur ganzzahlige Zähler geführt (Geschlecht, Sprachregion, Sektor,
+    höchster Bildungsabschluss) sowie ein Alters-Histogramm, aus dem Mittelwert,
+    Median, Minimum und Maximum exakt folgen. Akkumulatoren verschiedener Chunks
+    oder Worker lassen sich mit ``merge`` zusammenführen.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.genders: Dict[str, int] = {}
+        self.regions: Dict[str, int] = {}
+        self.sectors: Dict[str, int] = {}
+        self.education_levels: Dict[str, int] = {}
+        self.ages: Dict[int, int] = {}
+
+    @classmethod
+    def from_cvs(cls, cvs: CVCollection) -> "ValidationAccumulator":
+        """Akkumulator über eine Liste von CVs oder einen ``CVBatch``"""
+        return cls().update(cvs)
+
+    def add(self, cv: CV) -> None:
+        """Zählt einen einzelnen CV"""
+        self.update([cv])
+
+    def update(self, cvs: CVCollection) -> "ValidationAccumulator":
+        """Zählt eine Liste von CVs oder einen ``CVBatch`` (ein Durchlauf)"""
+        if is_cv_batch(cvs):
+            return self._update_batch(cvs)
+
+        genders, regions, sectors = self.genders, self.regions, self.sectors
+        education_levels, ages = self.education_levels, self.ages
+        count = 0
+        for cv in cvs:
+            personal = cv.persona.personal
+            gender = personal.gender.value
+            genders[gender] = genders.get(gender, 0) + 1
+            region = personal.language_region.value
+            regions[region] = regions.get(region, 0) + 1
+            sector = cv.persona.sector
+            sectors[sector] = sectors.get(sector, 0) + 1
+            level = cv.education_level
+            education_levels[level] = education_levels.get(level, 0) + 1
+            age = personal.age
+            ages[age] = ages.get(age, 0) + 1
+            count += 1
+        self.count += count
+        return self
+
+    def _update_batch(self, batch: "CVBatch") -> "ValidationAccumulator":
+        import numpy as np
+
+        total = len(batch)
+        level_counts = batch.value_counts("education_level")
+        # CVs ohne Bildungseinträge zählen wie "Keine Angabe"
+        missing = total - sum(level_counts.values())
+        if missing:
+            level_counts["Keine Angabe"] = missing
+        values, counts = np.unique(batch.columns["age"], return_counts=True)
+
+        self._add_counts(self.genders, batch.value_counts("gender"))
+        self._add_counts(self.regions, batch.value_counts("language_region"))
+        self._add_counts(self.sectors, batch.value_counts("sector"))
+        self._add_counts(self.education_levels, level_counts)
+        self._add_counts(self.ages, dict(zip(values.tolist(), counts.tolist())))
+        self.count += total
+        return self
+
+    def update_columns(self, columns: Mapping[str, Any]) -> "ValidationAccumulator":
+        """Zählt flache Spalten aus ``VALIDATION_FIELDS``
+
+        ``columns`` ist ein pandas-DataFrame oder ein Mapping Feld -> Werte
+        (z.B. ``load_cvs(..., fields=VALIDATION_FIELDS, columnar=True)``).
+        """
+        self._add_counts(self.genders, _value_counts(columns["gender"]))
+        self._add_counts(self.regions, _value_counts(columns["language_region"]))
+        self._add_counts(self.sectors, _value_counts(columns["sector"]))
+        self._add_counts(self.education_levels, _value_counts(columns["education_level"]))
+        self._add_counts(self.ages, _value_counts(columns["age"]))
+        self.count += len(columns["age"])
+        return self
+
+    @staticmethod
+    def _add_counts(target: Dict[Any, int], counts: Dict[Any, int]) -> None:
+        for key, count in counts.items():
+            target[key] = target.get(key, 0) + count
+
+    def merge(self, other: "ValidationAccumulator") -> "ValidationAccumulator":
+        """Addiert die Zähler eines anderen Akkumulators (z.B. eines Workers)"""
+        self._add_counts(self.genders, other.genders)
+        self._add_counts(self.regions, other.regions)
+        self._add_counts(self.sectors, other.sectors)
+        self._add_counts(self.education_levels, other.education_levels)
+        self._add_counts(self.ages, other.ages)
+        self.count += other.count
+        return self
+
+    def __len__(self) -> int:
+        return self.count
+
+    def age_median(self) -> int:
+        """Median wie ``sorted(ages)[n // 2]``, aus dem Histogramm ohne Sortieren aller Werte"""
+        target = self.count // 2
+        seen = 0
+        for age in sorted(self.ages):
+            seen += self.ages[age]
+            if seen > target:
+                return age
+        raise ValueError("Keine Altersangaben")
+
+    def report(self) -> Dict[str, Any]:
+        """Validierungsbericht wie ``StatisticsValidator.validate_cvs``"""
+        return StatisticsValidator.validate_accumulator(self)
 
 
 class StatisticsValidator:
     """Validiert generierte Daten gegen Schweizer Arbeitsmarktstatistiken"""
 
     @staticmethod
-    def validate_cvs(cvs: List[CV]) -> Dict[str, Any]:
-        """Validiert eine Liste von CVs gegen bekannte Statistiken"""
-        if not cvs:
+    def validate_cvs(cvs: CVCollection) -> Dict[str, Any]:
+        """Validiert eine Liste von CVs (oder einen ``CVBatch``) gegen bekannte Statistiken"""
+        return StatisticsValidator.validate_accumulator(ValidationAccumulator.from_cvs(cvs))
+
+    @staticmethod
+    def validate_accumulator(accumulator: ValidationAccumulator) -> Dict[str, Any]:
+        """Erstellt den Validierungsbericht aus gesammelten Zählern"""
+        if not accumulator.count:
             return {"error": "Keine CVs zum Validieren"}
 
-        total = len(cvs)
         validation_report = {
-            "total_cvs": total,
-            "validations": {},
+            "total_cvs": accumulator.count,
+            "validations": {
+                "gender": StatisticsValidator._validate_gender_distribution(accumulator),
+                "regions": StatisticsValidator._validate_language_regions(accumulator),
+                "education": StatisticsValidator._validate_education_paths(accumulator),
+                "sectors": StatisticsValidator._validate_sectors(accumulator),
+                "age": StatisticsValidator._validate_age_distribution(accumulator),
+            },
             "summary": {}
         }
 
-        # Geschlechterverteilung validieren
-        gender_validation = StatisticsValidator._validate_gender_distribution(cvs)
-        validation_report["validations"]["gender"] = gender_validation
-
-        # Sprachregionen validieren
-        region_validation = StatisticsValidator._validate_language_regions(cvs)
-        validation_report["validations"]["regions"] = region_validation
-
-        # Bildungswege validieren
-        education_validation = StatisticsValidator._validate_education_paths(cvs)
-        validation_report["validations"]["education"] = education_validation
-
-        # Berufssektoren validieren
-        sector_validation = StatisticsValidator._validate_sectors(cvs)
-        validation_report["validations"]["sectors"] = sector_validation
-
-        # Altersverteilung validieren
-        age_validation = StatisticsValidator._validate_age_distribution(cvs)
-        validation_report["validations"]["age"] = age_validation
-
         # Gesamtbewertung
         validation_report["summary"] = StatisticsValidator._generate_summary(validation_report)
 
         return validation_report
 
     @staticmethod
-    def _validate_gender_distribution(cvs: List[CV]) -> Dict[str, Any]:
+    def _validate_gender_distribution(accumulator: ValidationAccumulator) -> Dict[str, Any]:
         """Validiert Geschlechterverteilung"""
-        total = len(cvs)
-        male_count = sum(1 for cv in cvs if cv.persona.personal.gender.value == "male")
+        total = accumulator.count
+        male_count = accumulator.genders.get("male", 0)
         female_count = total - male_count
 
         actual_male_pct = (male_count / total) * 100
         actual_female_pct = (female_count / total) * 100
 
         # Schweizer Zielwerte (ca. 52% Männer, 48% Frauen in Erwerbsbevölkerung)
-        target_male_pct = 52.0
-        target_female_pct = 48.0
+        target_male_pct = TARGET_MALE_PCT
+        target_female_pct = 100.0 - TARGET_MALE_PCT
 
         return {
             "metric": "Geschlechterverteilung",
@@ -77,28 +287,24 @@ class StatisticsValidator:
                 "male": abs(actual_male_pct - target_male_pct),
                 "female": abs(actual_female_pct - target_female_pct)
             },
-            "status": "PASS" if abs(actual_male_pct - target_male_pct) < 5.0 else "FAIL"
+            "status": "PASS" if abs(actual_male_pct - target_male_pct) < GENDER_TOLERANCE else "FAIL"
         }
 
     @staticmethod
-    def _validate_language_regions(cvs: List[CV]) -> Dict[str, Any]:
+    def _validate_language_regions(accumulator: ValidationAccumulator) -> Dict[str, Any]:
         """Validiert Sprachregionen-Verteilung"""
-        total = len(cvs)
+        total = accumulator.count
         region_counts = {}
 
-        for region in ["deutschschweiz", "romandie", "ticino"]:
-            count = sum(1 for cv in cvs if cv.persona.personal.language_region.value == region)
+        for region in REGION_TARGETS:
+            count = accumulator.regions.get(region, 0)
             region_counts[region] = {
                 "count": count,
                 "percentage": (count / total) * 100
             }
 
         # Schweizer Zielwerte
-        targets = {
-            "deutschschweiz": SWISS_LABOR_STATISTICS["language_regions"]["german_speaking"],
-            "romandie": SWISS_LABOR_STATISTICS["language_regions"]["french_speaking"],
-            "ticino": SWISS_LABOR_STATISTICS["language_regions"]["italian_speaking"]
-        }
+        targets = dict(REGION_TARGETS)
 
         deviations = {}
         max_deviation = 0
@@ -113,13 +319,13 @@ class StatisticsValidator:
             "target": targets,
             "deviation": deviations,
             "max_deviation": max_deviation,
-            "status": "PASS" if max_deviation < 8.0 else "FAIL"
+            "status": "PASS" if max_deviation < REGION_TOLERANCE else "FAIL"
         }
 
     @staticmethod
-    def _validate_education_paths(cvs: List[CV]) -> Dict[str, Any]:
+    def _validate_education_paths(accumulator: ValidationAccumulator) -> Dict[str, Any]:
         """Validiert Bildungswege"""
-        total = len(cvs)
+        total = accumulator.count
         education_counts = {
             "Berufslehre": 0,
             "Höhere Berufsbildung": 0,
@@ -127,16 +333,8 @@ class StatisticsValidator:
             "Obligatorische Schulzeit": 0
         }
 
-        for cv in cvs:
-            education_level = cv.education_level
-            if "Berufliche Grundbildung" in education_level or "Berufslehre" in education_level:
-                education_counts["Berufslehre"] += 1
-            elif "Höhere Berufsbildung" in education_level:
-                education_counts["Höhere Berufsbildung"] += 1
-            elif "Universitätsstudium" in education_level or "Universitätsabschluss" in education_level:
-                education_counts["Universitätsabschluss"] += 1
-            else:
-                education_counts["Obligatorische Schulzeit"] += 1
+        for education_level, count in accumulator.education_levels.items():
+            education_counts[_education_group(education_level)] += count
 
         # Zu Prozenten konvertieren
         education_percentages = {
@@ -146,7 +344,7 @@ class StatisticsValidator:
 
         # Schweizer Zielwerte (ca. 64% Berufslehre)
         vocational_pct = education_percentages["Berufslehre"] + education_percentages["Höhere Berufsbildung"]
-        target_vocational = 64.0
+        target_vocational = TARGET_VOCATIONAL_PCT
 
         return {
             "metric": "Bildungswege",
@@ -154,17 +352,17 @@ class StatisticsValidator:
             "vocational_total": vocational_pct,
             "target_vocational": target_vocational,
             "deviation": abs(vocational_pct - target_vocational),
-            "status": "PASS" if abs(vocational_pct - target_vocational) < 10.0 else "FAIL"
+            "status": "PASS" if abs(vocational_pct - target_vocational) < VOCATIONAL_TOLERANCE else "FAIL"
         }
 
     @staticmethod
-    def _validate_sectors(cvs: List[CV]) -> Dict[str, Any]:
+    def _validate_sectors(accumulator: ValidationAccumulator) -> Dict[str, Any]:
         """Validiert Berufssektoren"""
-        total = len(cvs)
+        total = accumulator.count
         sector_counts = {}
 
         for sector in OCCUPATIONAL_SECTORS.keys():
-            count = sum(1 for cv in cvs if cv.persona.sector == sector)
+            count = accumulator.sectors.get(sector, 0)
             sector_counts[sector] = {
                 "count": count,
                 "percentage": (count / total) * 100
@@ -186,26 +384,26 @@ class StatisticsValidator:
             "target": targets,
             "deviation": deviations,
             "total_coverage": total_coverage,
-            "status": "PASS" if total_coverage > 70.0 else "FAIL"
+            "status": "PASS" if total_coverage > MIN_SECTOR_COVERAGE else "FAIL"
         }
 
     @staticmethod
-    def _validate_age_distribution(cvs: List[CV]) -> Dict[str, Any]:
+    def _validate_age_distribution(accumulator: ValidationAccumulator) -> Dict[str, Any]:
         """Validiert Altersverteilung"""
-        ages = [cv.persona.personal.age for cv in cvs]
-
+        ages = accumulator.ages
         if not ages:
             return {"error": "Keine Altersangaben gefunden"}
 
-        mean_age = sum(ages) / len(ages)
-        median_age = sorted(ages)[len(ages) // 2]
+        count = sum(ages.values())
+        mean_age = sum(age * n for age, n in ages.items()) / count
+        median_age = accumulator.age_median()
         min_age = min(ages)
         max_age = max(ages)
 
         # Schweizer Erwerbsbevölkerung: typischerweise 25-64 Jahre, Durchschnitt ~44
-        target_mean = 44.0
-        target_min = 22
-        target_max = 65
+        target_mean = TARGET_MEAN_AGE
+        target_min = TARGET_MIN_AGE
+        target_max = TARGET_MAX_AGE
 
         return {
             "metric": "Altersverteilung",
@@ -222,9 +420,9 @@ class StatisticsValidator:
                 "max": target_max
             },
             "deviation": abs(mean_age - target_mean),
-            "status": "PASS" if (target_min <= min_age <= target_min + 5 and 
-                              target_max - 5 <= max_age <= target_max and
-                              abs(mean_age - target_mean) < 5.0) else "FAIL"
+            "status": "PASS" if (target_min <= min_age <= target_min + AGE_BOUND_TOLERANCE and 
+                              target_max - AGE_BOUND_TOLERANCE <= max_age <= target_max and
+                              abs(mean_age - target_mean) < AGE_MEAN_TOLERANCE) else "FAIL"
         }
 
     @staticmethod
@@ -244,7 +442,104 @@ class StatisticsValidator:
         }
 
     @staticmethod
-    def generate_validation_report(cvs: List[CV]) -> str:
+    def confidence_intervals(accumulator: ValidationAccumulator, z: float) -> Dict[str, Dict[str, Any]]:
+        """Konfidenzintervalle der geprüften Grössen und das daraus feststehende Urteil
+
+        Pro Metrik: ``interval`` (Prozent bzw. Jahre; bei Sprachregionen pro
+        Region) und ``verdict`` ("PASS", "FAIL" oder None, wenn offen). Beim
+        Alter lässt sich nur FAIL sichern: Minimum und Maximum der Population
+        sind aus einer Teilmenge nicht nach beiden Seiten beweisbar.
+        """
+        total = accumulator.count
+
+        gender = _proportion_interval(accumulator.genders.get("male", 0), total, z)
+
+        regions = {region: _proportion_interval(accumulator.regions.get(region, 0), total, z)
+                   for region in REGION_TARGETS}
+        region_verdicts = [_verdict(*regions[region], target - REGION_TOLERANCE, target + REGION_TOLERANCE)
+                           for region, target in REGION_TARGETS.items()]
+        if "FAIL" in region_verdicts:
+            region_verdict = "FAIL"
+        else:
+            region_verdict = "PASS" if all(v == "PASS" for v in region_verdicts) else None
+
+        vocational = sum(count for level, count in accumulator.education_levels.items()
+                         if _education_group(level) in ("Berufslehre", "Höhere Berufsbildung"))
+        education = _proportion_interval(vocational, total, z)
+
+        covered = sum(accumulator.sectors.get(sector, 0) for sector in OCCUPATIONAL_SECTORS)
+        sectors = _proportion_interval(covered, total, z)
+
+        age = _mean_interval(accumulator.ages, z)
+        age_verdict = _verdict(*age, TARGET_MEAN_AGE - AGE_MEAN_TOLERANCE,
+                               TARGET_MEAN_AGE + AGE_MEAN_TOLERANCE)
+        if _age_bounds_fail(accumulator.ages):
+            age_verdict = "FAIL"
+        elif age_verdict == "PASS":
+            age_verdict = None
+
+        return {
+            "gender": {
+                "interval": gender,
+                "verdict": _verdict(*gender, TARGET_MALE_PCT - GENDER_TOLERANCE,
+                                    TARGET_MALE_PCT + GENDER_TOLERANCE)
+            },
+            "regions": {"interval": regions, "verdict": region_verdict},
+            "education": {
+                "interval": education,
+                "verdict": _verdict(*education, TARGET_VOCATIONAL_PCT - VOCATIONAL_TOLERANCE,
+                                    TARGET_VOCATIONAL_PCT + VOCATIONAL_TOLERANCE)
+            },
+            "sectors": {"interval": sectors, "verdict": _verdict(*sectors, MIN_SECTOR_COVERAGE, math.inf)},
+            "age": {"interval": age, "verdict": age_verdict},
+        }
+
+    @staticmethod
+    def validate_sample(accumulator: ValidationAccumulator, confidence: float = DEFAULT_CONFIDENCE,
+                        population: Optional[int] = None, method: Optional[str] = None) -> Dict[str, Any]:
+        """Näherungsbericht aus einer Stichprobe
+
+        Wie ``validate_accumulator``, zusätzlich pro Metrik das
+        Konfidenzintervall (``confidence_interval``) und ``settled``: ob das
+        PASS/FAIL-Urteil bei dieser Stichprobengrösse statistisch feststeht.
+        Umfasst die Stichprobe die ganze Population, ist der Bericht exakt;
+        sonst werden die Intervalle mit bekannter Population endlich korrigiert.
+        ``method`` ist das Verfahren von ``io.sample_file``; bekannte
+        Einschränkungen stehen unter ``report["sample"]["caveat"]``.
+        """
+        report = StatisticsValidator.validate_accumulator(accumulator)
+        if "error" in report:
+            return report
+
+        exact = population is not None and accumulator.count >= population
+        z = z_for_confidence(confidence)
+        if population is not None and not exact:
+            # Endlichkeitskorrektur: Ziehen ohne Zurücklegen verkleinert die Streuung
+            z *= math.sqrt((population - accumulator.count) / max(population - 1, 1))
+        intervals = StatisticsValidator.confidence_intervals(accumulator, z)
+        validations = report["validations"]
+        for name, data in validations.items():
+            data["confidence_interval"] = intervals[name]["interval"]
+            data["settled"] = exact or intervals[name]["verdict"] == data["status"]
+
+        # Gesamtstatus steht fest, wenn die gesicherten Urteile allein genügen
+        total_validations = len(validations)
+        settled_passed = sum(1 for v in validations.values() if v["settled"] and v["status"] == "PASS")
+        settled_failed = sum(1 for v in validations.values() if v["settled"] and v["status"] == "FAIL")
+        report["summary"]["settled"] = (settled_passed >= total_validations * 0.8
+                                        or total_validations - settled_failed < total_validations * 0.8)
+        report["sample"] = {
+            "size": accumulator.count,
+            "population": population,
+            "confidence": confidence,
+            "exact": exact,
+            "method": method,
+            "caveat": SAMPLING_CAVEATS.get(method)
+        }
+        return report
+
+    @staticmethod
+    def generate_validation_report(cvs: CVCollection) -> str:
         """Generiert einen formatierten Validierungsbericht"""
         validation = StatisticsValidator.validate_cvs(cvs)
 
@@ -279,3 +574,72 @@ class StatisticsValidator:
         lines.append(f"Gesamtstatus: {summary['overall_status']}")
 
         return "\n".join(lines)
+
+
+class ValidationFailed(RuntimeError):
+    """Die Validierung schlägt mit Sicherheit fehl (``OnlineValidator`` mit ``fail_fast``)"""
+
+    def __init__(self, validator: "OnlineValidator"):
+        self.count = validator.accumulator.count
+        self.failing = validator.certain_failures()
+        self.report = validator.report()
+        super().__init__(f"Validierung nach {self.count} CVs sicher fehlgeschlagen: "
+                         f"{', '.join(self.failing)}")
+
+
+class OnlineValidator:
+    """Validiert chunkweise während der Generierung
+
+    Nach jedem Chunk werden die laufenden Zähler aktualisiert. Eine Metrik gilt
+    als sicher fehlgeschlagen, wenn ihr Konfidenzintervall (``z``) vollständig
+    ausserhalb der Toleranz aus ``_validate_*`` liegt; beobachtete Alters-
+    Extremwerte ausserhalb des Zielbereichs stehen sofort fest. Mit
+    ``fail_fast`` wird abgebrochen, sobald dadurch der Gesamtstatus FAIL
+    feststeht.
+    """
+
+    METRICS = ("gender", "regions", "education", "sectors", "age")
+
+    def __init__(self, fail_fast: bool = False, z: float = FAIL_FAST_Z,
+                 min_count: int = FAIL_FAST_MIN_COUNT):
+        self.fail_fast = fail_fast
+        self.z = z
+        self.min_count = min_count
+        self.accumulator = ValidationAccumulator()
+
+    def update(self, cvs: CVCollection) -> None:
+        """Zählt einen Chunk; wirft ``ValidationFailed``, wenn der Abbruch feststeht"""
+        self.accumulator.update(cvs)
+        if self.fail_fast and self.doomed():
+            raise ValidationFailed(self)
+
+    def report(self) -> Dict[str, Any]:
+        """Validierungsbericht über alle bisher gezählten CVs"""
+        return self.accumulator.report()
+
+    def certain_failures(self) -> List[str]:
+        """Metriken, deren FAIL bei der gewählten Konfidenz bereits feststeht"""
+        if self.accumulator.count < max(self.min_count, 1):
+            return ["age"] if _age_bounds_fail(self.accumulator.ages) else []
+        intervals = StatisticsValidator.confidence_intervals(self.accumulator, self.z)
+        return [name for name in self.METRICS if intervals[name]["verdict"] == "FAIL"]
+
+    def doomed(self) -> bool:
+        """True, wenn der Gesamtstatus (wie ``_generate_summary``) sicher FAIL wird"""
+        total_validations = len(self.METRICS)
+        return total_validations - len(self.certain_failures()) < total_validations * 0.8
+
+    def status_line(self) -> str:
+        """Kurze Zeile mit den laufenden Abweichungen für die Fortschrittsanzeige"""
+        if not self.accumulator.count:
+            return ""
+        validations = self.report()["validations"]
+        line = (f"Δ Geschlecht {validations['gender']['deviation']['male']:.1f} | "
+                f"Region {validations['regions']['max_deviation']:.1f} | "
+                f"Bildung {validations['education']['deviation']:.1f} | "
+                f"Sektoren {validations['sectors']['total_coverage']:.0f}% | "
+                f"Alter {validations['age']['deviation']:.1f}")
+        failing = self.certain_failures()
+        if failing:
+            line += f" | sicher FAIL: {', '.join(failing)}"
+        return line
@@ -8,9 +8,14 @@ from datetime import datetime
 
 from swiss_cv_generator.core.persona_generator import SwissPersonaGenerator
 from swiss_cv_generator.core.cv_generator import SwissCVGenerator
+from swiss_cv_generator.core.sampling import AliasSampler
 from swiss_cv_generator.utils.validators import StatisticsValidator
 from swiss_cv_generator.utils.exporters import BatchGenerator
 from swiss_cv_generator.data_models import Gender, LanguageRegion
+from swiss_cv_generator.cv_batch import CVBatch
+from swiss_cv_generator.data.statistics import SWISS_CANTONS
+from swiss_cv_generator.data.companies import SWISS_COMPANIES
+from swiss_cv_generator.data.catalog import get_catalog
 
 
 class TestSwissPersonaGenerator:
@@ -37,6 +42,16 @@ class TestSwissPersonaGenerator:
         assert persona.sector
         assert persona.sector_data
 
+    def test_sector_data_shared(self):
+        """Test dass Sektordaten geteilt und nicht pro Persona kopiert werden"""
+        first, second = (self.generator.generate_persona() for _ in range(2))
+        catalog = get_catalog()
+
+        assert first.sector_data is catalog.sector_data[first.sector]
+        assert "sector_data" not in first.dict()
+        if first.sector == second.sector:
+            assert first.sector_data is second.sector_data
+
     def test_age_distribution(self):
         """Test dass Altersverteilung realistisch ist"""
         personas = [self.generator.generate_persona() for _ in range(100)]
@@ -69,6 +84,120 @@ class TestSwissPersonaGenerator:
         assert 0.4 <= male_count / len(personas) <= 0.6
         assert 0.4 <= female_count / len(personas) <= 0.6
 
+    def test_vectorized_batch_distributions(self):
+        """Test dass die vektorisierte Batch-Ziehung die Zielverteilungen trifft"""
+        arrays = self.generator.generate_arrays(20000)
+        tables = arrays.tables
+
+        assert len(arrays) == 20000
+        assert arrays.age.min() >= 22
+        assert arrays.age.max() <= 65
+
+        region_share = (arrays.region == 0).mean()
+        assert abs(region_share - tables.region_p[0]) < 0.02
+        male_share = (arrays.gender == 0).mean()
+        assert abs(male_share - 0.52) < 0.02
+        for code, target in enumerate(tables.sector_p):
+            assert abs((arrays.sector == code).mean() - target) < 0.02
+
+    def test_vectorized_batch_personas(self):
+        """Test dass vektorisierte Personas regional konsistent sind"""
+        personas = self.generator.generate_batch(200)
+
+        assert len(personas) == 200
+        for persona in personas:
+            region = persona.personal.language_region.value
+            assert persona.personal.canton in SWISS_CANTONS[region]["cantons"]
+            assert persona.personal.city in SWISS_CANTONS[region]["major_cities"]
+            assert persona.personal.primary_language == SWISS_CANTONS[region]["language"]
+            assert persona.personal.birth_year == self.generator.current_year - persona.personal.age
+
+    def test_vectorized_batch_reproducible(self):
+        """Test dass gleiche Seeds gleiche Batches liefern"""
+        first = SwissPersonaGenerator(random_seed=7).generate_batch(50)
+        second = SwissPersonaGenerator(random_seed=7).generate_batch(50)
+
+        assert [p.personal for p in first] == [p.personal for p in second]
+
+    def test_vectorized_tables_released_with_catalog(self):
+        """Test dass eigene Kataloge den Tabellen-Cache nicht wachsen lassen"""
+        import gc
+        from swiss_cv_generator.core import vectorized
+        from swiss_cv_generator.data.catalog import ReferenceCatalog
+
+        catalog = ReferenceCatalog()
+        vectorized._get_tables(catalog)
+        assert catalog in vectorized._TABLES
+        size = len(vectorized._TABLES)
+        del catalog
+        gc.collect()
+        assert len(vectorized._TABLES) == size - 1
+
+
+class TestReferenceCatalog:
+    """Tests für den vorberechneten Referenzdaten-Katalog"""
+
+    def test_shared_between_generators(self):
+        """Test dass alle Generatoren denselben Katalog verwenden"""
+        first = SwissCVGenerator(random_seed=1)
+        second = SwissCVGenerator(random_seed=2)
+
+        assert first.catalog is second.catalog is get_catalog()
+        assert first.persona_generator.catalog is first.catalog
+
+    def test_precomputed_tables(self):
+        """Test abgeleitete Lookup-Tabellen"""
+        catalog = get_catalog()
+
+        assert all("Bachelor" in q for q in catalog.bachelor_qualifications)
+        assert all("Master" in q for q in catalog.master_qualifications)
+        assert catalog.companies_for("finance_banking", "large")[0] == "UBS"
+        assert catalog.companies_for("construction", "small") == tuple(SWISS_COMPANIES["small"])
+        assert catalog.companies_for("unbekannt", "medium") == tuple(SWISS_COMPANIES["medium"])
+        assert catalog.other_swiss_languages["deutsch"] == ("français", "italiano")
+
+    def test_read_only(self):
+        """Test dass Katalogdaten nicht verändert werden können"""
+        catalog = get_catalog()
+        region = LanguageRegion.TICINO
+
+        with pytest.raises(TypeError):
+            catalog.sector_data["education"]["percentage"] = 0
+        with pytest.raises(TypeError):
+            catalog.education_preferences[region]["academic"] = 1.0
+        assert isinstance(catalog.cantons[region], tuple)
+
+
+class TestAliasSampler:
+    """Tests für die vorkompilierten Alias-Sampler"""
+
+    def test_scalar_distribution(self):
+        """Test dass skalare Ziehungen die Gewichte treffen"""
+        sampler = AliasSampler(["a", "b", "c", "d"], [50, 30, 15, 5])
+        rng = random.Random(1)
+        draws = [sampler.sample(rng) for _ in range(40000)]
+
+        for value, target in zip(sampler.values, sampler.probabilities()):
+            assert abs(draws.count(value) / len(draws) - target) < 0.01
+
+    def test_batched_distribution(self):
+        """Test dass NumPy-Ziehungen die Gewichte treffen"""
+        import numpy as np
+
+        sampler = AliasSampler(list(range(6)), [1, 2, 3, 4, 5, 0])
+        indices = sampler.sample_indices(np.random.default_rng(2), 60000)
+        shares = np.bincount(indices, minlength=6) / len(indices)
+
+        assert np.allclose(shares, sampler.probabilities(), atol=0.01)
+        assert shares[5] == 0
+
+    def test_invalid_weights(self):
+        """Test Fehler bei ungültigen Gewichten"""
+        with pytest.raises(ValueError):
+            AliasSampler(["a", "b"], [0, 0])
+        with pytest.raises(ValueError):
+            AliasSampler(["a"], [1, 2])
+
 
 class TestSwissCVGenerator:
     """Tests für die CV-Generierung"""
@@ -130,6 +259,78 @@ class TestSwissCVGenerator:
             max_possible_experience = age - 18
             assert experience <= max_possible_experience + 2  # +2 für Toleranz
 
+    def test_independent_instances(self):
+        """Test dass sich Generatoren im selben Prozess nicht beeinflussen"""
+        reference = [cv.dict(exclude={"generated_date"})
+                     for cv in SwissCVGenerator(random_seed=11).generate_batch(5)]
+
+        first = SwissCVGenerator(random_seed=11)
+        second = SwissCVGenerator(random_seed=12)
+        interleaved = []
+        for _ in range(5):
+            interleaved.append(first.generate_cv().dict(exclude={"generated_date"}))
+            second.generate_cv()
+
+        assert interleaved == reference
+
+    def test_seed_zero_is_reproducible(self):
+        """Test dass auch Seed 0 reproduzierbar ist"""
+        first = SwissCVGenerator(random_seed=0).generate_cv()
+        second = SwissCVGenerator(random_seed=0).generate_cv()
+
+        assert first.dict(exclude={"generated_date"}) == second.dict(exclude={"generated_date"})
+
+    def test_thread_pool_reproducible(self):
+        """Test reproduzierbare Generierung in parallelen Threads"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(seed):
+            cvs = SwissCVGenerator(random_seed=seed).generate_batch(20)
+            return [cv.dict(exclude={"generated_date"}) for cv in cvs]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            parallel = list(executor.map(run, range(8)))
+
+        assert parallel == [run(seed) for seed in range(8)]
+
+    def test_iter_cvs(self):
+        """Test lazy Generierung einzeln und in Chunks"""
+        single = list(self.generator.iter_cvs(count=7))
+        chunks = list(self.generator.iter_cvs(count=7, chunk_size=3))
+
+        assert len(single) == 7
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+        endless = self.generator.iter_cvs()
+        assert all(next(endless).cv_id for _ in range(5))
+
+        # Chunk-Grösse und Worker-Anzahl unter 1 würden endlos leere Chunks liefern
+        with pytest.raises(ValueError):
+            next(self.generator.iter_cvs(count=7, chunk_size=0))
+        batch_generator = BatchGenerator(self.generator)
+        with pytest.raises(ValueError):
+            batch_generator.generate_batch(7, chunk_size=-1)
+        with pytest.raises(ValueError):
+            next(batch_generator.iter_batches(7, workers=0))
+
+    @pytest.mark.parametrize("validation", ["sample", "never"])
+    def test_validation_policy_same_result(self, validation):
+        """Test dass der schnelle Pfad dieselben CVs wie der validierte erzeugt"""
+        validated = SwissCVGenerator(random_seed=7).generate_batch(30)
+        fast = SwissCVGenerator(random_seed=7, validation=validation,
+                                validation_interval=5).generate_batch(30)
+
+        assert [cv.dict(exclude={"generated_date"}) for cv in fast] == \
+            [cv.dict(exclude={"generated_date"}) for cv in validated]
+        assert all(cv.education_level and cv.total_experience_years >= 0 for cv in fast)
+
+    def test_invalid_validation_policy(self):
+        """Test unbekannte Validierungsrichtlinie"""
+        with pytest.raises(ValueError):
+            SwissCVGenerator(validation="sometimes")
+        with pytest.raises(ValueError):
+            SwissCVGenerator(validation="sample", validation_interval=0)
+
     def test_language_skills(self):
         """Test Sprachkenntnisse basierend auf Region"""
         cv = self.generator.generate_cv()
@@ -146,6 +347,41 @@ class TestSwissCVGenerator:
         assert "english" in languages
 
 
+def test_construct_model_matches_pydantic(monkeypatch):
+    """Test dass der schnelle Modellaufbau model_construct von pydantic entspricht"""
+    from pydantic import BaseModel, PrivateAttr
+    from swiss_cv_generator import data_models
+    from swiss_cv_generator.data_models import CV, construct_model
+
+    if not hasattr(BaseModel, "model_construct"):
+        pytest.skip("nur für pydantic v2")
+
+    cv = SwissCVGenerator(random_seed=3, validation="never").generate_cv()
+    models = [cv, cv.persona, cv.persona.personal, cv.skills, *cv.education, *cv.career]
+    for model in models:
+        model_cls = type(model)
+        values = {name: getattr(model, name) for name in model.model_fields_set}
+        fast = construct_model(model_cls, **values)
+        reference = model_cls.model_construct(_fields_set=set(values), **values)
+        assert fast.__dict__ == reference.__dict__
+        assert fast.model_fields_set == reference.model_fields_set
+        assert fast.__pydantic_extra__ == reference.__pydantic_extra__
+        assert fast.__pydantic_private__ == reference.__pydantic_private__
+        assert fast == reference
+
+    class WithPrivate(BaseModel):
+        name: str
+        _cache: dict = PrivateAttr(default_factory=dict)
+
+    model = construct_model(WithPrivate, name="x")
+    model._cache["key"] = 1
+    assert model._cache == {"key": 1}
+
+    # Ungeprüfte pydantic-Versionen nutzen model_construct
+    monkeypatch.setattr(data_models, "_FAST_CONSTRUCT", False)
+    assert construct_model(type(cv.skills), **cv.skills.__dict__) == cv.skills
+
+
 class TestStatisticsValidator:
     """Tests für die Statistik-Validierung"""
 
@@ -188,6 +424,77 @@ class TestStatisticsValidator:
         assert "VALIDIERUNGSBERICHT" in report
         assert "ZUSAMMENFASSUNG" in report
 
+    def test_accumulator_merge(self):
+        """Test dass zusammengeführte Teil-Akkumulatoren dem Gesamtbericht entsprechen"""
+        from swiss_cv_generator.utils.validators import ValidationAccumulator
+
+        cvs = [self.generator.generate_cv() for _ in range(41)]
+        merged = ValidationAccumulator.from_cvs(cvs[:10])
+        merged.merge(ValidationAccumulator.from_cvs(CVBatch.from_cvs(cvs[10:])))
+
+        assert merged.count == 41
+        assert merged.report() == StatisticsValidator.validate_cvs(cvs)
+        assert merged.age_median() == sorted(cv.persona.personal.age for cv in cvs)[20]
+
+    def test_online_fail_fast(self):
+        """Test laufende Validierung: kein Fehlalarm, Abbruch bei sicherem FAIL"""
+        from swiss_cv_generator.utils.validators import OnlineValidator, ValidationFailed
+
+        validator = OnlineValidator(fail_fast=True, min_count=100)
+        for chunk in self.generator.iter_cvs(600, chunk_size=200):
+            validator.update(chunk)
+        assert validator.certain_failures() == []
+        assert validator.report() == StatisticsValidator.validate_cvs(
+            SwissCVGenerator(random_seed=42).generate_batch(600))
+
+        # Immer derselbe CV: Geschlecht und Sprachregion liegen sicher daneben
+        skewed = OnlineValidator(fail_fast=True, min_count=100)
+        with pytest.raises(ValidationFailed) as error:
+            skewed.update([self.generator.generate_cv()] * 500)
+        assert {"gender", "regions"} <= set(error.value.failing)
+        assert error.value.report["summary"]["overall_status"] == "FAIL"
+
+
+class TestCVBatch:
+    """Tests für den spaltenorientierten CV-Container"""
+
+    def setup_method(self):
+        """Setup für jeden Test"""
+        self.generator = SwissCVGenerator(random_seed=42)
+        self.cvs = self.generator.generate_batch(40)
+        self.batch = CVBatch.from_cvs(self.cvs)
+
+    def test_roundtrip(self):
+        """Test dass CV-Views den Original-CVs entsprechen"""
+        assert len(self.batch) == 40
+        for original, view in zip(self.cvs, self.batch):
+            assert view == original
+        assert self.batch[-1] == self.cvs[-1]
+
+    def test_slice_and_concat(self):
+        """Test Slices ohne Kopie und Zusammenfügen"""
+        part = self.batch[10:25]
+        assert len(part) == 15
+        assert part.columns["age"].base is self.batch.columns["age"]
+        assert list(part) == self.cvs[10:25]
+
+        merged = CVBatch.concat([self.batch[:13], self.batch[13:]])
+        assert list(merged) == self.cvs
+
+    def test_validation_matches_list(self):
+        """Test dass Validierung für Batch und Liste identisch ist"""
+        from_list = StatisticsValidator.validate_cvs(self.cvs)
+        from_batch = StatisticsValidator.validate_cvs(self.batch)
+
+        assert from_batch["validations"] == from_list["validations"]
+
+    def test_columnar_generation(self):
+        """Test direkte Generierung als CVBatch"""
+        batch = SwissCVGenerator(random_seed=1).generate_batch(10, columnar=True)
+        assert isinstance(batch, CVBatch)
+        assert len(batch) == 10
+        assert sum(batch.value_counts("gender").values()) == 10
+
 
 class TestBatchGenerator:
     """Tests für Batch-Generierung und Export"""
@@ -236,6 +543,535 @@ class TestBatchGenerator:
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
 
+    def test_export_json_sector_table(self, tmp_path):
+        """Test dass der JSON-Export die Sektordaten einmal in den Metadaten enthält"""
+        import json
+
+        cvs = self.batch_generator.generate_batch(5)
+        filename = tmp_path / "cvs.json"
+        self.batch_generator.export_json(cvs, str(filename))
+
+        data = json.loads(filename.read_text(encoding="utf-8"))
+        sectors = data["metadata"]["sectors"]
+        assert all(cv["persona"]["sector"] in sectors for cv in data["cvs"])
+        assert all("sector_data" not in cv["persona"] for cv in data["cvs"])
+
+
+class TestParallelBatchGeneration:
+    """Tests für die parallele Generierung mit abgeleiteten Seeds"""
+
+    @staticmethod
+    def _fingerprint(cvs):
+        return [cv.dict(exclude={"generated_date"}) for cv in cvs]
+
+    def test_identical_for_any_worker_count(self):
+        """Test dass das Ergebnis nicht von der Worker-Anzahl abhängt"""
+        batch_generator = BatchGenerator(SwissCVGenerator())
+
+        serial = batch_generator.generate_batch(120, seed=99, chunk_size=25)
+        parallel = batch_generator.generate_batch(120, seed=99, workers=3, chunk_size=25)
+
+        assert len(parallel) == 120
+        assert self._fingerprint(serial) == self._fingerprint(parallel)
+
+    def test_workers_use_generator_options(self):
+        """Test dass Worker die Validierungsrichtlinie übernehmen"""
+        generator = SwissCVGenerator(validation="never")
+        batch_generator = BatchGenerator(generator)
+
+        validated = BatchGenerator(SwissCVGenerator()).generate_batch(40, seed=3, chunk_size=10)
+        fast = batch_generator.generate_batch(40, seed=3, workers=2, chunk_size=10)
+
+        assert generator.generator_options()["validation"] == "never"
+        assert self._fingerprint(fast) == self._fingerprint(validated)
+
+    def test_columnar_parallel(self):
+        """Test parallele Generierung als CVBatch"""
+        batch_generator = BatchGenerator(SwissCVGenerator())
+
+        cvs = batch_generator.generate_batch(60, seed=5, chunk_size=20)
+        batch = batch_generator.generate_batch(60, seed=5, workers=2, chunk_size=20, columnar=True)
+
+        assert isinstance(batch, CVBatch)
+        assert self._fingerprint(batch) == self._fingerprint(cvs)
+
+
+def test_streaming_csv_export(tmp_path):
+    """Test CSV-Export direkt aus einem CV-Strom"""
+    import pandas as pd
+
+    generator = SwissCVGenerator(random_seed=3)
+    batch_generator = BatchGenerator(generator)
+    filename = tmp_path / "stream.csv"
+
+    result = batch_generator.export_csv(generator.iter_cvs(count=12, chunk_size=5), str(filename))
+    df = pd.read_csv(filename)
+
+    assert "12 CVs" in result
+    assert len(df) == 12
+    assert "hobbies_list" in df.columns
+
+    # Leere Eingaben scheitern, bevor eine Datei angelegt wird
+    for empty in (lambda: iter([]), lambda: [], lambda: iter([[], []])):
+        with pytest.raises(ValueError):
+            batch_generator.export_csv(empty(), str(tmp_path / "empty.csv"))
+        with pytest.raises(ValueError):
+            batch_generator.export_pipelined(empty(), str(tmp_path / "empty.ndjson"), "ndjson")
+    assert not (tmp_path / "empty.csv").exists() and not (tmp_path / "empty.ndjson").exists()
+
+
+def test_csv_sink_batch_chunks(tmp_path):
+    """Test dass CVBatch-Chunks dieselben Zeilen wie CV-Listen ergeben"""
+    from swiss_cv_generator.utils.sinks import CSVSink, CSV_COLUMNS
+
+    cvs = SwissCVGenerator(random_seed=8).generate_batch(40)
+    batch = CVBatch.from_cvs(cvs)
+
+    with CSVSink(str(tmp_path / "list.csv")) as sink:
+        sink.write_all([cvs[:15], cvs[15:]])
+    with CSVSink(str(tmp_path / "batch.csv")) as sink:
+        sink.write_all([batch[:15], batch[15:]])
+
+    content = (tmp_path / "list.csv").read_text(encoding="utf-8")
+    assert content == (tmp_path / "batch.csv").read_text(encoding="utf-8")
+    assert content.split("\n", 1)[0] == ",".join(CSV_COLUMNS)
+    assert content.count("\n") == 41
+
+
+def test_ndjson_export(tmp_path):
+    """Test JSON-Lines-Export mit Metadaten-Sidecar"""
+    import json
+
+    generator = SwissCVGenerator(random_seed=4)
+    batch_generator = BatchGenerator(generator)
+    cvs = generator.generate_batch(10)
+    filename = tmp_path / "cvs.ndjson"
+
+    batch_generator.export_ndjson(iter([cvs[:4], cvs[4:]]), str(filename))
+
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    metadata = json.loads((tmp_path / "cvs.ndjson.meta.json").read_text(encoding="utf-8"))
+    assert len(lines) == 10
+    assert json.loads(lines[3]) == json.loads(json.dumps(cvs[3].dict(), default=str))
+    assert metadata["total_cvs"] == 10
+    assert cvs[0].persona.sector in metadata["sectors"]
+
+
+def test_streaming_json_export(tmp_path):
+    """Test dass der JSON-Export aus einem Strom dieselben CVs wie aus einer Liste schreibt"""
+    import json
+
+    generator = SwissCVGenerator(random_seed=4)
+    batch_generator = BatchGenerator(generator)
+    cvs = generator.generate_batch(7)
+
+    batch_generator.export_json(cvs, str(tmp_path / "list.json"))
+    batch_generator.export_json(iter([cvs[:3], cvs[3:]]), str(tmp_path / "stream.json"), pretty=False)
+
+    from_list = json.loads((tmp_path / "list.json").read_text(encoding="utf-8"))
+    from_stream = json.loads((tmp_path / "stream.json").read_text(encoding="utf-8"))
+    assert list(from_list) == ["metadata", "cvs"]
+    assert from_stream["cvs"] == from_list["cvs"]
+    assert from_stream["metadata"]["total_cvs"] == 7
+
+
+def test_parquet_export(tmp_path):
+    """Test normalisierter Parquet-Export, auch partitioniert"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    import pyarrow.dataset as ds
+
+    generator = SwissCVGenerator(random_seed=6)
+    batch_generator = BatchGenerator(generator)
+    cvs = generator.generate_batch(30)
+
+    batch_generator.export_parquet(iter([cvs[:10], cvs[10:]]), str(tmp_path / "flat"))
+    table = pq.read_table(tmp_path / "flat" / "cvs.parquet")
+    career = pq.read_table(tmp_path / "flat" / "career.parquet")
+    assert table.column("cv_id").to_pylist() == [cv.cv_id for cv in cvs]
+    assert str(table.schema.field("sector").type).startswith("dictionary")
+    assert career.num_rows == sum(len(cv.career) for cv in cvs)
+
+    batch_generator.export_parquet(cvs, str(tmp_path / "parts"), partition_by=["language_region"])
+    education = ds.dataset(tmp_path / "parts" / "education", format="parquet", partitioning="hive")
+    assert education.count_rows() == sum(len(cv.education) for cv in cvs)
+    assert (tmp_path / "parts" / "metadata.json").exists()
+
+    with pytest.raises(ValueError):
+        batch_generator.export_parquet(cvs, str(tmp_path / "bad"), partition_by=["city"])
+
+
+def test_partition_columns_with_duplicate_cv_ids():
+    """Test Partitionierungs-Spalten der Detailtabellen bei doppelter cv_id"""
+    from swiss_cv_generator.utils.tables import normalize_cvs
+
+    generator = SwissCVGenerator(random_seed=13)
+    cvs = generator.generate_batch(40)
+    first = cvs[0]
+    second = next(cv for cv in cvs if cv.persona.sector != first.persona.sector)
+    second.cv_id = first.cv_id
+
+    tables = normalize_cvs([first, second], propagate=["sector"])
+    for table in ("education", "career", "skills", "languages"):
+        rows = [len(normalize_cvs([cv])[table]["cv_id"]) for cv in (first, second)]
+        assert tables[table]["sector"] == ([first.persona.sector] * rows[0]
+                                           + [second.persona.sector] * rows[1])
+
+    pytest.importorskip("pyarrow")
+    from swiss_cv_generator.utils.sinks import to_arrow_tables
+    career = to_arrow_tables([first, second], ["sector"])["career"]
+    assert career.column("sector").to_pylist() == tables["career"]["sector"]
+
+
+def test_mark_partial_after_abort(tmp_path):
+    """Test dass nach einem Abbruch keine Ausgabe vollständig aussieht"""
+    from swiss_cv_generator.utils.sinks import PARTIAL_MARKER, mark_partial
+
+    generator = SwissCVGenerator(random_seed=23)
+    batch_generator = BatchGenerator(generator)
+
+    def aborted():
+        yield generator.generate_batch(5)
+        raise RuntimeError("Abbruch")
+
+    def abort_and_mark(name, format, **options):
+        filename = str(tmp_path / name)
+        with pytest.raises(RuntimeError):
+            batch_generator.export(aborted(), filename, format, **options)
+        mark_partial(filename)
+        return sorted(path.name for path in tmp_path.iterdir() if path.name.startswith(name))
+
+    assert abort_and_mark("cvs.ndjson", "ndjson") == ["cvs.ndjson.partial", "cvs.ndjson.partial.meta.json"]
+    assert mark_partial(str(tmp_path / "fehlt.csv")) == []
+
+    pytest.importorskip("pyarrow")
+    assert abort_and_mark("parts.parquet", "parquet", partition_by=["sector"]) == ["parts.parquet.partial"]
+    assert (tmp_path / "parts.parquet.partial" / PARTIAL_MARKER).exists()
+    assert mark_partial(str(tmp_path / "fehlt.csv")) == []
+
+
+def test_sqlite_export(tmp_path):
+    """Test SQLite-Export mit normalisiertem Schema, auch aus spaltenorientierten Batches"""
+    import sqlite3
+    from swiss_cv_generator.utils.sinks import batch_sqlite_rows, sqlite_rows
+
+    generator = SwissCVGenerator(random_seed=8)
+    batch_generator = BatchGenerator(generator)
+    batch = generator.generate_batch(30, columnar=True)
+    cvs = list(batch)
+    assert batch_sqlite_rows(batch, 1) == sqlite_rows(cvs, 1)
+
+    filename = tmp_path / "cvs.sqlite"
+    batch_generator.export(iter([batch[:10], cvs[10:]]), str(filename), "sqlite", commit_every=10)
+    connection = sqlite3.connect(filename)
+    rows = connection.execute("SELECT id, cv_id FROM cvs ORDER BY id").fetchall()
+    assert rows == [(i, cv.cv_id) for i, cv in enumerate(cvs, start=1)]
+    hobbies = connection.execute("SELECT COUNT(*) FROM hobbies").fetchone()[0]
+    assert hobbies == sum(len(cv.hobbies) for cv in cvs)
+    current = connection.execute(
+        "SELECT c.current_position FROM cvs c JOIN career k ON k.cv = c.id "
+        "WHERE k.end_year IS NULL ORDER BY c.id LIMIT 1"
+    ).fetchone()[0]
+    assert current is not None
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_cvs_sector", "idx_career_position"} <= indexes
+    connection.close()
+
+
+def test_cvb_archive_roundtrip(tmp_path):
+    """Test binäres Archiv: verlustfreies Lesen als CVs und als CVBatch"""
+    from swiss_cv_generator.utils.archive import CVArchiveReader, read_archive
+
+    generator = SwissCVGenerator(random_seed=9)
+    batch_generator = BatchGenerator(generator)
+    batch = generator.generate_batch(20, columnar=True)
+    cvs = generator.generate_batch(15)
+    filename = tmp_path / "cvs.cvb"
+
+    batch_generator.export(iter([batch, cvs]), str(filename), "cvb")
+
+    expected = [cv.to_dict() for cv in list(batch) + cvs]
+    assert [cv.to_dict() for cv in read_archive(str(filename))] == expected
+    loaded = read_archive(str(filename), columnar=True)
+    assert isinstance(loaded, CVBatch)
+    assert loaded.value_counts("sector") == CVBatch.from_cvs(list(batch) + cvs).value_counts("sector")
+
+    reader = CVArchiveReader(str(filename))
+    assert len(reader) == 35 and reader.chunk_sizes == [20, 15]
+    assert reader.metadata["total_cvs"] == 35
+
+    filename.write_bytes(b"kein Archiv" * 10)
+    with pytest.raises(ValueError):
+        CVArchiveReader(str(filename))
+
+
+def test_cvb_random_access(tmp_path):
+    """Test wahlfreier Zugriff über die Speicherabbildung: Position, cv_id, Slices"""
+    import pickle
+    from swiss_cv_generator.utils.archive import CVArchiveReader
+
+    generator = SwissCVGenerator(random_seed=10)
+    chunks = [generator.generate_batch(12, columnar=True) for _ in range(3)]
+    cvs = [cv for chunk in chunks for cv in chunk]
+    filename = str(tmp_path / "cvs.cvb")
+    BatchGenerator(generator).export_cvb(iter(chunks), filename)
+
+    with CVArchiveReader(filename) as reader:
+        assert reader[17].to_dict() == cvs[17].to_dict()
+        assert reader[-1].cv_id == cvs[-1].cv_id
+        assert reader.get(cvs[30].cv_id).cv_id == cvs[30].cv_id
+        assert 30 in reader.positions_of(cvs[30].cv_id)
+        with pytest.raises(KeyError):
+            reader.get("CH-CV-000000")
+        with pytest.raises(IndexError):
+            reader[len(cvs)]
+
+        inside = reader[13:20]
+        assert [cv.cv_id for cv in inside] == [cv.cv_id for cv in cvs[13:20]]
+        assert not inside.columns["age"].flags.owndata
+        assert [cv.cv_id for cv in reader[10:26]] == [cv.cv_id for cv in cvs[10:26]]
+
+        # Archive ohne Index (Version 1) bauen ihn beim ersten Zugriff auf
+        reader._id_index = None
+        assert reader.positions_of(cvs[5].cv_id)[0] <= 5
+
+        copy = pickle.loads(pickle.dumps(reader))
+        assert copy[3].cv_id == cvs[3].cv_id
+
+
+def test_bulk_render(tmp_path):
+    """Test Massen-Rendering in Verzeichnis und Archiv, unabhängig von der Worker-Anzahl"""
+    import zipfile
+    from swiss_cv_generator.utils.renderer import render_text
+
+    generator = SwissCVGenerator(random_seed=4)
+    cv = generator.generate_cv()
+    assert render_text(cv) == cv.to_formatted_text()
+
+    batch_generator = BatchGenerator(generator)
+    written = batch_generator.render(25, str(tmp_path / "docs"), "markdown", seed=5, chunk_size=10)
+    batch_generator.render(25, str(tmp_path / "docs.zip"), "markdown", workers=2, seed=5,
+                           chunk_size=10)
+
+    names = sorted(p.name for p in (tmp_path / "docs").iterdir())
+    assert written == len(names) == 25
+    assert names[0].startswith("000001_") and names[0].endswith(".md")
+    with zipfile.ZipFile(tmp_path / "docs.zip") as archive:
+        assert sorted(archive.namelist()) == names
+        assert archive.read(names[3]).decode("utf-8") == (tmp_path / "docs" / names[3]).read_text(encoding="utf-8")
+
+
+def test_load_cvs_roundtrip(tmp_path):
+    """Test gestreamtes Zurücklesen von JSON/NDJSON/CSV inkl. Projektion"""
+    from swiss_cv_generator.io import load_cvs
+    from swiss_cv_generator.utils.sinks import csv_row
+
+    generator = SwissCVGenerator(random_seed=21)
+    batch_generator = BatchGenerator(generator)
+    cvs = generator.generate_batch(30)
+    expected = [cv.to_dict() for cv in cvs]
+
+    for name, format in [("cvs.json", "json"), ("cvs.ndjson.gz", "ndjson")]:
+        filename = str(tmp_path / name)
+        batch_generator.export(cvs, filename, format)
+        assert [cv.to_dict() for cv in load_cvs(filename)] == expected
+        chunks = list(load_cvs(filename, columnar=True, chunk_size=12))
+        assert [len(chunk) for chunk in chunks] == [12, 12, 6]
+        assert isinstance(chunks[0], CVBatch)
+
+    fields = ["cv_id", "age", "education_level", "current_position", "languages"]
+    projected = [{name: csv_row(cv)[name] for name in fields} for cv in cvs]
+    filename = str(tmp_path / "cvs.csv")
+    batch_generator.export(cvs, filename, "csv")
+    for path in (filename, str(tmp_path / "cvs.json")):
+        assert list(load_cvs(path, fields=fields)) == projected
+        columns = next(load_cvs(path, fields=["age"], columnar=True))
+        assert columns == {"age": [cv.persona.personal.age for cv in cvs]}
+
+    with pytest.raises(ValueError):
+        next(load_cvs(filename, fields=["unbekannt"]))
+
+
+def test_validate_file_out_of_core(tmp_path):
+    """Test blockweise Validierung von Dateien: gleicher Bericht wie validate_cvs"""
+    from swiss_cv_generator.io import accumulate_file
+
+    generator = SwissCVGenerator(random_seed=24)
+    batch_generator = BatchGenerator(generator)
+    cvs = generator.generate_batch(60)
+    expected = StatisticsValidator.validate_cvs(cvs)
+
+    for name, format in [("cvs.csv", "csv"), ("cvs.ndjson.gz", "ndjson"), ("cvs.json", "json")]:
+        filename = str(tmp_path / name)
+        batch_generator.export(cvs, filename, format)
+        assert accumulate_file(filename, block_size=2000).report() == expected
+
+    assert accumulate_file(str(tmp_path / "cvs.csv"), workers=2, block_size=4000).report() == expected
+
+
+def test_validate_sample(tmp_path):
+    """Test Näherungsvalidierung aus Stichproben mit Konfidenzintervallen"""
+    from swiss_cv_generator.io import reservoir_sample, sample_file
+    from swiss_cv_generator.utils.validators import STRATIFIED_BYTES
+
+    generator = SwissCVGenerator(random_seed=25)
+    batch_generator = BatchGenerator(generator)
+    cvs = generator.generate_batch(80)
+    expected = StatisticsValidator.validate_cvs(cvs)
+
+    sample, total = reservoir_sample(iter(range(1000)), 50, random.Random(1))
+    assert total == 1000 and len(set(sample)) == 50
+
+    for name, format in [("cvs.csv", "csv"), ("cvs.ndjson.gz", "ndjson"), ("cvs.cvb", "cvb")]:
+        filename = str(tmp_path / name)
+        batch_generator.export(cvs, filename, format)
+
+        accumulator, population, method = sample_file(filename, 30, seed=1)
+        assert 0 < accumulator.count <= 30
+        report = StatisticsValidator.validate_sample(accumulator, 0.95, population, method)
+        for data in report["validations"].values():
+            assert "confidence_interval" in data and isinstance(data["settled"], bool)
+        low, high = report["validations"]["gender"]["confidence_interval"]
+        assert 0 <= low <= high <= 100
+
+        # Byte-Positionen: Population geschätzt, Einschränkung im Bericht
+        if method == STRATIFIED_BYTES:
+            assert 40 <= population <= 160 and report["sample"]["caveat"]
+        else:
+            assert population == 80 and report["sample"]["caveat"] is None
+
+        # Endlichkeitskorrektur verengt die Intervalle gegenüber unbekannter Population
+        unbounded = StatisticsValidator.validate_sample(accumulator, 0.95)
+        wide_low, wide_high = unbounded["validations"]["gender"]["confidence_interval"]
+        assert high - low < wide_high - wide_low
+
+        # Stichprobe grösser als die Datei: exakter Bericht, alle Urteile gesichert
+        accumulator, population, method = sample_file(filename, 1000, seed=1)
+        report = StatisticsValidator.validate_sample(accumulator, population=population)
+        assert method == "vollständig" and report["sample"]["exact"]
+        assert all(data["settled"] for data in report["validations"].values())
+        assert report["validations"]["gender"]["actual"] == expected["validations"]["gender"]["actual"]
+
+
+def test_supported_compressions(tmp_path):
+    """Test dass die angebotenen Kompressionen zu den Sinks passen"""
+    from swiss_cv_generator.utils.sinks import open_sink, supported_compressions
+
+    assert supported_compressions("ndjson") == ("none", "gzip", "xz", "zstd")
+    assert "xz" not in supported_compressions("parquet")
+    for format in ("parquet", "sqlite", "cvb"):
+        with pytest.raises(ValueError):
+            open_sink(format, str(tmp_path / f"out.{format}"), compression="xz")
+
+
+def test_excel_sheet_rollover(tmp_path):
+    """Test Excel-Export im write-only-Modus mit Aufteilung auf Folgeblätter"""
+    import pandas as pd
+    from swiss_cv_generator.utils.sinks import ExcelSink
+
+    cvs = SwissCVGenerator(random_seed=2).generate_batch(20)
+    filename = tmp_path / "cvs.xlsx"
+
+    with ExcelSink(str(filename), max_rows=11) as sink:
+        sink.write_all([cvs[:8], cvs[8:]])
+
+    sheets = pd.read_excel(filename, sheet_name=None)
+    assert [len(sheets[name]) for name in ("CVs_Übersicht", "CVs_Übersicht_2")] == [10, 10]
+    career = pd.concat([df for name, df in sheets.items() if name.startswith("Karriereverläufe")])
+    assert len(career) == sum(len(cv.career) for cv in cvs)
+    assert "Karriereverläufe_2" in sheets
+
+
+class TestCompressedExport:
+    """Tests für die transparente Kompression der Textformate"""
+
+    def setup_method(self):
+        generator = SwissCVGenerator(random_seed=13)
+        self.batch_generator = BatchGenerator(generator)
+        self.cvs = generator.generate_batch(40)
+
+    @staticmethod
+    def _read(filename) -> str:
+        import gzip
+        import lzma
+
+        opener = {".gz": gzip.open, ".xz": lzma.open}[filename.suffix]
+        with opener(filename, "rt", encoding="utf-8", newline="") as f:
+            return f.read()
+
+    @pytest.mark.parametrize("suffix", [".gz", ".xz"])
+    @pytest.mark.parametrize("threads", [1, 3])
+    def test_compression_by_suffix(self, tmp_path, suffix, threads):
+        """Test Kompression anhand der Dateiendung, seriell und blockweise parallel"""
+        from swiss_cv_generator.utils import compression
+
+        self.batch_generator.export_csv(self.cvs, str(tmp_path / "plain.csv"))
+        target = tmp_path / f"cvs.csv{suffix}"
+        # Kleine Blöcke, damit mehrere Blöcke parallel komprimiert werden
+        block_size = compression.DEFAULT_BLOCK_SIZE
+        compression.DEFAULT_BLOCK_SIZE = 1024
+        try:
+            self.batch_generator.export_csv(self.cvs, str(target), compress_threads=threads)
+        finally:
+            compression.DEFAULT_BLOCK_SIZE = block_size
+
+        assert self._read(target) == (tmp_path / "plain.csv").read_text(encoding="utf-8")
+
+    def test_explicit_compression(self, tmp_path):
+        """Test explizite Kompression unabhängig von der Endung"""
+        import gzip
+
+        target = tmp_path / "cvs.ndjson"
+        self.batch_generator.export_ndjson(self.cvs, str(target), compression="gzip")
+
+        with gzip.open(target, "rt", encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 40
+        with pytest.raises(ValueError):
+            self.batch_generator.export_csv(self.cvs, str(tmp_path / "x.csv"), compression="rar")
+
+    def test_zstd(self, tmp_path):
+        """Test zstd-Kompression (optionales Paket zstandard)"""
+        zstandard = pytest.importorskip("zstandard")
+
+        target = tmp_path / "cvs.json.zst"
+        self.batch_generator.export_json(self.cvs, str(target), compress_threads=2)
+        with zstandard.open(target, "rt", encoding="utf-8") as f:
+            assert '"cvs"' in f.read()
+
+
+class TestPipelineExport:
+    """Tests für den Pipeline-Export mit Hintergrund-Threads"""
+
+    def setup_method(self):
+        self.generator = SwissCVGenerator(random_seed=12)
+        self.batch_generator = BatchGenerator(self.generator)
+
+    @pytest.mark.parametrize("format", ["csv", "ndjson"])
+    def test_same_output_as_direct_export(self, tmp_path, format):
+        """Test dass die Pipeline dieselbe Datei wie der direkte Export schreibt"""
+        cvs = self.generator.generate_batch(30)
+        chunks = [cvs[:10], cvs[10:20], cvs[20:]]
+
+        self.batch_generator.export(iter(chunks), str(tmp_path / "direct"), format)
+        stats = self.batch_generator.export_pipelined(iter(chunks), str(tmp_path / "piped"), format,
+                                                      queue_size=1)
+
+        assert (tmp_path / "piped").read_bytes() == (tmp_path / "direct").read_bytes()
+        assert stats.count == 30
+        assert [stage.chunks for stage in stats.stages] == [3, 3, 3]
+        assert "CVs/s" in stats.summary()
+
+    def test_error_in_stage_is_raised(self, tmp_path):
+        """Test dass Fehler im Serialisierer-Thread beim Aufrufer ankommen"""
+        def chunks():
+            yield self.generator.generate_batch(5)
+            yield ["kein CV"]
+            while True:
+                yield self.generator.generate_batch(5)
+
+        with pytest.raises(AttributeError):
+            self.batch_generator.export_pipelined(chunks(), str(tmp_path / "out.csv"), "csv",
+                                                  queue_size=1)
+
 
 # Integration Test
 def test_full_workflow():
@@ -0,0 +1,42 @@
+"""
+Regressionstests für die Import-Zeit (keine schweren Abhängigkeiten beim Start)
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["pandas", "numpy", "openpyxl", "pyarrow"]
+
+
+def _loaded_heavy_modules(statement: str):
+    code = (
+        f"import sys; {statement}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+@pytest.mark.parametrize("statement", [
+    "import swiss_cv_generator",
+    "import swiss_cv_generator.cli",
+    "from swiss_cv_generator import SwissCVGenerator; SwissCVGenerator(1).generate_cv()",
+    "from swiss_cv_generator.utils.exporters import BatchGenerator, CVFormatter",
+    "from swiss_cv_generator.utils.validators import StatisticsValidator",
+    "from swiss_cv_generator.utils.sinks import CSVSink, NDJSONSink, ParquetSink",
+])
+def test_no_heavy_imports(statement):
+    """Test dass pandas/NumPy/openpyxl/pyarrow nicht beim Import geladen werden"""
+    assert _loaded_heavy_modules(statement) == []
+
+
+def test_lazy_attributes():
+    """Test dass öffentliche Namen weiterhin über das Paket erreichbar sind"""
+    import swiss_cv_generator
+
+    assert swiss_cv_generator.CVBatch.__name__ == "CVBatch"
+    assert "BatchGenerator" in dir(swiss_cv_generator)
+    with pytest.raises(AttributeError):
+        swiss_cv_generator.DoesNotExist